@@ -0,0 +1,321 @@
+"""Isolated benchmarks for the two halves of a strategy: pegging alone and discarding alone.
+
+``play_pegging_hands`` replays identical seeded deals through the pegging of a single round,
+once from each seat, with both players discarding the same way. ``compare_discards`` asks both
+players to discard from the same seeded 6 card deals and scores each choice exactly over every
+starter and every opponent crib pair, so no starter luck is left in the comparison. Both run
+over a process pool like ``utils.play_multiple_games_parallel`` and return plain results.
+``discard_regret`` measures any number of discard strategies against the best discard, over
+every deal or a sample stratified by suit pattern.
+"""
+import itertools
+import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from math import comb, prod
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from cribbage.cribbagegame import CribbageGame
+from cribbage.cribbageround import CribbageRound
+from cribbage.database import canonicalize_codes, iter_canonical_classes
+from cribbage.discard_table import (DISCARD_OPTIONS, N_CRIBS, N_DEALT, N_STARTERS, compute_discard_rows,
+                                    discard_options, get_discard_table)
+from cribbage.players.base_player import BasePlayer
+from cribbage.playingcards import Card, Deck
+from cribbage.seeding import game_seed, round_seeds
+from cribbage.strategies.crib_strategies import basic_crib_strategy
+from cribbage.utils import _map_chunks, mean_ci, summarize_duplicate_match
+
+logger = logging.getLogger(__name__)
+
+
+# ===== Pegging only =====
+
+class PeggingOnlyPlayer(BasePlayer):
+    """Pegs like ``player`` but discards with a fixed ``discard_strategy``."""
+
+    def __init__(self, player, discard_strategy: Callable = basic_crib_strategy):
+        super().__init__(name=player.name)
+        self.player = player
+        self.discard_strategy = discard_strategy
+
+    def reset_for_game(self, seed=None):
+        self.player = self.player.fork(seed=seed)
+
+    def select_crib_cards(self, hand, dealer_is_self, your_score=None, opponent_score=None):
+        return self.discard_strategy(hand, dealer_is_self)
+
+    def observe_deal(self, hand, discards):
+        self.player.observe_deal(hand, discards)
+
+    def observe_starter(self, starter):
+        self.player.observe_starter(starter)
+
+    def observe_play(self, player_name, card, count):
+        self.player.observe_play(player_name, card, count)
+
+    def select_card_to_play(self, hand, table, count, crib=None):
+        return self.player.select_card_to_play(hand=hand, table=table, count=count, crib=crib)
+
+
+def play_pegging_hand(p0, p1, hand_seed, discard_strategy: Optional[Callable] = basic_crib_strategy) -> int:
+    """Play the first round of a game seeded with ``hand_seed``, p0 dealing, up to the end of pegging.
+
+    ``discard_strategy`` discards for both players, so the cards they peg with only depend on
+    the deal; pass None to let each player discard for itself.
+    :return: p0's pegging points minus p1's.
+    """
+    if discard_strategy is not None:
+        p0, p1 = PeggingOnlyPlayer(p0, discard_strategy), PeggingOnlyPlayer(p1, discard_strategy)
+    game = CribbageGame(players=[p0, p1], seed=hand_seed, record_history=False)
+    deck_seed, cut_seed = round_seeds(hand_seed, 0)
+    cribbage_round = CribbageRound(game, dealer=game.players[0], seed=deck_seed, cut_seed=cut_seed, record_history=False)
+    cribbage_round.play()
+    s0, s1 = cribbage_round.history.score_after_pegging
+    return s0 - s1
+
+
+def play_pegging_pair(p0, p1, hand_index, seed, discard_strategy: Optional[Callable] = basic_crib_strategy) -> Tuple[int, int]:
+    """Play deal ``hand_index`` with each player dealing once; p0's pegging diff in both."""
+    hand_seed = game_seed(seed, hand_index)
+    return (play_pegging_hand(p0, p1, hand_seed, discard_strategy),
+            -play_pegging_hand(p1, p0, hand_seed, discard_strategy))
+
+
+def _play_pegging_pairs(p0, p1, start, stop, seed, discard_strategy=basic_crib_strategy):
+    return [play_pegging_pair(p0, p1, i, seed, discard_strategy) for i in range(start, stop)]
+
+
+class _PeggingPairsWorker:
+    # picklable stand-in for functools.partial(_play_pegging_pairs, discard_strategy=...)
+    def __init__(self, discard_strategy):
+        self.discard_strategy = discard_strategy
+
+    def __call__(self, p0, p1, start, stop, seed):
+        return _play_pegging_pairs(p0, p1, start, stop, seed, self.discard_strategy)
+
+
+def play_pegging_hands(num_hands, p0, p1, seed=None, discard_strategy: Optional[Callable] = basic_crib_strategy,
+                       max_workers=1, chunk_size=None, first_hand=0) -> dict:
+    """Pegging-only duplicate match over ``num_hands`` seeded deals.
+
+    Each deal is pegged twice with the dealer swapped, so the results are those of
+    ``utils.summarize_duplicate_match`` with pegging points in place of game scores.
+    Unseeded runs draw a batch seed and report it under ``seed``.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    pairs = _map_chunks(_PeggingPairsWorker(discard_strategy), num_hands, p0, p1, seed, max_workers, chunk_size, first_hand)
+    return summarize_duplicate_match(pairs, seed=seed)
+
+
+# ===== Discard only =====
+
+class DiscardComparison(NamedTuple):
+    """Both players' discards from one deal and their exact expected points.
+
+    ``expected`` is E[hand] + E[crib] for the dealer and E[hand] - E[crib] otherwise,
+    averaged over every starter and every pair the opponent could put in the crib.
+    """
+    dealt: Tuple[Card, ...]
+    dealer_is_self: bool
+    discards: Tuple[Tuple[Card, Card], Tuple[Card, Card]]
+    expected: Tuple[float, float]
+
+    @property
+    def diff(self) -> float:
+        return self.expected[0] - self.expected[1]
+
+    @property
+    def differs(self) -> bool:
+        return set(self.discards[0]) != set(self.discards[1])
+
+
+def compare_discard_hand(p0, p1, hand_index, seed) -> DiscardComparison:
+    """Deal 6 cards for ``hand_index`` and score both players' discards exactly.
+
+    Even hands are dealt to the dealer and odd hands to the pone.
+    """
+    deck = Deck(seed=game_seed(seed, hand_index))
+    dealt = tuple(deck.draw() for _ in range(6))
+    dealer_is_self = hand_index % 2 == 0
+    expected_by_discards = {frozenset(option.discards): option.expected_total(dealer_is_self)
+                            for option in discard_options(dealt)}
+    discards = tuple(tuple(p.select_crib_cards(list(dealt), dealer_is_self=dealer_is_self)) for p in (p0, p1))
+    expected = tuple(expected_by_discards[frozenset(d)] for d in discards)
+    return DiscardComparison(dealt, dealer_is_self, discards, expected)
+
+
+def _compare_discard_hands(p0, p1, start, stop, seed):
+    return [compare_discard_hand(p0, p1, i, seed) for i in range(start, stop)]
+
+
+def summarize_discard_comparisons(hands: List[DiscardComparison], seed=None) -> dict:
+    """Mean expected-point advantage of p0's discards, overall and on the deals where they differ."""
+    diffs = [hand.diff for hand in hands]
+    differing = [hand.diff for hand in hands if hand.differs]
+    mean_diff, diff_lo, diff_hi = mean_ci(diffs)
+    differing_mean, differing_lo, differing_hi = mean_ci(differing)
+    return {"seed": seed, "hands": hands, "diffs": diffs, "total_diff": float(sum(diffs)),
+            "mean_diff": mean_diff, "diff_ci_lo": diff_lo, "diff_ci_hi": diff_hi,
+            "differing": len(differing), "differing_mean_diff": differing_mean,
+            "differing_ci_lo": differing_lo, "differing_ci_hi": differing_hi}
+
+
+def compare_discards(num_hands, p0, p1, seed=None, max_workers=1, chunk_size=None, first_hand=0) -> dict:
+    """Discard-only comparison of two players over ``num_hands`` seeded deals.
+
+    Both players discard from the same deal and each choice is scored with the exact
+    ``discard_options`` statistics, so the diffs have no starter or crib luck in them.
+    Unseeded runs draw a batch seed and report it under ``seed``.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    hands = _map_chunks(_compare_discard_hands, num_hands, p0, p1, seed, max_workers, chunk_size, first_hand)
+    return summarize_discard_comparisons(hands, seed=seed)
+
+
+# ===== Discard regret =====
+
+class DiscardEvaluation(NamedTuple):
+    """Exact expected points of each strategy's discard from one deal, and of the best discard."""
+    dealt: Tuple[Card, ...]
+    dealer_is_self: bool
+    best: float
+    discards: Dict[str, Tuple[Card, Card]]
+    expected: Dict[str, float]
+
+    def regret(self, name: str) -> float:
+        return self.best - self.expected[name]
+
+
+def evaluate_discards(hand, strategies: Dict[str, Callable], dealer_is_self: bool) -> DiscardEvaluation:
+    """Score every strategy's discard from a 6 card deal over all 46 starters and opponent cribs.
+
+    ``strategies`` maps names to ``strategy(hand, dealer_is_self)`` discard functions, such as
+    ``basic_crib_strategy`` or a player's ``select_crib_cards``.
+    """
+    expected_by_discards = {frozenset(option.discards): option.expected_total(dealer_is_self)
+                            for option in discard_options(hand)}
+    discards = {name: tuple(strategy(list(hand), dealer_is_self)) for name, strategy in strategies.items()}
+    return DiscardEvaluation(tuple(hand), dealer_is_self, max(expected_by_discards.values()), discards,
+                             {name: expected_by_discards[frozenset(d)] for name, d in discards.items()})
+
+
+def _suit_pattern(codes) -> Tuple[int, ...]:
+    counts = Counter(c // 13 for c in codes)
+    return tuple(sorted((counts[suit] for suit in range(4)), reverse=True))
+
+
+def suit_pattern_probabilities() -> Dict[Tuple[int, ...], float]:
+    """Probability of each suit pattern (cards per suit, most first) of a random 6 card deal."""
+    ways = Counter()
+    for counts in itertools.product(range(N_DEALT + 1), repeat=4):
+        if sum(counts) == N_DEALT:
+            ways[tuple(sorted(counts, reverse=True))] += prod(comb(13, c) for c in counts)
+    total = comb(52, N_DEALT)
+    return {pattern: n / total for pattern, n in sorted(ways.items(), reverse=True)}
+
+
+def stratified_deals(num_deals: int, seed=0) -> List[Tuple[Tuple[int, ...], Tuple[int, ...], int]]:
+    """Random canonical deals in every suit pattern, about in proportion to the pattern's probability.
+
+    Every pattern gets at least one deal, so rare ones (six of a suit) are never missed.
+    :return: (canonical codes, suit pattern, number of deals drawn in the pattern) per deal
+    """
+    probabilities = suit_pattern_probabilities()
+    quotas = {pattern: max(1, round(num_deals * p)) for pattern, p in probabilities.items()}
+    rng = np.random.default_rng(seed)
+    drawn = {pattern: [] for pattern in probabilities}
+    missing = sum(quotas.values())
+    while missing:
+        codes = rng.choice(52, N_DEALT, replace=False).tolist()
+        pattern = _suit_pattern(codes)
+        if len(drawn[pattern]) < quotas[pattern]:
+            drawn[pattern].append(canonicalize_codes(codes)[0])
+            missing -= 1
+    return [(codes, pattern, quotas[pattern]) for pattern in probabilities for codes in drawn[pattern]]
+
+
+def _option_totals(deals: np.ndarray) -> np.ndarray:
+    """(B, 15, 2) expected points of each discard from canonical deals, as pone and as dealer."""
+    table = get_discard_table()
+    rows = [table.row(codes) if table is not None else None for codes in deals]
+    missing = [i for i, row in enumerate(rows) if row is None]
+    if missing:
+        for i, row in zip(missing, compute_discard_rows(deals[missing])):
+            rows[i] = row
+    rows = np.stack(rows)
+    avg_hand = rows["hand_sum"] / N_STARTERS
+    avg_crib = rows["crib_sum"] / N_CRIBS
+    return np.stack([avg_hand - avg_crib, avg_hand + avg_crib], axis=-1)
+
+
+def _discard_regrets(strategies: Dict[str, Callable], deals) -> np.ndarray:
+    """(B, 2, strategies) regret of each strategy on each canonical deal, as pone and as dealer."""
+    deals = np.asarray(deals, dtype=np.int16).reshape(-1, N_DEALT)
+    totals = _option_totals(deals)
+    option_index = {frozenset(pair): k for k, pair in enumerate(DISCARD_OPTIONS)}
+    regrets = np.empty((len(deals), 2, len(strategies)))
+    for b, codes in enumerate(deals.tolist()):
+        hand = [Card.from_index(c) for c in codes]
+        position = {c: i for i, c in enumerate(codes)}
+        for seat, dealer_is_self in enumerate((False, True)):
+            best = totals[b, :, seat].max()
+            for s, strategy in enumerate(strategies.values()):
+                discards = strategy(list(hand), dealer_is_self)
+                k = option_index[frozenset(position[c.to_index()] for c in discards)]
+                regrets[b, seat, s] = best - totals[b, k, seat]
+    return regrets
+
+
+def discard_regret(strategies: Dict[str, Callable], num_deals: Optional[int] = 2000, seed=0,
+                   max_workers: Optional[int] = 1, chunk_size: int = 200) -> dict:
+    """Mean exact regret of each discard strategy against the best discard of every deal.
+
+    Regret is the expected points (hand plus or minus crib over every starter and opponent
+    crib) the strategy's discard gives up to the best of the 15. Deals are suit classes, so a
+    strategy's discards should not depend on which suit is which. ``num_deals=None`` sweeps
+    all 962,988 classes weighted by class size; otherwise ``stratified_deals`` draws a sample
+    and the estimate comes with a standard error. Dealer and pone count equally.
+    :return: {"deals", "seed", "strategies": {name: {"regret", "regret_se", "dealer_regret",
+        "pone_regret", "optimal"}}}, regrets in points per hand and ``optimal`` the share of
+        decisions with no regret.
+    """
+    if num_deals is None:
+        classes = list(iter_canonical_classes(N_DEALT))
+        deals = [codes for codes, _ in classes]
+        weights = np.array([size for _, size in classes], dtype=float) / comb(52, N_DEALT)
+        strata = None
+    else:
+        sample = stratified_deals(num_deals, seed=seed)
+        probabilities = suit_pattern_probabilities()
+        deals = [codes for codes, _, _ in sample]
+        weights = np.array([probabilities[pattern] / n for _, pattern, n in sample])
+        strata = [pattern for _, pattern, _ in sample]
+    chunks = [deals[i:i + chunk_size] for i in range(0, len(deals), chunk_size)]
+    if max_workers == 1:
+        results = [_discard_regrets(strategies, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_discard_regrets, itertools.repeat(strategies), chunks))
+    regrets = np.concatenate(results)  # (deals, pone/dealer, strategies)
+    logger.info(f"Evaluated {len(strategies)} discard strategies on {len(deals)} deals")
+
+    summary = {}
+    for s, name in enumerate(strategies):
+        per_deal = regrets[:, :, s].mean(axis=1)
+        variance = 0.0
+        if strata is not None:
+            for pattern in set(strata):
+                in_stratum = np.array([p == pattern for p in strata])
+                if in_stratum.sum() > 1:
+                    p_stratum = weights[in_stratum].sum()
+                    variance += p_stratum ** 2 * per_deal[in_stratum].var(ddof=1) / in_stratum.sum()
+        summary[name] = {"regret": float(weights @ per_deal), "regret_se": float(np.sqrt(variance)),
+                         "dealer_regret": float(weights @ regrets[:, 1, s]),
+                         "pone_regret": float(weights @ regrets[:, 0, s]),
+                         "optimal": float(weights @ (regrets[:, :, s] < 1e-9).mean(axis=1))}
+    return {"deals": len(deals), "seed": seed if num_deals is not None else None, "strategies": summary}
@@ -6,4 +6,13 @@ load_dotenv(override=True)
 DB_PATH = os.getenv("DB_PATH", "C:/Users/johnm/ccode/crib_engine/crib_cache.db")
 
 if DB_PATH is None:
-    raise ValueError("db path not specified. Needed for hard player")
\ No newline at end of file
+    raise ValueError("db path not specified. Needed for hard player")
+
+# binary table of every 4 card hand + starter score, built by scripts/build_score_table.py
+SCORE_TABLE_PATH = os.getenv("SCORE_TABLE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "five_card_scores.bin"))
+
+# binary table of exact discard statistics for every 6 card deal class, built by scripts/build_discard_table.py
+DISCARD_TABLE_PATH = os.getenv("DISCARD_TABLE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "discard_stats.bin"))
+
+# binary table of win probabilities by score, built by scripts/build_win_table.py
+WIN_TABLE_PATH = os.getenv("WIN_TABLE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "win_probabilities.bin"))
@@ -1,13 +1,12 @@
 """Cribbage game."""
 
-from copy import deepcopy
 import random
 import logging
 from shutil import copy
 
 from cribbage.board import CribbageBoard
 from cribbage.state import GameState, RoundState
-from . import scoring
+from . import scoring, seeding
 from cribbage.scoring import score_hand, score_play
 from .players.base_player import HumanPlayer
 from .players.random_player import RandomPlayer
@@ -32,26 +31,31 @@ class CribbageGame:
     CRIB_SIZE = 4  # size of the crib
     N_GO = 31  # round sequence ends at this card point total
 
-    def __init__(self, players, seed: int | None = None, copy_players: bool = True, dealer=None):
+    def __init__(self, players, seed: int | None = None, copy_players: bool = True, dealer=None,
+                 record_history: bool = True):
         # self.players = players  #: the two players
+        # the schedule, each seat's player and every round's deck and cut get their own stream of the seed
+        player_seeds = seeding.player_seeds(seed, len(players)) if seed is not None else [None] * len(players)
         if copy_players:
-            self.players = [deepcopy(p) for p in players]
+            # forks share read-only caches; only per-game state is rebuilt
+            self.players = [p.fork(seed=s) for p, s in zip(players, player_seeds)]
         else:
             self.players = players
+            for p, s in zip(self.players, player_seeds):
+                p.reset_for_game(seed=s)
         assert self.players[0].name != self.players[1].name, "Players must have unique names." # todo: need to improve
         self.players_dict = {self.players[0].name: self.players[0], self.players[1].name: self.players[1]}
         self.board = CribbageBoard(self.players, self.MAX_SCORE)  #: the cribbage board for scoring
         self.seed = seed
-        self._rng = random.Random(seed)    
-        # self._rng = random.Random(self.seed)
+        self._rng = random.Random(seeding.schedule_seed(seed) if seed is not None else None)
         assert len(players) == 2, "Currently, only 2-player games are supported."
-        for p in self.players:
-            if isinstance(p, RandomPlayer):
-                p.reset_rng()
         self.game_state = GameState(self.players, seed=seed)
         self.round_scores = []
         self.history = []
         self.round_seed = None
+        self._round_deck = None  # reset and reused by every round after the first
+        # False skips play records and round history; scores and winners are unchanged
+        self.record_history = record_history
 
     def _alternate_players(self, start_idx=0):
         """Generator to alternate which player dealers, with an arbitrary starting player.
@@ -72,34 +76,37 @@ class CribbageGame:
         """        
         game_score = [0 for _ in self.players]
         while max(game_score) < self.MAX_SCORE:            
-            self.round_seed = self._rng.randint(0, 2**32 - 1) if self.seed is not None else None
-            game_score = self.play_round(game_score, seed=self.round_seed)        
+            game_score = self.play_round(game_score)        
         return game_score # list of player 1's final peg vs player 2's final peg
 
     def play_round(self, game_score=None, seed=None):
+        """Play one round; ``seed`` overrides the round's deck and cut seeds from the game seed."""
         if game_score is None:
             game_score = self.round_scores[-1] if self.round_scores else [0 for _ in self.players]
+        starting_player = self._rng.choice([0, 1])
         if seed is not None:
-            round_seed = seed
-        if self.round_seed is not None:
-            round_seed = self.round_seed
+            deck_seed = cut_seed = seed
+        elif self.seed is not None:
+            deck_seed, cut_seed = seeding.round_seeds(self.seed, len(self.round_scores))
         else:
-            round_seed = None
-        starting_player = self._rng.choice([0, 1])
-        seed = self._rng.randint(0, 2**32 - 1) if self.seed is not None else None
+            deck_seed = cut_seed = None
+        self.round_seed = deck_seed
         player_gen = self._alternate_players(starting_player)        
         dealer = next(player_gen)
-        r = CribbageRound(self, dealer=dealer, seed=seed)
+        r = CribbageRound(self, dealer=dealer, seed=deck_seed, deck=self._round_deck, record_history=self.record_history,
+                          cut_seed=cut_seed)
+        self._round_deck = r.deck
         r.play()
         game_score = [self.board.get_score(p) for p in self.players]
         if game_score == [121,121]:
             message = "tie should not be possible"
             logger.error(message)
             raise ValueError(message)
-        logger.debug(f"{game_score=}")
+        logger.debug("game_score=%s", game_score)
         logger.debug(self.board)
         self.round_scores.append(game_score)
-        self.history.append(r)
+        if self.record_history:
+            self.history.append(r)
         return game_score # list of player 1's final peg vs player 2's final peg
 
 
@@ -68,23 +68,36 @@ class CribbageRound:
     """Individual round of cribbage."""
 
     # def __init__(self, game, dealer, seed: int | None = None):
-    def __init__(self, game, dealer, seed: int | None = None):
-        # Replenish deck for each round
-        self._rng_round = random.Random(seed)
-        self.deck = Deck(seed=seed)
+    def __init__(self, game, dealer, seed: int | None = None, deck: Deck | None = None, record_history: bool = True,
+                 cut_seed: int | None = None):
+        # Replenish deck for each round, reusing the storage of a previous round's deck if given.
+        # The cuts use their own stream when cut_seed is given, otherwise the deck seed.
+        self._rng_round = random.Random(seed if cut_seed is None else cut_seed)
+        if deck is None:
+            deck = Deck(seed=seed)
+        else:
+            deck.reset(seed)
+        self.deck = deck
         self.game_winner = None
         self.game = game
         self.hands = {self.game.players[0].name: [], self.game.players[1].name: []}
         self.player_hand_after_discard = {self.game.players[0].name: [], self.game.players[1].name: []}
         self.crib = []
         self.table = [] # all cards that have been played over each "up to 31" thing
+        self.pegging_sequence = scoring.PeggingSequence()  # scores the active "up to 31" sequence
+        self.sequence_start_idx = 0  # table index where the active sequence begins
+        self._table_total = 0  # value of every card on the table
+        self._min_card_value = {}  # value of each player's cheapest card in hand, inf when empty
+        self._cards_in_hands = 0
         self.starter = None
         self.dealer = dealer
         self.nondealer = [p for p in self.game.players if p.name != dealer.name][0]
         self.most_recent_player = None        
-        self.round_state = RoundState(self.game, dealer=dealer, seed=seed)
+        self.round_state = RoundState(self.game, dealer=dealer, seed=seed, deck=self.deck)
         self.play_record = []
         self.history = RoundHistory()
+        # lean mode: skip PlayRecords and the stringified history, only scores are tracked
+        self.record_history = record_history
 
     def __str__(self) -> str:
         return str(self.history)
@@ -99,17 +112,8 @@ class CribbageRound:
         :param sequence_start_idx: Start index of current sequence for table tracking
         :return: Winner if game is won, None otherwise
         """
-        self.play_record.append(
-            PlayRecord(
-                description=f"{player.name}: {description}",
-                full_table=self.table[:],
-                active_table=self.table[sequence_start_idx:],
-                table_count=self.get_table_value(sequence_start_idx),
-                player_name=player.name,
-                card=card,
-                hand=self.hands.get(player.name, [])[:] if self.hands.get(player.name) else None
-            )
-        )
+        if self.record_history:
+            self._record_non_scoring_event(player, description, card=card, sequence_start_idx=sequence_start_idx)
         return self.game.board.peg(player, points)
 
     def _record_non_scoring_event(self, player, description: str, card=None, sequence_start_idx=0):
@@ -161,17 +165,18 @@ class CribbageRound:
             other_player_name = [next(name for name in player_scores_dict.keys() if name != player.name)]
             opponent_score = player_scores_dict[other_player_name[0]]
             cards_to_crib = player.select_crib_cards(hand=self.hands[pi], dealer_is_self=(player == self.dealer), your_score=player_score, opponent_score=opponent_score)
-            logger.debug(f"{player.name} cribs: {cards_to_crib} when dealt hand {self.hands[pi]}")
+            logger.debug("%s cribs: %s when dealt hand %s", player.name, cards_to_crib, self.hands[pi])
             if not set(cards_to_crib).issubset(set(self.hands[pi])):
                 raise IllegalCardChoiceError("Crib cards selected are not part of player's hand.")
             elif len(cards_to_crib) != 2:
                 raise IllegalCardChoiceError("Wrong number of cards sent to crib.")
             else:
+                player.observe_deal(list(self.hands[pi]), tuple(cards_to_crib))
                 self.crib += cards_to_crib
                 for card in cards_to_crib:
                     self.hands[pi].remove(card)
                 self.player_hand_after_discard[pi] = self.hands[pi][:]
-                logger.debug(f"{player.name} has hand {self.hands[pi]} after cribbing.")
+                logger.debug("%s has hand %s after cribbing.", player.name, self.hands[pi])
         assert len(self.crib) == self.game.CRIB_SIZE, "Crib size is not %s" % self.game.CRIB_SIZE
 
     def table_to_str(self, sequence_start_idx):
@@ -203,9 +208,33 @@ class CribbageRound:
         :param sequence_start_idx: Table index where current sequence begins.
         :return: Total value of cards in active sequence.
         """
+        # the active sequence and the whole table are kept as running counts
+        if sequence_start_idx == self.sequence_start_idx:
+            return self.pegging_sequence.count
+        if sequence_start_idx == 0:
+            return self._table_total
         return_val = sum(i.get_value() for i in self.table[sequence_start_idx:]) if self.table else 0
         return return_val
 
+    def can_play(self, player):
+        """Whether ``player`` holds a card that fits under 31 in the active sequence."""
+        return self._min_card_value[player.name] + self.pegging_sequence.count <= 31
+
+    def _start_sequence(self):
+        """Begin a new "up to 31" sequence after the cards already on the table."""
+        self.sequence_start_idx = len(self.table)
+        self.pegging_sequence.reset()
+
+    def _start_pegging(self):
+        self._table_total = sum(c.get_value() for c in self.table)
+        self._cards_in_hands = sum(len(hand) for hand in self.hands.values())
+        for name in self.hands:
+            self._update_min_card_value(name)
+
+    def _update_min_card_value(self, name):
+        hand = self.hands[name]
+        self._min_card_value[name] = min(c.get_value() for c in hand) if hand else float("inf")
+
     def setup_deal_phase(self):
         """Phase 1: Cut and deal cards to players.
         
@@ -215,7 +244,8 @@ class CribbageRound:
         self._deal()
         logger.debug(self.hands)
         self.history.dealer = self.dealer.name
-        self.history.cards_dealt = {p.name: [str(card) for card in self.hands[p.name]] for p in self.game.players}
+        if self.record_history:
+            self.history.cards_dealt = {p.name: [str(card) for card in self.hands[p.name]] for p in self.game.players}
 
     def setup_crib_phase(self):
         """Phase 2: Populate crib and draw starter.
@@ -223,7 +253,8 @@ class CribbageRound:
         Separated for composability - can be called independently by API wrapper.
         """
         self._populate_crib()
-        self.history.crib = [str(card) for card in self.crib]
+        if self.record_history:
+            self.history.crib = [str(card) for card in self.crib]
         self.history.score_at_start_of_round = [self.game.board.get_score(p) for p in self.game.players]
         self._cut()
         # Only draw starter if not already set (allows mocking for tests)
@@ -239,8 +270,9 @@ class CribbageRound:
             self.game_winner = self._record_and_peg(self.dealer, 2, "Nibs for 2", card=self.starter, sequence_start_idx=0)
             if self.game_winner is not None:
                 return self.game_winner
-            logger.debug("2 points to %s for his heels." % str(self.dealer))
-        self.history.starter = str(self.starter)
+            logger.debug("2 points to %s for his heels.", self.dealer)
+        if self.record_history:
+            self.history.starter = str(self.starter)
         return None
 
     def set_up_round_and_deal_cards(self):
@@ -255,59 +287,73 @@ class CribbageRound:
     def play(self):
         """Start cribbage round."""
         loser = None
+        log_debug = logger.isEnabledFor(logging.DEBUG)
         self.setup_deal_phase()
         self.setup_crib_phase()
-        logger.debug("Starter card is %s." % str(self.starter))
+        logger.debug("Starter card is %s.", self.starter)
+        for p in self.game.players:
+            p.observe_starter(self.starter)
         winner = self.setup_starter_scoring()
         if winner is not None:
             return
         active_players = [self.nondealer, self.dealer]
         players_said_go = []
-        any_player_has_at_least_1_card = any(len(hand) > 0 for hand in self.hands.values())
-        while any_player_has_at_least_1_card and self.game_winner is None:
-            sequence_start_idx = len(self.table)
-            while any_player_has_at_least_1_card and self.game_winner is None:
+        self._start_pegging()
+        while self._cards_in_hands and self.game_winner is None:
+            self._start_sequence()
+            while self._cards_in_hands and self.game_winner is None:
                 # Create a copy to iterate over, since we modify active_players during iteration
                 players_to_check = list(active_players)
                 for player in players_to_check:
                     if player in players_said_go:
-                        logger.debug(f"Player {player.name} has already said go, skipping.")
+                        logger.debug("Player %s has already said go, skipping.", player.name)
                         continue  
-                    logger.debug(f"score is {[self.game.board.get_score(p) for p in self.game.players]}")
-                    logger.debug(f"Player {player.name}'s turn to play.")
-                    logger.debug(f"active table cards {self.table[sequence_start_idx:]}")
-                    count = self.get_table_value(sequence_start_idx)                                           
-                    card = player.select_card_to_play(hand=self.hands[player.name], table=self.table[sequence_start_idx:],
-                                                 count=count, crib=self.crib)  
+                    if log_debug:
+                        logger.debug(f"score is {[self.game.board.get_score(p) for p in self.game.players]}")
+                        logger.debug(f"Player {player.name}'s turn to play.")
+                        logger.debug(f"active table cards {self.table[self.sequence_start_idx:]}")
+                    count = self.pegging_sequence.count
+                    # a player without a card that fits has to say go, no need to ask
+                    card = None
+                    if self.can_play(player):
+                        card = player.select_card_to_play(hand=self.hands[player.name], table=self.table[self.sequence_start_idx:],
+                                                     count=count, crib=self.crib)  
                     if card is None or card.get_value() + count > 31:
-                        logger.debug("Player %s chooses go." % str(player))
-                        self._record_non_scoring_event(player, "Go", card=None, sequence_start_idx=sequence_start_idx)
+                        logger.debug("Player %s chooses go.", player)
+                        if self.record_history:
+                            self._record_non_scoring_event(player, "Go", card=None, sequence_start_idx=self.sequence_start_idx)
                         loser = loser if loser else player                        
                         players_said_go.append(player)
+                        for p in self.game.players:
+                            p.observe_play(player.name, None, count)
                     else:
                         # Record the card play (non-scoring event)
-                        self._record_non_scoring_event(player, f"Plays {str(card)}", card=card, sequence_start_idx=sequence_start_idx)
+                        if self.record_history:
+                            self._record_non_scoring_event(player, f"Plays {str(card)}", card=card, sequence_start_idx=self.sequence_start_idx)
                         self.table.append(card)
-                        logger.debug(f"Player {player.name} selected card {card} at count {count} to {self.get_table_value(sequence_start_idx)}")
+                        self._table_total += card.get_value()
+                        score, description = self.pegging_sequence.push(card)
+                        logger.debug("Player %s selected card %s at count %d to %d", player.name, card, count, self.pegging_sequence.count)
                         
                         # Check for 31
-                        if self.get_table_value(sequence_start_idx) == 31:
-                            winner = self._record_and_peg(player, 1, "31 for 1", card=None, sequence_start_idx=sequence_start_idx)
+                        if self.pegging_sequence.count == 31:
+                            winner = self._record_and_peg(player, 1, "31 for 1", card=None, sequence_start_idx=self.sequence_start_idx)
                             if winner is not None:
                                 self.game_winner = winner
                                 return
                         
                         self.most_recent_player = player
                         self.hands[player.name].remove(card)
+                        self._cards_in_hands -= 1
+                        self._update_min_card_value(player.name)
+                        for p in self.game.players:
+                            p.observe_play(player.name, card, count)
                         # Consider cards played by both players when scoring during play
-                        assert self.get_table_value(sequence_start_idx) <= 31, \
+                        assert self.pegging_sequence.count <= 31, \
                             "Value of cards on table must be <= 31 to be eligible for scoring."
-                        # only scores the latest play, need to test
-                        sequence = self.table[sequence_start_idx:]
-                        # score play handles the 31 case and returns (score, description)
-                        score, description = self._score_play(sequence)
+                        # score of the latest play, from pushing it onto the pegging sequence
                         if score:
-                            winner = self._record_and_peg(player, score, description, card=None, sequence_start_idx=sequence_start_idx)
+                            winner = self._record_and_peg(player, score, description, card=None, sequence_start_idx=self.sequence_start_idx)
                             if winner is not None:
                                 self.game_winner = winner
                                 return
@@ -316,11 +362,10 @@ class CribbageRound:
                         if len(players_said_go) == 2:
                             # Everyone has said go                        
                             logger.debug("All players have said go or reached 31.")  
-                            players_to_check = self.go_or_31_reached(players_said_go, self.table[sequence_start_idx:])
+                            players_to_check = self.go_or_31_reached(players_said_go, self.table[self.sequence_start_idx:])
                             players_said_go = []
-                            sequence_start_idx = len(self.table)
-                        any_player_has_at_least_1_card = any(len(hand) > 0 for hand in self.hands.values())
-                        if not any_player_has_at_least_1_card:                            
+                            self._start_sequence()
+                        if not self._cards_in_hands:                            
                             self.game_winner = self._record_and_peg(player, 1, "Last card for 1", card=None, sequence_start_idx=0)
                             self.history.score_after_pegging = [self.game.board.get_score(p) for p in self.game.players]
                             break
@@ -337,11 +382,11 @@ class CribbageRound:
         """Score non-dealer's hand. Returns winner if this wins the game, None otherwise."""
         if self.game_winner is None:
             # Non-dealer counts first
-            logger.debug(f"Scoring non-dealer {self.nondealer.name} hand: {self.player_hand_after_discard.get(self.nondealer.name, 'NOT FOUND')}")
+            logger.debug("Scoring non-dealer %s hand: %s", self.nondealer.name, self.player_hand_after_discard.get(self.nondealer.name, 'NOT FOUND'))
             p_cards_played = self.player_hand_after_discard[self.nondealer.name] + [self.starter]
             score = self._score_hand(cards=self.player_hand_after_discard[self.nondealer.name] + [self.starter], is_crib=False)
             self.history.hand_scores[self.nondealer.name] = score
-            logger.debug(f"Non-dealer {self.nondealer.name} scored {score} points")
+            logger.debug("Non-dealer %s scored %d points", self.nondealer.name, score)
             if score:
                 winner = self.game.board.peg(self.nondealer, score)
                 if winner is not None:
@@ -354,11 +399,11 @@ class CribbageRound:
         """Score dealer's hand. Returns winner if this wins the game, None otherwise."""
         # Dealer counts second (if game not yet won)
         if self.game_winner is None:
-            logger.debug(f"Scoring dealer {self.dealer.name} hand: {self.player_hand_after_discard.get(self.dealer.name, 'NOT FOUND')}")
+            logger.debug("Scoring dealer %s hand: %s", self.dealer.name, self.player_hand_after_discard.get(self.dealer.name, 'NOT FOUND'))
             p_cards_played = self.player_hand_after_discard[self.dealer.name] + [self.starter]
             score = self._score_hand(cards=self.player_hand_after_discard[self.dealer.name] + [self.starter], is_crib=False)
             self.history.hand_scores[self.dealer.name] = score
-            logger.debug(f"Dealer {self.dealer.name} scored {score} points")
+            logger.debug("Dealer %s scored %d points", self.dealer.name, score)
             if score:
                 winner = self.game.board.peg(self.dealer, score)
                 if winner is not None:
@@ -371,7 +416,7 @@ class CribbageRound:
         """Score the crib. Returns winner if this wins the game, None otherwise."""
         # Score the crib (if game not yet won)
         if self.game_winner is None:
-            logger.debug("Scoring the crib: " + str(self.crib + [self.starter]))
+            logger.debug("Scoring the crib: %s", self.crib + [self.starter])
             score = self._score_hand(cards=(self.crib + [self.starter]), is_crib=True)
             self.history.crib_score = score  # Include starter card as part of crib
             if score:
@@ -395,9 +440,9 @@ class CribbageRound:
         # players_said_go is a list of players ordered by who said go first
         # function is called when all players had said go
         # last player to say go gets 1 point
-        logger.debug(f"In go or 31 {len(players_said_go)}")
+        logger.debug("In go or 31 %d", len(players_said_go))
         self.game_winner = self._record_and_peg(players_said_go[-1], 1, "Go for 1", card=None, sequence_start_idx=0)
-        logger.debug(f"score is {[self.game.board.get_score(p) for p in self.game.players]}")
+        logger.debug("score is %s", self.game.board.get_scores())
         return players_said_go
 
     def go_or_31_reached_old(self, active_players):
@@ -1,8 +1,15 @@
+from math import factorial
+from collections import Counter
+from typing import Iterator, List, Sequence, Tuple
+
 from cribbage.playingcards import Card
 
 RANK_ORDER = {r: i for i, r in enumerate("A23456789TJQK")}
 SUIT_ORDER = {s: i for i, s in enumerate("CDHS")}
 
+N_RANKS = 13
+N_SUITS = 4
+
 def card_to_code(card):
     rank = card.rank.upper()
     if rank == "10":
@@ -19,4 +26,103 @@ def normalize_hand_to_str(cards):
 def normalize_hand_to_tuple(cards):
     codes = [card_to_code(c) for c in cards]
     codes.sort(key=lambda c: (RANK_ORDER[c[0]], SUIT_ORDER[c[1]]))
-    return tuple(codes)
\ No newline at end of file
+    return tuple(codes)
+
+
+# ===== Suit isomorphism =====
+# Scores only depend on whether suits are equal, never on which suit it is, so any
+# relabelling of the suits scores the same. Each suit is described by the bitmask of the
+# ranks it holds; sorting the suits by (number of cards, mask) and relabelling them 0-3 in
+# that order gives one canonical representative per equivalence class. Suits with the
+# same mask can be swapped freely, so ties do not change the canonical form.
+
+_POPCOUNT = [bin(m).count("1") for m in range(1 << N_RANKS)]
+
+
+def _suit_sort_key(mask: int) -> int:
+    # number of cards first, then the mask itself
+    return _POPCOUNT[mask] << N_RANKS | mask
+
+
+def canonical_suit_map(codes: Sequence[int]) -> List[int]:
+    """Map of original suit index -> canonical suit index for card codes (``Card.to_index``)."""
+    masks = [0] * N_SUITS
+    for c in codes:
+        masks[c // N_RANKS] |= 1 << (c % N_RANKS)
+    keys = [_suit_sort_key(m) for m in masks]
+    order = sorted(range(N_SUITS), key=keys.__getitem__, reverse=True)
+    suit_map = [0] * N_SUITS
+    for new_suit, old_suit in enumerate(order):
+        suit_map[old_suit] = new_suit
+    return suit_map
+
+
+def relabel_codes(codes: Sequence[int], suit_map: Sequence[int]) -> List[int]:
+    return [suit_map[c // N_RANKS] * N_RANKS + c % N_RANKS for c in codes]
+
+
+def invert_suit_map(suit_map: Sequence[int]) -> List[int]:
+    inverse = [0] * N_SUITS
+    for old_suit, new_suit in enumerate(suit_map):
+        inverse[new_suit] = old_suit
+    return inverse
+
+
+def canonicalize_codes(codes: Sequence[int]) -> Tuple[Tuple[int, ...], List[int]]:
+    """Canonical sorted codes of a hand, crib or deal and the suit map that produced them.
+
+    Codes of any subset of the cards (e.g. the kept 4 of a 6 card deal) map into the
+    same canonical space with ``relabel_codes(subset, suit_map)``, and back with the
+    inverted map.
+    """
+    suit_map = canonical_suit_map(codes)
+    return tuple(sorted(relabel_codes(codes, suit_map))), suit_map
+
+
+def canonicalize_hand(cards) -> Tuple[List[Card], List[int]]:
+    canonical, suit_map = canonicalize_codes([c.to_index() for c in cards])
+    return [Card.from_index(c) for c in canonical], suit_map
+
+
+def normalize_hand_to_canonical_str(cards) -> str:
+    """Like ``normalize_hand_to_str`` but identical for all suit relabellings of a hand."""
+    return normalize_hand_to_str(canonicalize_hand(cards)[0])
+
+
+def _class_size(masks: Sequence[int]) -> int:
+    size = factorial(N_SUITS)
+    for repeats in Counter(masks).values():
+        size //= factorial(repeats)
+    return size
+
+
+def iter_canonical_classes(n_cards: int) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """Yield (canonical codes, number of real hands in the class) for every class of n cards.
+
+    Classes are built directly from non-increasing tuples of suit masks, so the
+    C(52, n) real hands are never enumerated. The class sizes sum to C(52, n).
+    """
+    masks_by_key = sorted(range(1 << N_RANKS), key=_suit_sort_key, reverse=True)
+    masks_by_key = [m for m in masks_by_key if _POPCOUNT[m] <= n_cards]
+    popcounts = [_POPCOUNT[m] for m in masks_by_key]
+
+    def extend(start: int, remaining: int, chosen: List[int]):
+        if len(chosen) == N_SUITS:
+            if remaining == 0:
+                yield chosen
+            return
+        suits_left = N_SUITS - len(chosen)
+        for i in range(start, len(masks_by_key)):
+            count = popcounts[i]
+            # masks are in non-increasing card count order, later suits cannot hold more
+            if count * suits_left < remaining:
+                break
+            if count > remaining:
+                continue
+            yield from extend(i, remaining - count, chosen + [masks_by_key[i]])
+
+    for masks in extend(0, n_cards, []):
+        codes = tuple(sorted(
+            suit * N_RANKS + r for suit, mask in enumerate(masks) for r in range(N_RANKS) if mask >> r & 1
+        ))
+        yield codes, _class_size(masks)
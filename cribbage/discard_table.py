@@ -0,0 +1,261 @@
+"""Precomputed exact discard statistics for every 6 card deal.
+
+Deals that only differ by a relabelling of the suits score the same, so the table holds one row
+per suit-isomorphism class (962,988 of them, see ``database.iter_canonical_classes``). A row has
+the 15 ways to discard 2 of the 6 sorted canonical cards, in ``itertools.combinations(range(6), 2)``
+order, each with the exact sum, min and max of the kept hand over the 46 possible starters and the
+exact sum of the crib over the C(46, 2) * 44 opponent discards and starters. Sums are stored
+instead of averages so decisions made from the table match computing them directly.
+
+The file is a small header, the sorted colex ranks of the canonical deals (the row index) and the
+rows, opened with ``numpy.memmap``. Build it with ``python scripts/build_discard_table.py``.
+"""
+import itertools
+import logging
+import random
+import zlib
+from math import comb
+from multiprocessing import Pool
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cribbage.constants import DISCARD_TABLE_PATH
+from cribbage.database import canonicalize_codes, invert_suit_map, iter_canonical_classes, relabel_codes
+from cribbage.fast_scoring import N_RANKS, N_SUITS, JACK_RANK_I, RANK_BITS, RANK_SCORE_TABLE, score_hands_batch
+from cribbage.playingcards import Card
+from cribbage.score_table import combination_rank, combination_ranks
+from cribbage.table_file import HEADER_SIZE, LazyTable, TableFile, TableFileError
+
+logger = logging.getLogger(__name__)
+
+DISCARD_TABLE_VERSION = 1
+DISCARD_TABLE_MAGIC = b"CRIBDSC\0"
+N_DEALT = 6
+N_POOL = 52 - N_DEALT
+N_STARTERS = N_POOL
+N_CRIBS = comb(N_POOL, 2) * (N_POOL - 2)
+DISCARD_OPTIONS = list(itertools.combinations(range(N_DEALT), 2))
+KEPT_OPTIONS = [[i for i in range(N_DEALT) if i not in d] for d in DISCARD_OPTIONS]
+OPTION_DTYPE = np.dtype([("hand_sum", "<u2"), ("hand_min", "u1"), ("hand_max", "u1"), ("crib_sum", "<u4")])
+
+
+class DiscardTableError(TableFileError):
+    pass
+
+
+# header fields: number of deal classes, discard options per deal, crc32 of the keys and rows
+DISCARD_TABLE_FILE = TableFile("discard table", DISCARD_TABLE_MAGIC, DISCARD_TABLE_VERSION, 3, DiscardTableError)
+
+
+class DiscardOption(NamedTuple):
+    discards: Tuple[Card, Card]
+    kept: Tuple[Card, ...]
+    avg_hand: float
+    min_hand: int
+    max_hand: int
+    avg_crib: float
+
+    def expected_total(self, dealer_is_self: bool) -> float:
+        return self.avg_hand + (self.avg_crib if dealer_is_self else -self.avg_crib)
+
+
+# ===== Exact statistics for a batch of deals =====
+
+# opponent rank pairs r1 <= r2 with a starter rank, and the rank pairs a discard can be
+_CRIB_RANK_COMBOS = [(r1, r2, rs) for r1 in range(N_RANKS) for r2 in range(r1, N_RANKS) for rs in range(N_RANKS)]
+_DISCARD_RANK_PAIRS = {pair: i for i, pair in enumerate(itertools.combinations_with_replacement(range(N_RANKS), 2))}
+# [low rank, high rank] -> row of _DISCARD_RANK_PAIRS
+_DISCARD_RANK_PAIR_INDEX = np.zeros((N_RANKS, N_RANKS), dtype=np.int64)
+for (_low, _high), _i in _DISCARD_RANK_PAIRS.items():
+    _DISCARD_RANK_PAIR_INDEX[_low, _high] = _i
+
+
+def _build_crib_rank_scores() -> np.ndarray:
+    # [discard rank pair, opponent + starter ranks] -> fifteens + pairs + runs, 0 if more than 4 of a rank
+    scores = np.zeros((len(_DISCARD_RANK_PAIRS), len(_CRIB_RANK_COMBOS)), dtype=np.int32)
+    for (d1, d2), i in _DISCARD_RANK_PAIRS.items():
+        for j, (r1, r2, rs) in enumerate(_CRIB_RANK_COMBOS):
+            scores[i, j] = RANK_SCORE_TABLE.get(RANK_BITS[d1] + RANK_BITS[d2] + RANK_BITS[r1] + RANK_BITS[r2] + RANK_BITS[rs], 0)
+    return scores
+
+
+_CRIB_RANK_SCORES = None
+
+
+def _crib_rank_scores() -> np.ndarray:
+    global _CRIB_RANK_SCORES
+    if _CRIB_RANK_SCORES is None:
+        _CRIB_RANK_SCORES = _build_crib_rank_scores()
+    return _CRIB_RANK_SCORES
+
+
+def _crib_sums(deals: np.ndarray) -> np.ndarray:
+    """(B, 15) exact sum of the crib score over every opponent discard and starter."""
+    n_deals = len(deals)
+    ranks = deals % N_RANKS
+    suits = deals // N_RANKS
+    avail = N_SUITS - (ranks[:, :, None] == np.arange(N_RANKS)).sum(axis=1)  # (B, 13) pool cards per rank
+    suit_avail = N_RANKS - (suits[:, :, None] == np.arange(N_SUITS)).sum(axis=1)  # (B, 4) pool cards per suit
+
+    # weight of each opponent rank pair + starter rank, the same for all 15 discards of a deal
+    r1, r2, rs = (np.array(col) for col in zip(*_CRIB_RANK_COMBOS))
+    a1, a2, a_s = avail[:, r1], avail[:, r2], avail[:, rs]
+    opp_ways = np.where(r1 == r2, a1 * (a1 - 1) // 2, a1 * a2)
+    starter_ways = np.maximum(a_s - (rs == r1) - (rs == r2), 0)
+    weights = opp_ways * starter_ways  # (B, 1183)
+
+    sums = np.empty((n_deals, len(DISCARD_OPTIONS)), dtype=np.int64)
+    rank_scores = _crib_rank_scores()
+    jack_in_pool = ~(deals[:, :, None] == np.arange(N_SUITS) * N_RANKS + JACK_RANK_I).any(axis=1)  # (B, 4)
+    # pool jack of a suit: opponent discards it with any card, starter is another card of its suit
+    pool_nobs = ((N_POOL - 2) * (suit_avail - 1) * jack_in_pool).sum(axis=1)
+    for k, (i, j) in enumerate(DISCARD_OPTIONS):
+        pair_rows = _DISCARD_RANK_PAIR_INDEX[np.minimum(ranks[:, i], ranks[:, j]), np.maximum(ranks[:, i], ranks[:, j])]
+        total = (rank_scores[pair_rows] * weights).sum(axis=1)
+        # crib flush: both discards, both opponent discards and the starter share a suit
+        m = suit_avail[np.arange(n_deals), suits[:, i]]
+        total += np.where(suits[:, i] == suits[:, j], 5 * (m * (m - 1) // 2) * np.maximum(m - 2, 0), 0)
+        # discarded jack: any starter of its suit, opponent discards from the other cards
+        for col in (i, j):
+            is_jack = ranks[:, col] == JACK_RANK_I
+            total += np.where(is_jack, suit_avail[np.arange(n_deals), suits[:, col]] * comb(N_POOL - 1, 2), 0)
+        sums[:, k] = total + pool_nobs
+    return sums
+
+
+def compute_discard_rows(deals: np.ndarray) -> np.ndarray:
+    """Exact statistics of the 15 discards for each sorted 6 card deal in a (B, 6) array of codes."""
+    deals = np.asarray(deals, dtype=np.int16)
+    n_deals = len(deals)
+    in_deal = np.zeros((n_deals, 52), dtype=bool)
+    in_deal[np.arange(n_deals)[:, None], deals] = True
+    starters = np.nonzero(~in_deal)[1].reshape(n_deals, N_STARTERS)
+
+    rows = np.empty((n_deals, len(DISCARD_OPTIONS)), dtype=OPTION_DTYPE)
+    for k, kept_cols in enumerate(KEPT_OPTIONS):
+        hands = np.empty((n_deals, N_STARTERS, 5), dtype=np.int16)
+        hands[:, :, :4] = deals[:, None, kept_cols]
+        hands[:, :, 4] = starters
+        scores = score_hands_batch(hands.reshape(-1, 5), is_crib=False).reshape(n_deals, N_STARTERS)
+        rows["hand_sum"][:, k] = scores.sum(axis=1)
+        rows["hand_min"][:, k] = scores.min(axis=1)
+        rows["hand_max"][:, k] = scores.max(axis=1)
+    rows["crib_sum"] = _crib_sums(deals)
+    return rows
+
+
+# ===== Table file =====
+
+class DiscardTable:
+    """Read only view over a discard table file."""
+
+    def __init__(self, path: str, verify: bool = False):
+        self.path = path
+        n_classes, n_options, crc = DISCARD_TABLE_FILE.read_header(path)
+        if n_options != len(DISCARD_OPTIONS):
+            raise DiscardTableError(f"{path} has an unexpected shape")
+        DISCARD_TABLE_FILE.check_size(path, n_classes * (4 + n_options * OPTION_DTYPE.itemsize))
+        self.crc = crc
+        self.keys = np.memmap(path, dtype="<u4", mode="r", offset=HEADER_SIZE, shape=(n_classes,))
+        self.rows = np.memmap(path, dtype=OPTION_DTYPE, mode="r", offset=HEADER_SIZE + self.keys.nbytes,
+                              shape=(n_classes, n_options))
+        if verify:
+            self.verify()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def row(self, canonical_codes: Sequence[int]) -> Optional[np.ndarray]:
+        """The 15 discard options of a sorted canonical deal, None if the deal is not in the table."""
+        key = combination_rank(canonical_codes)
+        i = int(np.searchsorted(self.keys, key))
+        if i == len(self.keys) or self.keys[i] != key:
+            return None
+        return self.rows[i]
+
+    def verify(self, n_samples: int = 50, seed: int = 0):
+        """Check the checksum and recompute random rows."""
+        if zlib.crc32(self.rows, zlib.crc32(self.keys)) != self.crc:
+            raise DiscardTableError(f"{self.path} failed its checksum")
+        rng = random.Random(seed)
+        sample = sorted(rng.sample(range(len(self.keys)), min(n_samples, len(self.keys))))
+        deals = np.array([_unrank_combination(int(self.keys[i]), N_DEALT) for i in sample])
+        if not np.array_equal(compute_discard_rows(deals), self.rows[sample]):
+            raise DiscardTableError(f"{self.path} has wrong discard statistics")
+
+
+def _unrank_combination(rank: int, k: int) -> List[int]:
+    # inverse of score_table.combination_rank
+    codes = []
+    for i in range(k, 0, -1):
+        c = i - 1
+        while comb(c + 1, i) <= rank:
+            c += 1
+        codes.append(c)
+        rank -= comb(c, i)
+    return codes[::-1]
+
+
+def build_discard_table(path: str = DISCARD_TABLE_PATH, deals: Optional[np.ndarray] = None,
+                        processes: Optional[int] = None, chunk_size: int = 2000) -> DiscardTable:
+    """Compute the statistics of every deal class, write the table file and return it verified.
+
+    :param deals: Sorted canonical deals to include, all 962,988 classes if None.
+    :param processes: Worker processes, the number of CPUs if None. 1 computes in this process.
+    """
+    if deals is None:
+        deals = np.fromiter(itertools.chain.from_iterable(codes for codes, _ in iter_canonical_classes(N_DEALT)),
+                            dtype=np.int16).reshape(-1, N_DEALT)
+    deals = np.asarray(deals, dtype=np.int16)
+    keys = combination_ranks(deals).astype("<u4")
+    order = np.argsort(keys)
+    keys, deals = keys[order], deals[order]
+    chunks = [deals[i:i + chunk_size] for i in range(0, len(deals), chunk_size)]
+    if processes == 1 or len(chunks) == 1:
+        results = [compute_discard_rows(chunk) for chunk in chunks]
+    else:
+        with Pool(processes) as pool:
+            results = pool.map(compute_discard_rows, chunks)
+    rows = np.concatenate(results) if results else np.empty((0, len(DISCARD_OPTIONS)), dtype=OPTION_DTYPE)
+
+    DISCARD_TABLE_FILE.write(path, (len(keys), len(DISCARD_OPTIONS)), [keys, rows])
+    _DISCARD_TABLE.reset()
+    return DiscardTable(path, verify=True)
+
+
+_DISCARD_TABLE = LazyTable(lambda: DiscardTable(DISCARD_TABLE_PATH),
+                           "Discard table not available, computing discard statistics directly")
+
+
+def get_discard_table() -> Optional[DiscardTable]:
+    """Lazily open the shared discard table, None if it has not been built."""
+    return _DISCARD_TABLE.get()
+
+
+def discard_options(hand: Sequence[Card]) -> List[DiscardOption]:
+    """Exact statistics of the 15 ways to discard 2 cards from a 6 card deal.
+
+    One table lookup and a suit relabel when the table is built, otherwise the same statistics
+    are computed for the deal directly.
+    """
+    if len(hand) != N_DEALT:
+        raise ValueError("Hand must have exactly 6 cards")
+    canonical, suit_map = canonicalize_codes([c.to_index() for c in hand])
+    table = get_discard_table()
+    row = table.row(canonical) if table is not None else None
+    if row is None:
+        row = compute_discard_rows(np.array([canonical]))[0]
+    hand_by_code = {c.to_index(): c for c in hand}
+    cards = [hand_by_code[c] for c in relabel_codes(canonical, invert_suit_map(suit_map))]
+    return [
+        DiscardOption(
+            discards=(cards[i], cards[j]),
+            kept=tuple(cards[c] for c in kept_cols),
+            avg_hand=int(option["hand_sum"]) / N_STARTERS,
+            min_hand=int(option["hand_min"]),
+            max_hand=int(option["hand_max"]),
+            avg_crib=int(option["crib_sum"]) / N_CRIBS,
+        )
+        for (i, j), kept_cols, option in zip(DISCARD_OPTIONS, KEPT_OPTIONS, row)
+    ]
@@ -0,0 +1,185 @@
+"""Integer-encoded hand scoring.
+
+Cards are represented by the 0-51 code from ``Card.to_index`` (``suit * 13 + rank``).
+Fifteens, pairs and runs only depend on the multiset of ranks, so they are precomputed
+once for every rank histogram of up to 5 cards. Scoring a hand is then a histogram key
+sum, a dict lookup and a flush/nobs check on the suits.
+
+``score_hands_batch`` scores many 5 card hands at once with NumPy array operations for the
+exhaustive evaluators that would otherwise call ``score_hand`` tens of thousands of times.
+"""
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+N_RANKS = 13
+N_SUITS = 4
+JACK_RANK_I = 10
+
+# value of each rank index (a=1 ... 10, j, q, k = 10)
+RANK_VALUES = [min(r + 1, 10) for r in range(N_RANKS)]
+
+# each rank gets 3 bits in the histogram key, enough for a count of 0-4
+RANK_BITS = [1 << (3 * r) for r in range(N_RANKS)]
+CODE_RANK = [code % N_RANKS for code in range(N_RANKS * N_SUITS)]
+CODE_SUIT = [code // N_RANKS for code in range(N_RANKS * N_SUITS)]
+CODE_BITS = [RANK_BITS[r] for r in CODE_RANK]
+
+
+def count_fifteens(values: Sequence[int]) -> int:
+    """Number of subsets of card values that sum to 15 (subset-sum count)."""
+    ways = [1] + [0] * 15
+    for v in values:
+        for s in range(15, v - 1, -1):
+            ways[s] += ways[s - v]
+    return ways[15]
+
+
+def _score_rank_counts(rank_counts: List[int]) -> int:
+    """Fifteens, pairs and runs for a rank histogram (suit independent points)."""
+    values = [RANK_VALUES[r] for r in range(N_RANKS) for _ in range(rank_counts[r])]
+    score = 2 * count_fifteens(values)
+    score += sum(c * (c - 1) for c in rank_counts)
+    run_len, run_ways = 0, 1
+    for r in range(N_RANKS + 1):
+        c = rank_counts[r] if r < N_RANKS else 0
+        if c:
+            run_len += 1
+            run_ways *= c
+        else:
+            if run_len >= 3:
+                score += run_len * run_ways
+            run_len, run_ways = 0, 1
+    return score
+
+
+def _build_rank_score_table(max_cards: int = 5) -> Dict[int, int]:
+    table = {}
+    for n_cards in range(max_cards + 1):
+        for ranks in combinations_with_replacement(range(N_RANKS), n_cards):
+            rank_counts = [0] * N_RANKS
+            for r in ranks:
+                rank_counts[r] += 1
+            if max(rank_counts, default=0) > N_SUITS:
+                continue
+            table[sum(RANK_BITS[r] for r in ranks)] = _score_rank_counts(rank_counts)
+    return table
+
+
+# histogram key -> fifteens + pairs + runs points
+RANK_SCORE_TABLE = _build_rank_score_table()
+
+
+def rank_histogram_key(codes: Iterable[int]) -> int:
+    return sum(CODE_BITS[c] for c in codes)
+
+
+def cards_to_codes(cards) -> List[int]:
+    return [c.to_index() for c in cards]
+
+
+def score_hand_codes(hand_codes: Sequence[int], starter_code: Optional[int] = None, is_crib: bool = False) -> int:
+    """Score a hand of at most 4 card codes plus an optional starter code.
+
+    Follows the same rules as ``scoring.score_hand``: a 4 card hand without a starter counts a
+    4 point flush, a crib only counts a flush when the starter matches as well, and nobs needs
+    a starter.
+
+    :param hand_codes: Codes of the cards in the hand (starter excluded).
+    :param starter_code: Code of the starter card, if known.
+    :param is_crib: Whether the cards are a crib.
+    :return: Points for the hand.
+    """
+    key = CODE_BITS[starter_code] if starter_code is not None else 0
+    for c in hand_codes:
+        key += CODE_BITS[c]
+    score = RANK_SCORE_TABLE[key]
+    if len(hand_codes) == 4:
+        suit = CODE_SUIT[hand_codes[0]]
+        if CODE_SUIT[hand_codes[1]] == suit and CODE_SUIT[hand_codes[2]] == suit and CODE_SUIT[hand_codes[3]] == suit:
+            if starter_code is None:
+                score += 4
+            elif CODE_SUIT[starter_code] == suit:
+                score += 5
+            elif not is_crib:
+                score += 4
+    if starter_code is not None:
+        starter_suit = CODE_SUIT[starter_code]
+        for c in hand_codes:
+            if CODE_RANK[c] == JACK_RANK_I and CODE_SUIT[c] == starter_suit:
+                score += 1
+                break
+    return score
+
+
+# ===== Batch scoring =====
+
+# (5, 31) 0/1 matrix, column j selects the cards of the j-th non-empty subset of 5 cards
+_SUBSET_MATRIX = np.array([[(j >> i) & 1 for j in range(1, 32)] for i in range(5)], dtype=np.int16)
+_PAIR_INDICES = np.array(list(combinations(range(5), 2))).T
+_RANK_VALUES_ARRAY = np.array(RANK_VALUES, dtype=np.int16)
+
+
+def score_hands_batch(cards: np.ndarray, is_crib: Union[bool, np.ndarray] = False,
+                      starter_idx: Union[int, np.ndarray] = 4) -> np.ndarray:
+    """Score N hands of 4 cards + starter in one call.
+
+    Same rules as ``score_hand_codes``: fifteens over the 31 card subsets, pairs, runs from the
+    rank histogram, then flush and nobs masks that depend on which card is the starter.
+
+    :param cards: (N, 5) array of card codes (``Card.to_index``), each row 5 distinct cards.
+    :param is_crib: Whether the rows are cribs, a bool or an (N,) bool array.
+    :param starter_idx: Column of the starter card, an int or an (N,) int array.
+    :return: (N,) int array of scores.
+    """
+    cards = np.asarray(cards, dtype=np.int16)
+    n_hands = len(cards)
+    ranks = cards % N_RANKS
+    suits = cards // N_RANKS
+
+    fifteens = (_RANK_VALUES_ARRAY[ranks] @ _SUBSET_MATRIX == 15).sum(axis=1)
+    pairs = (ranks[:, _PAIR_INDICES[0]] == ranks[:, _PAIR_INDICES[1]]).sum(axis=1)
+    score = 2 * fifteens + 2 * pairs
+
+    # runs: walk the rank histogram like _score_rank_counts, a run of 3+ ranks scores its
+    # length times the number of ways to pick one card of each rank when it ends
+    rank_counts = (ranks[:, :, None] == np.arange(N_RANKS + 1)).sum(axis=1, dtype=np.int16)
+    run_len = np.zeros(n_hands, dtype=np.int16)
+    run_ways = np.ones(n_hands, dtype=np.int16)
+    for r in range(N_RANKS + 1):
+        count = rank_counts[:, r]
+        present = count > 0
+        score += np.where(present | (run_len < 3), 0, run_len * run_ways)
+        run_len = np.where(present, run_len + 1, 0)
+        run_ways = np.where(present, run_ways * count, 1)
+
+    is_starter = np.arange(5) == np.broadcast_to(np.asarray(starter_idx), (n_hands,))[:, None]
+    starter_suit = suits[is_starter]
+    hand_suit_counts = ((suits[:, :, None] == np.arange(N_SUITS)) & ~is_starter[:, :, None]).sum(axis=1, dtype=np.int16)
+    flush = hand_suit_counts.max(axis=1) == 4
+    starter_match = hand_suit_counts[np.arange(n_hands), starter_suit] == 4
+    score += np.where(is_crib, 5 * (flush & starter_match), flush * (4 + starter_match))
+    nobs = ((ranks == JACK_RANK_I) & (suits == starter_suit[:, None]) & ~is_starter).any(axis=1)
+    return score + nobs
+
+
+def crib_deal_codes(discard_codes: Sequence[int], pool_codes: Sequence[int]) -> np.ndarray:
+    """Every crib that can follow a 2 card discard, as rows for ``score_hands_batch``.
+
+    Rows are the 2 discards, 2 opponent discards from ``pool_codes`` and a starter from the rest
+    of the pool (starter in the last column), one row per (opponent pair, starter).
+    """
+    pool = np.asarray(pool_codes, dtype=np.int16)
+    first, second = np.triu_indices(len(pool), k=1)
+    # starters for each opponent pair are the pool without the pair
+    starter_mask = np.ones((len(first), len(pool)), dtype=bool)
+    starter_mask[np.arange(len(first)), first] = False
+    starter_mask[np.arange(len(first)), second] = False
+    pair_rows, starter_cols = np.nonzero(starter_mask)
+    deals = np.empty((len(pair_rows), 5), dtype=np.int16)
+    deals[:, 0:2] = discard_codes
+    deals[:, 2] = pool[first[pair_rows]]
+    deals[:, 3] = pool[second[pair_rows]]
+    deals[:, 4] = pool[starter_cols]
+    return deals
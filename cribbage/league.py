@@ -0,0 +1,210 @@
+"""Round-robin leagues between any number of players, rated with Bradley-Terry on the Elo scale.
+
+Every pairing plays the same seeded, seat-alternated games ``utils.play_multiple_games`` would
+play, so all pairings see the same deals. Finished games are cached by the two players'
+identities (``player_key``: class, version, name and settings) and the league seed, and a
+pairing only plays the games its cache entry is missing: adding a player costs its own N - 1
+pairings, and raising ``games_per_pairing`` only plays the extra games.
+"""
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from cribbage.utils import _play_match_games, summarize_match
+
+logger = logging.getLogger(__name__)
+
+ELO_SCALE = 400 / np.log(10)
+
+
+def player_key(player) -> str:
+    """Cache identity of a player, ``BasePlayer.cache_key`` or its class, ``version`` and name."""
+    if hasattr(player, "cache_key"):
+        return player.cache_key()
+    cls = type(player)
+    return f"{cls.__module__}.{cls.__qualname__}@{getattr(player, 'version', '1')}:{player.name}"
+
+
+class MatchCache:
+    """Diffs of finished league games, keyed by pairing and seed, optionally kept in a JSON file.
+
+    Entries hold the diffs of games 0..n-1 from the first player's side; reading a pairing the
+    other way round negates them.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, List[int]] = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                self._entries = json.load(f)
+
+    @staticmethod
+    def _key(key0: str, key1: str, seed) -> Tuple[str, bool]:
+        flipped = key1 < key0
+        if flipped:
+            key0, key1 = key1, key0
+        return json.dumps([key0, key1, seed]), flipped
+
+    def get(self, key0: str, key1: str, seed) -> List[int]:
+        key, flipped = self._key(key0, key1, seed)
+        diffs = self._entries.get(key, [])
+        return [-d for d in diffs] if flipped else list(diffs)
+
+    def put(self, key0: str, key1: str, seed, diffs: List[int]):
+        key, flipped = self._key(key0, key1, seed)
+        self._entries[key] = [-d for d in diffs] if flipped else list(diffs)
+
+    def save(self):
+        if self.path is None:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
+
+
+class Rating(NamedTuple):
+    name: str
+    elo: float
+    elo_se: float
+    games: int
+    wins: int
+    losses: int
+    ties: int
+    mean_diff: float
+
+
+def fit_bradley_terry(wins: np.ndarray, games: np.ndarray, prior_games: float = 1.0,
+                      tol: float = 1e-10, max_iter: int = 10000) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit Bradley-Terry log-strengths by minorization-maximization (Hunter 2004).
+
+    ``wins[i, j]`` is how often i beat j (ties as half a win each way) and ``games[i, j]``
+    how often they met. Every pairing that met gets ``prior_games`` virtual games split
+    evenly, which keeps unbeaten or winless players finite.
+    :return: (log-strengths centred on 0, their standard errors from the Fisher information)
+    """
+    met = games > 0
+    wins = wins + met * prior_games / 2
+    games = games + met * prior_games
+    n = len(games)
+    strengths = np.ones(n)
+    total_wins = wins.sum(axis=1)
+    for _ in range(max_iter):
+        denominators = (games / (strengths[:, None] + strengths[None, :])).sum(axis=1)
+        updated = np.where(denominators > 0, total_wins / np.where(denominators > 0, denominators, 1), strengths)
+        updated /= np.exp(np.log(updated).mean())
+        done = np.max(np.abs(np.log(updated) - np.log(strengths))) < tol
+        strengths = updated
+        if done:
+            break
+    theta = np.log(strengths)
+    p = 1 / (1 + np.exp(theta[None, :] - theta[:, None]))
+    information = -games * p * (1 - p)
+    np.fill_diagonal(information, 0)
+    np.fill_diagonal(information, -information.sum(axis=1))
+    # centred ratings: the pseudo-inverse handles the free additive constant
+    covariance = np.linalg.pinv(information)
+    return theta - theta.mean(), np.sqrt(np.clip(np.diag(covariance), 0, None))
+
+
+class League:
+    """Round-robin league; ``run`` plays the missing games and ``ratings`` fits the leaderboard."""
+
+    def __init__(self, players, games_per_pairing: int = 100, seed: int = 0, cache_path: Optional[str] = None,
+                 max_workers: int = 1, chunk_size: int = 25):
+        self.players = []
+        self.games_per_pairing = games_per_pairing
+        self.seed = seed
+        self.cache = MatchCache(cache_path)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        for player in players:
+            self.add_player(player)
+
+    def add_player(self, player):
+        if any(p.name == player.name for p in self.players):
+            raise ValueError(f"League already has a player named {player.name}.")
+        if any(player_key(p) == player_key(player) for p in self.players):
+            raise ValueError(f"League already has a player with the cache key {player_key(player)}.")
+        self.players.append(player)
+
+    def pairings(self):
+        return [(a, b) for i, a in enumerate(self.players) for b in self.players[i + 1:]]
+
+    def _diffs(self, a, b) -> List[int]:
+        return self.cache.get(player_key(a), player_key(b), self.seed)[:self.games_per_pairing]
+
+    def run(self) -> int:
+        """Play every pairing's missing games over the worker pool; return how many were played."""
+        chunks = []
+        for a, b in self.pairings():
+            # play each pairing in cache order so its games do not depend on the league order
+            if player_key(b) < player_key(a):
+                a, b = b, a
+            played = len(self.cache.get(player_key(a), player_key(b), self.seed))
+            for start in range(played, self.games_per_pairing, self.chunk_size):
+                chunks.append((a, b, start, min(start + self.chunk_size, self.games_per_pairing)))
+        if not chunks:
+            return 0
+        if self.max_workers == 1:
+            results = [_play_match_games(a, b, start, stop, self.seed) for a, b, start, stop in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(_play_match_games, a, b, start, stop, self.seed)
+                           for a, b, start, stop in chunks]
+                results = [future.result() for future in futures]
+        # chunks of a pairing were queued in game order
+        for (a, b, start, stop), diffs in zip(chunks, results):
+            cached = self.cache.get(player_key(a), player_key(b), self.seed)
+            assert len(cached) == start, "league chunks must extend the cached games in order"
+            self.cache.put(player_key(a), player_key(b), self.seed, cached + diffs)
+        self.cache.save()
+        n_played = sum(stop - start for _, _, start, stop in chunks)
+        logger.info(f"League played {n_played} games over {len(chunks)} chunks")
+        return n_played
+
+    def results(self) -> Dict[Tuple[str, str], dict]:
+        """``summarize_match`` of every pairing, from the first player's side."""
+        return {(a.name, b.name): summarize_match(self._diffs(a, b)) for a, b in self.pairings()}
+
+    def ratings(self, elo_base: float = 1500.0, prior_games: float = 1.0) -> List[Rating]:
+        """Bradley-Terry ratings on the Elo scale, best first. Run the league first."""
+        n = len(self.players)
+        index = {p.name: i for i, p in enumerate(self.players)}
+        wins = np.zeros((n, n))
+        games = np.zeros((n, n))
+        diff_sums = np.zeros(n)
+        counts = np.zeros((n, 3), dtype=int)  # wins, losses, ties
+        for a, b in self.pairings():
+            i, j = index[a.name], index[b.name]
+            for diff in self._diffs(a, b):
+                games[i, j] += 1
+                games[j, i] += 1
+                score = 1.0 if diff > 0 else 0.5 if diff == 0 else 0.0
+                wins[i, j] += score
+                wins[j, i] += 1 - score
+                diff_sums[i] += diff
+                diff_sums[j] -= diff
+                outcome = 0 if diff > 0 else 2 if diff == 0 else 1
+                counts[i, outcome] += 1
+                counts[j, (1, 0, 2)[outcome]] += 1
+        theta, theta_se = fit_bradley_terry(wins, games, prior_games=prior_games)
+        n_games = games.sum(axis=1)
+        ratings = [Rating(p.name, float(elo_base + ELO_SCALE * theta[i]), float(ELO_SCALE * theta_se[i]),
+                          int(n_games[i]), *map(int, counts[i]),
+                          float(diff_sums[i] / n_games[i]) if n_games[i] else 0.0)
+                   for i, p in enumerate(self.players)]
+        return sorted(ratings, key=lambda rating: rating.elo, reverse=True)
+
+    def leaderboard(self, **kwargs) -> str:
+        """Printable leaderboard of ``ratings``."""
+        lines = ["rank player                      elo     +/-  games  wins losses ties mean_diff"]
+        for rank, r in enumerate(self.ratings(**kwargs), 1):
+            lines.append("%4d %-24s %7.1f %7.1f %6d %5d %6d %4d %9.2f" % (
+                rank, r.name, r.elo, 1.96 * r.elo_se, r.games, r.wins, r.losses, r.ties, r.mean_diff))
+        return "\n".join(lines)
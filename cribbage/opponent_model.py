@@ -0,0 +1,192 @@
+"""Bayesian inference of the opponent's hand during a round.
+
+``OpponentHandModel`` keeps one weight per 4 card hand the opponent could have kept from the
+cards I have not seen. The prior is a discard model: opponents keep hands worth more, with
+weight ``exp(discard_beta * E[hand points over the starter])``. Each pegging event then
+multiplies the weights by its likelihood: a play keeps only the hands holding the card,
+weighted by a softmax of the pegging points each playable card would have scored
+(``play_beta``), and a go rules out every hand with a card that fitted under 31.
+
+Hands are numpy rows of card codes, with played cards set to -1. Rows that reach weight zero
+are dropped after every event, so the arrays shrink as the round goes on (about 163,000
+hands after the deal, 14,000 after the first play) and queries never re-enumerate the deal.
+"""
+import logging
+from itertools import combinations
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from cribbage.fast_scoring import JACK_RANK_I, N_RANKS, N_SUITS, RANK_BITS, RANK_SCORE_TABLE, RANK_VALUES
+from cribbage.playingcards import Card
+from cribbage.scoring import PeggingSequence
+
+logger = logging.getLogger(__name__)
+
+N_CARDS = N_RANKS * N_SUITS
+HAND_SIZE = 4
+_CODE_VALUES = np.array([RANK_VALUES[c % N_RANKS] for c in range(N_CARDS)] + [99], dtype=np.int16)  # -1 -> 99
+_RANK_BITS = np.array(RANK_BITS, dtype=np.int64)
+
+
+def _row_counts(values: np.ndarray, n_values: int) -> np.ndarray:
+    # (N, n_values) occurrences of 0..n_values - 1 in each row of (N, k) values; n_values itself is ignored
+    rows = np.arange(len(values))[:, None] * (n_values + 1)
+    counts = np.bincount((values + rows).ravel(), minlength=len(values) * (n_values + 1))
+    return counts.reshape(len(values), n_values + 1)[:, :n_values]
+
+
+def _rank_counts(hands: np.ndarray) -> np.ndarray:
+    # (N, 13) cards of each rank in (N, k) rows of codes, -1 ignored
+    return _row_counts(np.where(hands >= 0, hands % N_RANKS, N_RANKS), N_RANKS)
+
+
+_HAND_POSITIONS = None
+
+
+def _hand_positions() -> np.ndarray:
+    """Every 4 of the 46 cards left after a deal, as positions in the sorted unseen cards."""
+    global _HAND_POSITIONS
+    if _HAND_POSITIONS is None:
+        _HAND_POSITIONS = np.array(list(combinations(range(N_CARDS - 6), HAND_SIZE)), dtype=np.int16)
+    return _HAND_POSITIONS
+
+
+def expected_keep_values(hands: np.ndarray, unseen: Sequence[int]) -> np.ndarray:
+    """E[hand points] of (N, 4) kept hands over a starter drawn from the rest of ``unseen``.
+
+    15s, pairs and runs come from the rank histogram of hand and starter rank; flushes and
+    nobs from the suits left in the pool.
+    """
+    unseen = np.asarray(unseen)
+    unseen_ranks = np.bincount(unseen % N_RANKS, minlength=N_RANKS)
+    unseen_suits = np.bincount(unseen // N_RANKS, minlength=N_SUITS)
+    n_starters = len(unseen) - HAND_SIZE
+    rank_counts = _rank_counts(hands)
+    keys = rank_counts @ _RANK_BITS
+    unique_keys, groups = np.unique(keys, return_inverse=True)
+    rank_scores = np.array([[RANK_SCORE_TABLE.get(int(key) + RANK_BITS[r], 0) for r in range(N_RANKS)]
+                            for key in unique_keys], dtype=float)
+    starter_ranks = unseen_ranks[None, :] - rank_counts
+    values = (starter_ranks * rank_scores[groups]).sum(axis=1) / n_starters
+
+    suits = hands // N_RANKS
+    suit_counts = _row_counts(suits, N_SUITS)
+    starter_suits = unseen_suits[None, :] - suit_counts  # (N, 4) starters of each suit
+    flush_suit = suit_counts.argmax(axis=1)
+    is_flush = suit_counts.max(axis=1) == HAND_SIZE
+    values += is_flush * (4 + starter_suits[np.arange(len(hands)), flush_suit] / n_starters)
+    jacks = hands % N_RANKS == JACK_RANK_I
+    values += (jacks * np.take_along_axis(starter_suits, suits, axis=1)).sum(axis=1) / n_starters
+    return values
+
+
+class OpponentHandModel:
+    """Weighted distribution over the opponent's remaining hand for one round, from my 6 cards."""
+
+    def __init__(self, my_dealt: Sequence[Card], starter: Optional[Card] = None, discard_beta: float = 1.0,
+                 play_beta: float = 1.0, discard_model: Optional[Callable] = None):
+        """
+        :param discard_model: ``f(hands, unseen_codes)`` -> (N,) log prior weights of (N, 4) kept
+            hands; ``discard_beta * expected_keep_values`` if None.
+        """
+        self.play_beta = play_beta
+        mine = {c.to_index() for c in my_dealt}
+        if len(mine) != 6:
+            raise ValueError("The model starts from the 6 cards dealt to me.")
+        unseen = [c for c in range(N_CARDS) if c not in mine]
+        self.hands = np.array(unseen, dtype=np.int16)[_hand_positions()]
+        if discard_model is None:
+            log_prior = discard_beta * expected_keep_values(self.hands, unseen)
+        else:
+            log_prior = np.asarray(discard_model(self.hands, unseen), dtype=float)
+        weights = np.exp(log_prior - log_prior.max())
+        self.weights = weights / weights.sum()
+        self._records_seen = 0
+        self._card_probabilities = None
+        if starter is not None:
+            self.observe_starter(starter)
+
+    def __len__(self):
+        return len(self.hands)
+
+    def _reweight(self, factors: np.ndarray) -> bool:
+        weights = self.weights * factors
+        alive = weights > 0
+        if not alive.any():
+            # the evidence contradicts the model (e.g. an opponent that says go when able): keep the old beliefs
+            logger.debug("Opponent model ruled out every hand, ignoring the event.")
+            return False
+        if not alive.all():
+            self.hands = self.hands[alive]
+            weights = weights[alive]
+        self.weights = weights / weights.sum()
+        self._card_probabilities = None
+        return True
+
+    def observe_starter(self, starter: Card):
+        self._reweight((self.hands != starter.to_index()).all(axis=1).astype(float))
+
+    def observe_play(self, card: Card, table: Sequence[Card] = ()):
+        """The opponent played ``card`` onto ``table``, the cards of the current count before it."""
+        code = card.to_index()
+        holds = self.hands == code
+        has_card = holds.any(axis=1)
+        factors = has_card.astype(float)
+        if self.play_beta:
+            sequence = PeggingSequence(table)
+            count = sequence.count
+            points = np.array([sequence.preview(Card.from_index(r))[0] + (count + RANK_VALUES[r] == 31)
+                               for r in range(N_RANKS)], dtype=float)
+            preferences = np.exp(self.play_beta * points)
+            playable = (self.hands >= 0) & (_CODE_VALUES[self.hands] + count <= 31)
+            ranks = np.where(self.hands >= 0, self.hands % N_RANKS, 0)
+            denominators = np.where(playable, preferences[ranks], 0).sum(axis=1)
+            factors = np.where(has_card, preferences[code % N_RANKS] / np.where(denominators > 0, denominators, 1), 0)
+        else:
+            # every playable card as likely
+            count = sum(c.get_value() for c in table)
+            n_playable = ((self.hands >= 0) & (_CODE_VALUES[self.hands] + count <= 31)).sum(axis=1)
+            factors = np.where(has_card, 1 / np.maximum(n_playable, 1), 0)
+        if self._reweight(factors):
+            self.hands = np.where(self.hands == code, -1, self.hands).astype(np.int16)
+
+    def observe_go(self, count: int):
+        """The opponent said go at ``count``, so none of their cards fitted."""
+        can_play = ((self.hands >= 0) & (_CODE_VALUES[self.hands] + count <= 31)).any(axis=1)
+        self._reweight((~can_play).astype(float))
+
+    def observe_records(self, play_record, opponent_name: str):
+        """Apply the opponent's plays and goes from a ``CribbageRound.play_record`` not seen yet."""
+        for record in play_record[self._records_seen:]:
+            if record.player_name != opponent_name:
+                continue
+            if record.card is not None and ": Plays " in record.description:
+                self.observe_play(record.card, record.active_table)
+            elif record.description.endswith(": Go"):
+                self.observe_go(record.table_count)
+        self._records_seen = len(play_record)
+
+    def card_probabilities(self) -> np.ndarray:
+        """(52,) probability that the opponent still holds each card, by code."""
+        if self._card_probabilities is None:
+            held = self.hands >= 0
+            self._card_probabilities = np.bincount(self.hands[held], weights=np.broadcast_to(
+                self.weights[:, None], self.hands.shape)[held], minlength=N_CARDS)
+        return self._card_probabilities
+
+    def card_probability(self, card: Card) -> float:
+        return float(self.card_probabilities()[card.to_index()])
+
+    def rank_probabilities(self) -> np.ndarray:
+        """(13,) probability that the opponent still holds at least one card of each rank, ace first."""
+        return self.weights @ (_rank_counts(self.hands) > 0)
+
+    def probability(self, predicate: Callable[[np.ndarray], np.ndarray]) -> float:
+        """Probability of ``predicate(hands)``, a (N,) bool mask over (N, 4) rows of codes (-1 played)."""
+        return float(self.weights @ predicate(self.hands))
+
+    def sample_hands(self, n_samples: int, rng) -> List[List[Card]]:
+        """Remaining opponent hands drawn by weight with a ``random.Random``."""
+        rows = rng.choices(range(len(self.hands)), weights=self.weights, k=n_samples)
+        return [[Card.from_index(int(c)) for c in self.hands[i] if c >= 0] for i in rows]
@@ -1,10 +1,13 @@
 """Agents that interact with the CribbageGame."""
+import copy
 import random
 from abc import ABCMeta, abstractmethod
 
 
 class BasePlayer(metaclass=ABCMeta):
     """Abstract Base Class"""
+    # bump in a subclass when its strategy changes, so cached league results are replayed
+    version = "1"
 
     def __init__(self, name):
         self.name = name
@@ -18,6 +21,45 @@ class BasePlayer(metaclass=ABCMeta):
     def get_name(self) -> str:
         return self.name
 
+    def reset_for_game(self, seed=None):
+        """Reset mutable per-game state (RNGs, opponent models) before a game starts.
+
+        Read-only caches such as score and discard tables are kept and shared. A seeded
+        game passes its player stream as ``seed``.
+        """
+
+    def cache_key(self) -> str:
+        """Identity of this player in cached results: class, ``version`` and name.
+
+        Subclasses with settings that change how they play add them, so differently
+        configured players never share cached games.
+        """
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}@{self.version}:{self.name}"
+
+    def fork(self, seed=None):
+        """Return a player for a new game that shares this player's read-only caches.
+
+        The copy is shallow, so subclasses must rebuild any mutable per-game state
+        in ``reset_for_game``.
+        """
+        player = copy.copy(self)
+        player.reset_for_game(seed=seed)
+        return player
+
+    def observe_deal(self, hand, discards):
+        """Called with the 6 cards dealt to this player and the 2 it put in the crib."""
+
+    def observe_starter(self, starter):
+        """Called with the starter card once it is cut, before pegging starts."""
+
+    def observe_play(self, player_name, card, count):
+        """Called for both players after every pegging turn.
+
+        :param card: card ``player_name`` played, None for a go
+        :param count: count before the turn
+        """
+
     @abstractmethod
     def select_crib_cards(self, hand):
         """Select cards to place in crib.
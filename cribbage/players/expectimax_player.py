@@ -0,0 +1,44 @@
+"""A player that searches the whole round: discards valued with their pegging, pegging by sampling."""
+import copy
+import logging
+from typing import Optional
+
+from cribbage.players.monte_carlo_player import MonteCarloPeggingPlayer
+from cribbage.strategies.expectimax_discard import ExpectimaxDiscard
+
+logger = logging.getLogger(__name__)
+
+
+class ExpectimaxPlayer(MonteCarloPeggingPlayer):
+    """Discards with ``ExpectimaxDiscard`` and pegs like ``MonteCarloPeggingPlayer``.
+
+    ``discard_samples`` and ``discard_time_budget`` (seconds per discard) bound the discard
+    search the way ``max_samples`` and ``time_budget`` bound each pegging decision.
+    ``discard_infer_opponent`` is ``ExpectimaxDiscard``'s ``infer_opponent``, separate from the
+    pegging ``infer_opponent``, which is off by default since it measured weaker there. Both
+    searches share one pool of ``max_workers``.
+    """
+    version = "1"
+
+    def __init__(self, name: str = "expectimax", seed: Optional[int] = None, max_samples: int = 128,
+                 time_budget: Optional[float] = None, max_workers: int = 1, infer_opponent: bool = False,
+                 discard_samples: int = 64, discard_time_budget: Optional[float] = None,
+                 discard_infer_opponent: bool = True):
+        self.discard_strategy = ExpectimaxDiscard(max_samples=discard_samples, time_budget=discard_time_budget,
+                                                  max_workers=max_workers, infer_opponent=discard_infer_opponent)
+        super().__init__(name=name, seed=seed, max_samples=max_samples, time_budget=time_budget,
+                         max_workers=max_workers, infer_opponent=infer_opponent)
+        self.discard_strategy.pool = self.pool
+
+    def cache_key(self) -> str:
+        strategy = self.discard_strategy
+        return f"{super().cache_key()}:discard_samples={strategy.max_samples},discard_infer={strategy.infer_opponent}"
+
+    def reset_for_game(self, seed=None):
+        super().reset_for_game(seed)
+        # forks are shallow copies: each game samples its own opponent hands over the shared pool
+        self.discard_strategy = copy.copy(self.discard_strategy)
+        self.discard_strategy.reset(self._rng.getrandbits(64))
+
+    def select_crib_cards(self, hand, dealer_is_self, your_score=None, opponent_score=None):
+        return self.discard_strategy(hand, dealer_is_self, your_score, opponent_score)
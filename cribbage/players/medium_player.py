@@ -1,12 +1,11 @@
 
 from itertools import combinations
 import sqlite3
-import pandas as pd
 from typing import List, Optional, Tuple
 from cribbage.constants import DB_PATH
 from cribbage.strategies.crib_strategies import calc_crib_ranges_fast_given_6_cards
 from cribbage.database import normalize_hand_to_str
-from cribbage.strategies.hand_strategies import exact_hand_and_fast_crib, exact_hand_and_min_crib
+from cribbage.strategies.hand_strategies import canonical_discard, exact_hand_and_fast_crib, exact_hand_and_min_crib
 from cribbage.players.beginner_player import BeginnerPlayer
 from cribbage.players.rule_based_player import get_full_deck
 from cribbage.playingcards import Card, build_hand
@@ -134,5 +133,5 @@ class MediumPlayer(BeginnerPlayer):
     
     def select_crib_cards(self, hand, dealer_is_self, your_score=None, opponent_score=None) -> Tuple[Card, Card]:                
         # best_discards = exact_hand_and_fast_crib(hand, dealer_is_self)
-        best_discards = exact_hand_and_min_crib(hand, dealer_is_self, your_score=your_score, opponent_score=opponent_score)
+        best_discards = canonical_discard(exact_hand_and_min_crib, hand, dealer_is_self)
         return best_discards
\ No newline at end of file
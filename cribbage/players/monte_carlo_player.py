@@ -0,0 +1,166 @@
+"""Pegging by determinized Monte-Carlo search over the opponent's possible hands."""
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cribbage.opponent_model import OpponentHandModel
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import Card
+from cribbage.strategies.pegging_solver import get_pegging_solver
+from cribbage.utils import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+HAND_SIZE = 4
+
+
+def evaluate_samples(hand: Sequence[Card], samples: Sequence[Sequence[Card]], table: Sequence[Card],
+                     other_said_go: bool, time_budget: Optional[float] = None) -> Tuple[Dict[Card, int], int]:
+    """Solve pegging against each sampled opponent hand until the samples or the time run out.
+
+    :return: (total exact value of each playable card over the solved samples, samples solved)
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    solver = get_pegging_solver()
+    totals: Dict[Card, int] = {}
+    n_solved = 0
+    for sample in samples:
+        for card, value in solver.play_values(hand, sample, table, other_said_go).items():
+            totals[card] = totals.get(card, 0) + value
+        n_solved += 1
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+    return totals, n_solved
+
+
+class MonteCarloPeggingPlayer(MediumPlayer):
+    """Discards like ``MediumPlayer`` and pegs by sampling the opponent's hand.
+
+    Each pegging decision deals the opponent random hands that fit everything seen this
+    round (my 6 cards, the starter, the opponent's plays, and no card that would have
+    fit when they said go), solves each with the perfect-information pegging solver and
+    plays the card with the best average. ``max_samples`` and ``time_budget`` (seconds)
+    trade strength for latency; ``max_workers`` greater than 1 solves the samples over a
+    process pool shared by the player and every game's fork of it, until ``close``. With ``infer_opponent`` the
+    hands are drawn from an ``OpponentHandModel`` instead, which also weighs how likely
+    the opponent was to keep and play what they did.
+    """
+    version = "1"
+
+    def __init__(self, name: str = "monte_carlo", seed: Optional[int] = None, max_samples: int = 128,
+                 time_budget: Optional[float] = None, max_workers: int = 1, infer_opponent: bool = False):
+        super().__init__(name=name)
+        self.seed = seed
+        self.max_samples = max_samples
+        self.time_budget = time_budget
+        self.max_workers = max_workers
+        self.infer_opponent = infer_opponent
+        self.pool = WorkerPool(max_workers)
+        self.reset_for_game()
+
+    def cache_key(self) -> str:
+        return f"{super().cache_key()}:samples={self.max_samples},infer={self.infer_opponent}"
+
+    def close(self):
+        """Shut down the worker pool, if one was started, for every fork of this player."""
+        self.pool.close()
+
+    def reset_for_game(self, seed=None):
+        self._rng = random.Random(self.seed if seed is None else seed)
+        self._new_round()
+
+    def _new_round(self):
+        self._dealt: List[Card] = []
+        self._starter: Optional[Card] = None
+        self._opponent_played: List[Card] = []
+        self._opponent_min_go_count: Optional[int] = None
+        self._said_go = set()
+        self._sequence: List[Card] = []
+        self._opponent_model: Optional[OpponentHandModel] = None
+
+    def observe_deal(self, hand, discards):
+        # a new round starts with the deal
+        self._new_round()
+        self._dealt = list(hand)
+        if self.infer_opponent:
+            self._opponent_model = OpponentHandModel(hand)
+
+    def observe_starter(self, starter):
+        self._starter = starter
+        if self._opponent_model is not None:
+            self._opponent_model.observe_starter(starter)
+
+    def observe_play(self, player_name, card, count):
+        if card is not None:
+            if player_name != self.name:
+                self._opponent_played.append(card)
+                if self._opponent_model is not None:
+                    self._opponent_model.observe_play(card, self._sequence)
+            self._sequence.append(card)
+            return
+        if player_name != self.name:
+            if self._opponent_min_go_count is None or count < self._opponent_min_go_count:
+                self._opponent_min_go_count = count
+            if self._opponent_model is not None:
+                self._opponent_model.observe_go(count)
+        self._said_go.add(player_name)
+        if len(self._said_go) == 2:
+            # both said go, the count starts again
+            self._said_go = set()
+            self._sequence = []
+
+    def opponent_said_go(self) -> bool:
+        return any(name != self.name for name in self._said_go)
+
+    def unseen_cards(self) -> List[Card]:
+        """Cards the opponent can still hold."""
+        seen = set(self._dealt) | set(self._opponent_played)
+        if self._starter is not None:
+            seen.add(self._starter)
+        cards = [c for c in get_full_deck() if c not in seen]
+        if self._opponent_min_go_count is not None:
+            # they said go, so none of the cards they still hold fitted under 31 then
+            cards = [c for c in cards if c.get_value() > 31 - self._opponent_min_go_count]
+        return cards
+
+    def sample_opponent_hands(self, n_samples: int) -> List[List[Card]]:
+        n_cards = HAND_SIZE - len(self._opponent_played)
+        if n_cards <= 0:
+            return [[]]
+        if self._opponent_model is not None:
+            return self._opponent_model.sample_hands(n_samples, self._rng)
+        pool = self.unseen_cards()
+        if len(pool) < n_cards:
+            # the go inference ruled out too much (the opponent cannot be trusted to play when able)
+            logger.debug("Only %d cards fit the opponent's goes, sampling from every unseen card.", len(pool))
+            self._opponent_min_go_count = None
+            pool = self.unseen_cards()
+        return [self._rng.sample(pool, n_cards) for _ in range(n_samples)]
+
+    def select_card_to_play(self, hand: List[Card], table, count: int, crib=None):
+        playable = [c for c in hand if c + count <= 31]
+        if len(playable) <= 1:
+            return playable[0] if playable else None
+        samples = self.sample_opponent_hands(self.max_samples)
+        other_said_go = self.opponent_said_go()
+        totals, n_solved = self._evaluate(hand, samples, table, other_said_go)
+        logger.debug("%s solved %d opponent hands: %s", self.name, n_solved, totals)
+        # ties go to the first playable card in hand order
+        return max(playable, key=lambda c: totals.get(c, float("-inf")))
+
+    def _evaluate(self, hand, samples, table, other_said_go) -> Tuple[Dict[Card, int], int]:
+        if self.max_workers == 1 or len(samples) == 1:
+            return evaluate_samples(hand, samples, table, other_said_go, self.time_budget)
+        batches = [samples[i::self.max_workers] for i in range(self.max_workers)]
+        futures = [self.pool.executor.submit(evaluate_samples, hand, batch, table, other_said_go, self.time_budget)
+                   for batch in batches if batch]
+        totals: Dict[Card, int] = {}
+        n_solved = 0
+        for future in futures:
+            batch_totals, batch_solved = future.result()
+            for card, value in batch_totals.items():
+                totals[card] = totals.get(card, 0) + value
+            n_solved += batch_solved
+        return totals, n_solved
@@ -15,6 +15,10 @@ class RandomPlayer(BasePlayer):
     def reset_rng(self):
         self._rng = random.Random(self.seed)
 
+    def reset_for_game(self, seed=None):
+        # a seeded game's player stream takes over from the player's own seed
+        self._rng = random.Random(self.seed if seed is None else seed)
+
     def select_crib_cards(self, hand: List[Card], dealer_is_self: bool, your_score: int = 0, opponent_score: int = 0) -> Tuple[Card, Card]:        
         return tuple(self._rng.sample(hand, 2))  # type: ignore
 
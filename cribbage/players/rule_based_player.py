@@ -3,6 +3,7 @@ from logging import getLogger
 from cribbage.players.base_player import BasePlayer
 from cribbage.playingcards import Card
 from cribbage.cribbagegame import score_hand, score_play as score_play
+from cribbage.fast_scoring import crib_deal_codes, score_hands_batch
 from cribbage.playingcards import Deck
 from itertools import combinations
 
@@ -147,24 +148,11 @@ def expected_crib_score(
       - all possible opponent discards (2 from remaining deck),
       - all possible starters consistent with known_hand + those discards.
     """
-    ev = 0.0
     pool = remaining_deck(full_deck, known_hand)
-    n = len(pool)
-    if n < 2:
+    if len(pool) < 3:
+        # no starter is left once the opponent has discarded
         return 0.0
-
-    total_opp = comb(n, 2)
-    p_opp = 1.0 / total_opp
-
-    for opp_discards in combinations(pool, 2):
-        crib = list(discards) + list(opp_discards)
-        # starter cannot be in known_hand or in opp_discards
-        starter_pool = remaining_deck(full_deck, list(known_hand) + list(opp_discards))
-        if not starter_pool:
-            continue
-        p_starter = 1.0 / len(starter_pool)
-        for starter in starter_pool:
-            s = score_hand(crib + [starter], is_crib=True)
-            ev += p_opp * p_starter * s
-
+    # starter cannot be in known_hand or in opp_discards, each (opp_discards, starter) is equally likely
+    cribs = crib_deal_codes([c.to_index() for c in discards], [c.to_index() for c in pool])
+    ev = float(score_hands_batch(cribs, is_crib=True).mean())
     return ev if dealer_is_self else -ev
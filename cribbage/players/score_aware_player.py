@@ -0,0 +1,150 @@
+"""A player that plays for the win near 121 instead of for points."""
+import logging
+from math import comb
+from typing import List, Optional
+
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import Card
+from cribbage.scoring import PeggingSequence
+from cribbage.strategies.hand_strategies import ENDGAME_SCORE, win_probability_discard
+from cribbage.win_table import WINNING_SCORE, get_win_table
+
+logger = logging.getLogger(__name__)
+
+HAND_SIZE = 4
+
+
+def play_points(sequence: PeggingSequence, card: Card) -> int:
+    """Points ``card`` pegs on ``sequence``, with the 1 for 31."""
+    return sequence.preview(card)[0] + (sequence.count + card.get_value() == 31)
+
+
+class ScoreAwarePlayer(MediumPlayer):
+    """``MediumPlayer`` until either player reaches ``ENDGAME_SCORE``, then plays to win.
+
+    Endgame discards maximise the chance to win from the win table (``win_probability_discard``).
+    Endgame pegging keeps the score from the round's events; it plays a card that pegs out
+    when it has one, and otherwise the card least likely to let the opponent peg out on their
+    reply, given the cards they can still hold, keeping ``MediumPlayer``'s choice among equals.
+    Without a built win table it plays exactly like ``MediumPlayer``.
+    """
+    version = "1"
+
+    def __init__(self, name: str = "score_aware"):
+        super().__init__(name=name)
+        self.reset_for_game()
+
+    def reset_for_game(self, seed=None):
+        self._scores = {"self": 0, "opponent": 0}
+        self._next_dealer_is_self: Optional[bool] = None
+        self._dealer_is_self: Optional[bool] = None
+        self._heels_pending = False
+        self._dealt: List[Card] = []
+        self._seen: List[Card] = []
+        self._opponent_cards_played = 0
+        self._sequence = PeggingSequence()
+        self._said_go: List[str] = []
+        self._cards_played = 0
+
+    @property
+    def your_score(self) -> int:
+        return self._scores["self"]
+
+    @property
+    def opponent_score(self) -> int:
+        return self._scores["opponent"]
+
+    def in_endgame(self) -> bool:
+        return get_win_table() is not None and max(self.your_score, self.opponent_score) >= ENDGAME_SCORE
+
+    def _peg(self, player_name: str, points: int):
+        self._scores["self" if player_name == self.name else "opponent"] += points
+
+    def _set_dealer(self, dealer_is_self: bool):
+        # rounds dealt without asking me to discard (benchmark harnesses) learn the dealer from who leads
+        if self._dealer_is_self is None:
+            self._dealer_is_self = dealer_is_self
+        self._score_heels()
+
+    def _score_heels(self):
+        if self._heels_pending and self._dealer_is_self is not None:
+            self._heels_pending = False
+            self._scores["self" if self._dealer_is_self else "opponent"] += 2
+
+    def select_crib_cards(self, hand, dealer_is_self, your_score=None, opponent_score=None):
+        self._scores = {"self": your_score or 0, "opponent": opponent_score or 0}
+        self._next_dealer_is_self = dealer_is_self
+        if self.in_endgame():
+            return win_probability_discard(hand, dealer_is_self, self.your_score, self.opponent_score)
+        return super().select_crib_cards(hand, dealer_is_self, your_score, opponent_score)
+
+    def observe_deal(self, hand, discards):
+        self._dealer_is_self, self._next_dealer_is_self = self._next_dealer_is_self, None
+        self._heels_pending = False
+        self._dealt = list(hand)
+        self._seen = []
+        self._opponent_cards_played = 0
+        self._sequence = PeggingSequence()
+        self._said_go = []
+        self._cards_played = 0
+
+    def observe_starter(self, starter):
+        self._seen.append(starter)
+        if starter.rank == "j":
+            self._heels_pending = True
+            self._score_heels()
+
+    def observe_play(self, player_name, card, count):
+        # the pone acts first
+        self._set_dealer(player_name != self.name)
+        if card is None:
+            self._said_go.append(player_name)
+            if len(self._said_go) == 2:
+                # the last player to say go played last
+                self._peg(self._said_go[-1], 1)
+                self._said_go = []
+                self._sequence = PeggingSequence()
+            return
+        self._peg(player_name, play_points(self._sequence, card))
+        self._sequence.push(card)
+        self._seen.append(card)
+        self._cards_played += 1
+        if player_name != self.name:
+            self._opponent_cards_played += 1
+        if self._cards_played == 2 * HAND_SIZE:
+            self._peg(player_name, 1)  # last card
+
+    def opponent_unseen_cards(self) -> List[Card]:
+        """Cards the opponent can still hold."""
+        seen = set(self._dealt) | set(self._seen)
+        return [c for c in get_full_deck() if c not in seen]
+
+    def opponent_pegs_out_chance(self, table, card: Card) -> float:
+        """Chance the opponent holds a reply to ``card`` that pegs out."""
+        n_cards = HAND_SIZE - self._opponent_cards_played
+        if n_cards <= 0:
+            return 0.0
+        needed = WINNING_SCORE - self.opponent_score
+        sequence = PeggingSequence([*table, card])
+        pool = self.opponent_unseen_cards()
+        winning = sum(1 for reply in pool if sequence.count + reply.get_value() <= 31 and play_points(sequence, reply) >= needed)
+        return 1 - comb(len(pool) - winning, n_cards) / comb(len(pool), n_cards)
+
+    def select_card_to_play(self, hand: List[Card], table, count: int, crib=None) -> Optional[Card]:
+        self._set_dealer(False)  # only unknown when I lead the round
+        choice = super().select_card_to_play(hand, table, count, crib)
+        playable = [c for c in hand if c + count <= 31]
+        if len(playable) <= 1 or not self.in_endgame():
+            return choice
+        sequence = PeggingSequence(table)
+        points = {c: play_points(sequence, c) for c in playable}
+        best_points = max(points.values())
+        if self.your_score + best_points >= WINNING_SCORE:
+            return next(c for c in playable if points[c] == best_points)
+        risks = {c: self.opponent_pegs_out_chance(table, c) for c in playable}
+        safest = min(risks.values())
+        if risks[choice] > safest:
+            logger.debug("%s avoids %s, the opponent pegs out with chance %.3f", self.name, choice, risks[choice])
+            return max((c for c in playable if risks[c] == safest), key=lambda c: points[c])
+        return choice
@@ -1,4 +1,5 @@
 import random
+from array import array
 from typing import List
 
 
@@ -62,22 +63,55 @@ class Hand:
         return set(self.cards) == set(other.cards)        
 
 class Card:
-    def __init__(self, rank_and_suit):
+    """A playing card, e.g. ``Card('10h')``.
+
+    Cards are interned: there is one shared, immutable instance per card, so ``Card('5h')``,
+    ``Card.from_index(4)`` and every deck all return the same object and cards compare by identity.
+    """
+    __slots__ = ('rank', 'suit', 'value', 'tupl', 'rank_order', '_index', '_hash')
+
+    def __new__(cls, rank_and_suit):
+        card = _CARDS_BY_STR.get(rank_and_suit)
+        if card is not None:
+            return card
         # Support both single and double character ranks (e.g., '10h')
-        if len(rank_and_suit) == 3:
-            self.rank = rank_and_suit[:2]
-            self.suit = rank_and_suit[2]
-        else:
-            self.rank = rank_and_suit[0]
-            self.suit = rank_and_suit[1]
-        if self.rank not in rank_name_map:
+        rank = rank_and_suit[:2] if len(rank_and_suit) == 3 else rank_and_suit[0]
+        if rank not in rank_name_map:
             raise ValueError("Card is created with rank then suit, passed in suit first")
-        self.value = value_map.get(self.rank.lower(), int(self.rank) if self.rank.isdigit() else None)
-        self.tupl = (self.rank, self.suit)
-        self.rank_order = rank_order_map[self.rank.lower()]
+        raise ValueError(f"Unknown suit in card {rank_and_suit!r}")
+
+    @classmethod
+    def _make(cls, rank, suit):
+        # only used to build the interned card table
+        card = object.__new__(cls)
+        init = object.__setattr__
+        init(card, 'rank', rank)
+        init(card, 'suit', suit)
+        init(card, 'value', value_map.get(rank, int(rank) if rank.isdigit() else None))
+        init(card, 'tupl', (rank, suit))
+        init(card, 'rank_order', rank_order_map[rank])
+        init(card, '_index', SUIT_TO_I[suit] * 13 + RANK_TO_I[rank])
+        init(card, '_hash', card._index)
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # unpickles to the interned instance
+        return (Card, (str(self),))
 
     def __hash__(self):
-        return hash(self.tupl)
+        return self._hash
 
     def __add__(self, other):
         if isinstance(other, Card):
@@ -111,18 +145,15 @@ class Card:
 
     def __eq__(self, other):
         if type(other) == Card:
-            # Cards are equal only if both rank and suit match
-            return (
-                self.rank == other.rank and
-                self.suit == other.suit
-            )
+            # Cards are interned, so equal rank and suit means the same object
+            return self is other
         elif type(other) == int:
             return self.value == other
         return NotImplemented
 
     def get_value(self):
         # Return the value of the card (face cards 10, ace 1, others as int)
-        return value_map.get(self.rank.lower(), int(self.rank) if self.rank.isdigit() else None)
+        return self.value
 
     def get_suit(self):
         return self.suit
@@ -131,34 +162,82 @@ class Card:
         return self.rank
     
     def to_index(self) -> int:
-        return SUIT_TO_I[self.suit] * 13 + RANK_TO_I[self.rank]
+        return self._index
+
+    @classmethod
+    def from_index(cls, index: int) -> 'Card':
+        # inverse of to_index
+        return _CARDS_BY_INDEX[index]
 
 
 
 class Deck:
+    """Shuffled deck of the interned cards.
+
+    The order is kept as a preallocated array of card codes read circularly from an offset, so
+    drawing and cutting a full deck only move pointers and ``reset`` reuses the same storage for
+    the next deal. Seeded shuffles give exactly the same order as shuffling a list of cards with
+    ``random.Random(seed)``.
+    """
     RANKS = ['a','2','3','4','5','6','7','8','9','10','j','q','k']
     SUITS = ['h','d','c','s']  # hearts, diamonds, clubs, spades
+    N_CARDS = 52
 
     def __init__(self, seed: int | None = None):
         self._rng = random.Random(seed)
-        self.cards = [Card(f"{r}{s}") for r in self.RANKS for s in self.SUITS]
+        self._codes = array('B', _NEW_DECK_CODES)
+        self._scratch = array('B', _NEW_DECK_CODES)  # reused when cutting a partial deck
+        self._start = 0  # position of the bottom card in _codes
+        self._n = self.N_CARDS  # cards left, the top card is the last one
+        self.shuffle()
+
+    def reset(self, seed: int | None = None):
+        """Put every card back and shuffle, the same as ``Deck(seed=seed)`` without allocating."""
+        self._rng.seed(seed)
+        self._codes[:] = _NEW_DECK_CODES
+        self._start = 0
+        self._n = self.N_CARDS
         self.shuffle()
 
+    @property
+    def cards(self) -> List[Card]:
+        """Cards left in the deck, bottom first (the next card drawn is last)."""
+        return [_CARDS_BY_INDEX[self._codes[(self._start + i) % self.N_CARDS]] for i in range(self._n)]
+
     def __len__(self):
-        return len(self.cards)
+        return self._n
 
     def draw(self):
-        return self.cards.pop() if self.cards else None
+        if not self._n:
+            return None
+        self._n -= 1
+        return _CARDS_BY_INDEX[self._codes[(self._start + self._n) % self.N_CARDS]]
+
+    def _move_to_front(self, cut_point=0):
+        # lay the remaining cards out from position 0, starting at cut_point
+        codes, scratch, n = self._codes, self._scratch, self._n
+        for i in range(n):
+            scratch[i] = codes[(self._start + (cut_point + i) % n) % self.N_CARDS]
+        self._codes, self._scratch = scratch, codes
+        self._start = 0
 
     def shuffle(self):
-        self._rng.shuffle(self.cards)
+        if self._start:
+            self._move_to_front()
+        if self._n == self.N_CARDS:
+            self._rng.shuffle(self._codes)
+        else:
+            self._rng.shuffle(memoryview(self._codes)[:self._n])
 
     def cut(self, cut_point=None):
-        len_precut = len(self.cards)
+        len_precut = self._n
         if cut_point is None:
-            cut_point = self._rng.randrange(len(self.cards))
-        self.cards = self.cards[cut_point:] + self.cards[:cut_point]
-        assert len(self.cards) == len_precut, "Cards lost in cut."
+            cut_point = self._rng.randrange(self._n)
+        if self._n == self.N_CARDS:
+            self._start = (self._start + cut_point) % self.N_CARDS
+        elif cut_point:
+            self._move_to_front(cut_point)
+        assert self._n == len_precut, "Cards lost in cut."
 
     def to_index(self) -> int:
         return SUIT_TO_I[self.suit] * 13 + RANK_TO_I[self.rank]
@@ -187,4 +266,10 @@ def build_hand(card_str_list: List[str] | str) -> List[Card]:
     return hand_list    
 
 RANK_TO_I = {r:i for i,r in enumerate(Deck.RANKS)}
-SUIT_TO_I = {s:i for i,s in enumerate(Deck.SUITS)}
\ No newline at end of file
+SUIT_TO_I = {s:i for i,s in enumerate(Deck.SUITS)}
+
+# interned cards, one per to_index() code
+_CARDS_BY_STR = {}
+_CARDS_BY_INDEX = tuple(Card._make(r, s) for s in Deck.SUITS for r in Deck.RANKS)
+_CARDS_BY_STR.update((str(c), c) for c in _CARDS_BY_INDEX)
+_NEW_DECK_CODES = array('B', (_CARDS_BY_STR[f"{r}{s}"].to_index() for r in Deck.RANKS for s in Deck.SUITS))
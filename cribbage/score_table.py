@@ -0,0 +1,160 @@
+"""Precomputed hand and crib scores for every 4 card hand + starter.
+
+The table is a flat binary file: a small header followed by a uint8 array of shape
+(C(52, 5), 5, 2). The first axis is the combinatorial number system (colex) rank of the
+5 sorted card codes, the second axis is the position of the starter within those sorted
+codes and the last axis is [hand score, crib score]. It is opened with ``numpy.memmap``
+so loading is near instant and only the pages that are looked up are read from disk.
+
+Build it with ``python scripts/build_score_table.py``.
+"""
+import itertools
+import logging
+import random
+import zlib
+from math import comb
+from typing import Optional, Sequence
+
+import numpy as np
+
+from cribbage.constants import SCORE_TABLE_PATH
+from cribbage.fast_scoring import CODE_BITS, CODE_RANK, CODE_SUIT, JACK_RANK_I, RANK_SCORE_TABLE, score_hand_codes
+from cribbage.scoring import score_hand
+from cribbage.table_file import HEADER_SIZE, LazyTable, TableFile, TableFileError
+
+logger = logging.getLogger(__name__)
+
+SCORE_TABLE_VERSION = 1
+SCORE_TABLE_MAGIC = b"CRIBSCR\0"
+N_CARDS = 52
+N_COMBINATIONS = comb(N_CARDS, 5)
+HAND_COL = 0
+CRIB_COL = 1
+
+# BINOM[n][k] = C(n, k), used to rank sorted combinations of up to 6 cards (a full deal)
+BINOM = [[comb(n, k) for k in range(7)] for n in range(N_CARDS + 1)]
+
+
+class ScoreTableError(TableFileError):
+    pass
+
+
+# header fields: number of combinations, cards per combination, crc32 of the data
+SCORE_TABLE_FILE = TableFile("score table", SCORE_TABLE_MAGIC, SCORE_TABLE_VERSION, 3, ScoreTableError)
+
+
+def combination_rank(sorted_codes: Sequence[int]) -> int:
+    """Colex rank of a sorted combination of card codes."""
+    rank = 0
+    for i, code in enumerate(sorted_codes):
+        rank += BINOM[code][i + 1]
+    return rank
+
+
+def combination_ranks(sorted_codes: np.ndarray) -> np.ndarray:
+    """Vectorized ``combination_rank`` for an (N, k) array of sorted codes."""
+    binom = np.array(BINOM, dtype=np.int64)
+    ranks = np.zeros(len(sorted_codes), dtype=np.int64)
+    for i in range(sorted_codes.shape[1]):
+        ranks += binom[sorted_codes[:, i], i + 1]
+    return ranks
+
+
+def compute_score_array() -> np.ndarray:
+    """Score every 4 card hand + starter, returns a (C(52, 5), 5, 2) uint8 array."""
+    combos = np.fromiter(
+        itertools.chain.from_iterable(itertools.combinations(range(N_CARDS), 5)),
+        dtype=np.int8, count=N_COMBINATIONS * 5,
+    ).reshape(N_COMBINATIONS, 5)
+    ranks = combination_ranks(combos)
+    code_bits = np.array(CODE_BITS, dtype=np.int64)
+    keys = code_bits[combos].sum(axis=1)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    base = np.array([RANK_SCORE_TABLE[int(k)] for k in unique_keys], dtype=np.int64)[inverse]
+    suits = np.array(CODE_SUIT, dtype=np.int64)[combos]
+    is_jack = np.array(CODE_RANK, dtype=np.int64)[combos] == JACK_RANK_I
+
+    scores = np.zeros((N_COMBINATIONS, 5, 2), dtype=np.uint8)
+    for pos in range(5):
+        others = [i for i in range(5) if i != pos]
+        starter_suit = suits[:, pos]
+        hand_suits = suits[:, others]
+        flush = (hand_suits == hand_suits[:, :1]).all(axis=1)
+        starter_match = hand_suits[:, 0] == starter_suit
+        nobs = (is_jack[:, others] & (hand_suits == starter_suit[:, None])).any(axis=1)
+        hand = base + flush * (4 + starter_match) + nobs
+        crib = base + (flush & starter_match) * 5 + nobs
+        scores[ranks, pos, HAND_COL] = hand
+        scores[ranks, pos, CRIB_COL] = crib
+    return scores
+
+
+class ScoreTable:
+    """Read only view over a score table file."""
+
+    def __init__(self, path: str, verify: bool = False):
+        self.path = path
+        n_combinations, n_cards, crc = SCORE_TABLE_FILE.read_header(path)
+        if n_combinations != N_COMBINATIONS or n_cards != 5:
+            raise ScoreTableError(f"{path} has an unexpected shape")
+        SCORE_TABLE_FILE.check_size(path, N_COMBINATIONS * 5 * 2)
+        self.crc = crc
+        self.scores = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=(N_COMBINATIONS, 5, 2))
+        if verify:
+            self.verify()
+
+    def index(self, hand_codes: Sequence[int], starter_code: int):
+        five = sorted((*hand_codes, starter_code))
+        return combination_rank(five), five.index(starter_code)
+
+    def score(self, hand_codes: Sequence[int], starter_code: int, is_crib: bool = False) -> int:
+        """Score of a 4 card hand (or crib) with the given starter."""
+        rank, pos = self.index(hand_codes, starter_code)
+        return int(self.scores[rank, pos, CRIB_COL if is_crib else HAND_COL])
+
+    def verify(self, n_samples: int = 2000, seed: int = 0):
+        """Check the checksum and compare random entries against the integer scorer."""
+        if zlib.crc32(self.scores) != self.crc:
+            raise ScoreTableError(f"{self.path} failed its checksum")
+        rng = random.Random(seed)
+        for _ in range(n_samples):
+            codes = rng.sample(range(N_CARDS), 5)
+            for is_crib in (False, True):
+                expected = score_hand_codes(codes[:4], codes[4], is_crib=is_crib)
+                if self.score(codes[:4], codes[4], is_crib=is_crib) != expected:
+                    raise ScoreTableError(f"{self.path} has a wrong score for {codes}")
+
+
+def build_score_table(path: str = SCORE_TABLE_PATH) -> ScoreTable:
+    """Compute every score, write the table file and return it verified."""
+    scores = compute_score_array()
+    SCORE_TABLE_FILE.write(path, (N_COMBINATIONS, 5), [scores])
+    _SCORE_TABLE.reset()
+    return ScoreTable(path, verify=True)
+
+
+_SCORE_TABLE = LazyTable(lambda: ScoreTable(SCORE_TABLE_PATH), "Score table not available, scoring hands directly")
+
+
+def get_score_table() -> Optional[ScoreTable]:
+    """Lazily open the shared score table, None if it has not been built."""
+    return _SCORE_TABLE.get()
+
+
+def lookup_hand_score(cards, is_crib: bool = False, starter_card=None) -> int:
+    """Score a hand from the table when possible, otherwise with ``scoring.score_hand``.
+
+    Takes the same arguments as ``scoring.score_hand`` (a 5 card list without a starter
+    treats the last card as the starter).
+    """
+    if len(cards) == 5 and starter_card is None:
+        starter_card = cards[-1]
+        cards = cards[:-1]
+    table = get_score_table()
+    if table is not None and starter_card is not None and len(cards) == 4:
+        hand_codes = [c.to_index() for c in cards]
+        starter_code = starter_card.to_index()
+        # the table only holds combinations of 5 distinct cards
+        if len({*hand_codes, starter_code}) == 5:
+            return table.score(hand_codes, starter_code, is_crib=is_crib)
+    return score_hand(cards, is_crib=is_crib, starter_card=starter_card)
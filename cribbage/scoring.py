@@ -3,6 +3,7 @@ from calendar import c
 from itertools import combinations
 from abc import ABCMeta, abstractmethod
 from logging import getLogger
+from cribbage.fast_scoring import score_hand_codes
 logger = getLogger(__name__)
 
 class ScoreCondition(metaclass=ABCMeta):
@@ -247,13 +248,90 @@ def score_play(card_seq):
     return score, description
 
 
-def score_hand(cards, is_crib: bool = False, starter_card=None):
+class PeggingSequence:
+    """Incremental scorer for the active pegging sequence (cards played since the last reset).
+
+    Keeps the running count, the rank and multiplicity of the trailing same-rank cards and the
+    ranks of the longest trailing window without a repeated rank. Only that window can hold a
+    run, and it never has more than 13 cards, so scoring a card does not depend on how long the
+    sequence is. Scores and descriptions match ``score_play``.
+    """
+    PAIR_POINTS = (0, 0, 2, 6, 12)
+    PAIR_DESCRIPTIONS = ("", "", "Pair (%s)", "Pair Royal (%s)", "Double Pair Royal (%s)")
+
+    def __init__(self, cards=()):
+        self.reset()
+        for card in cards:
+            self.push(card)
+
+    def reset(self):
+        """Start a new sequence (after a go or 31)."""
+        self.cards = []
+        self.count = 0
+        self._same_rank = None
+        self._same_count = 0
+        self._tail_ranks = []  # rank orders of the trailing window without repeats, oldest first
+
+    def __len__(self):
+        return len(self.cards)
+
+    def _run_length(self, rank_order: int) -> int:
+        mask = 1 << rank_order
+        run = 0
+        for length, tail_rank in enumerate(reversed(self._tail_ranks), 2):
+            if tail_rank == rank_order:
+                break
+            mask |= 1 << tail_rank
+            if length >= 3:
+                lowest = mask >> ((mask & -mask).bit_length() - 1)
+                if lowest & (lowest + 1) == 0:
+                    run = length
+        return run
+
+    def preview(self, card):
+        """Return (points, description) ``card`` would score if played now, without playing it."""
+        score = 0
+        descriptions = []
+        if self.count + card.get_value() == 15:
+            score += 2
+            descriptions.append("15 count")
+        same = min(self._same_count + 1, 4) if card.rank_order == self._same_rank else 1
+        if same > 1:
+            score += self.PAIR_POINTS[same]
+            descriptions.append(self.PAIR_DESCRIPTIONS[same] % card.rank)
+        run = self._run_length(card.rank_order)
+        if run:
+            score += run
+            descriptions.append("%d-card straight" % run)
+        return score, ", ".join(descriptions)
+
+    def push(self, card):
+        """Play ``card`` onto the sequence and return the (points, description) it scored."""
+        score, description = self.preview(card)
+        if description:
+            logger.debug("[SCORE] " + description)
+        rank_order = card.rank_order
+        if rank_order == self._same_rank:
+            self._same_count += 1
+        else:
+            self._same_rank, self._same_count = rank_order, 1
+        if rank_order in self._tail_ranks:
+            del self._tail_ranks[:self._tail_ranks.index(rank_order) + 1]
+        self._tail_ranks.append(rank_order)
+        self.cards.append(card)
+        self.count += card.get_value()
+        return score, description
+
+
+def score_hand(cards, is_crib: bool = False, starter_card=None, describe: bool = False):
     """Score a hand at the end of a round.
 
+    Uses the integer-encoded scorer; ``describe`` runs every ScoreCondition instead, logging
+    each description.
+
     :param cards: Cards in a single player's hand.
     :return: Points earned by player.
     """
-    score = 0
     if len(cards) == 5 and starter_card is None:
         # Assume last card is starter if not provided
         starter_card = cards[-1]
@@ -261,6 +339,18 @@ def score_hand(cards, is_crib: bool = False, starter_card=None):
     if starter_card in cards:
         # Exclude starter for flush check
         cards = [c for c in cards if c != starter_card]
+    if len(cards) <= 4 and not describe:
+        codes = [c.to_index() for c in cards]
+        starter_code = starter_card.to_index() if starter_card is not None else None
+        # repeated cards (e.g. mocked suits) keep the ScoreCondition semantics
+        if len(set(codes)) == len(codes):
+            return score_hand_codes(codes, starter_code, is_crib=is_crib)
+    return _score_hand_conditions(cards, is_crib=is_crib, starter_card=starter_card)
+
+
+def _score_hand_conditions(cards, is_crib: bool = False, starter_card=None):
+    """Score a hand by running every ScoreCondition, logging each description."""
+    score = 0
     score_scenarios = [CountCombinationsEqualToN(n=15), JackMatchStarterSuitScorer(),
                         HasPairs_InHand(), HasStraight_InHand(), HasFlush(is_crib=is_crib)]
     for scenario in score_scenarios:
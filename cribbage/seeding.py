@@ -0,0 +1,39 @@
+"""Reproducible random streams for batches of games, in the style of numpy.random.SeedSequence.
+
+Game ``i`` of a batch seeded with ``seed`` is seeded with ``game_seed(seed, i)``. Inside a
+game the dealer schedule, each seat's player RNG and each round's deck shuffle and cut get
+their own child stream of the game seed, so no two share a sequence, shards of a batch can
+be played anywhere and merged, and any single game can be replayed from its game seed.
+"""
+import numpy as np
+
+_SCHEDULE, _PLAYERS, _ROUNDS = range(3)
+
+
+def _derive(seed, spawn_key, n):
+    """``n`` 64-bit seeds from the child ``spawn_key`` of ``seed``."""
+    state = np.random.SeedSequence(seed, spawn_key=spawn_key).generate_state(2 * n, np.uint32)
+    return [int(s) for s in state.view(np.uint64)]
+
+
+def game_seed(seed, game_index):
+    """Seed for game ``game_index`` of a batch; unseeded batches stay unseeded."""
+    if seed is None:
+        return None
+    return _derive(seed, (game_index,), 1)[0]
+
+
+def schedule_seed(seed):
+    """Seed for a game's dealer schedule."""
+    return _derive(seed, (_SCHEDULE,), 1)[0]
+
+
+def player_seeds(seed, n_players):
+    """Per-seat seeds for the players' own randomness in a game."""
+    return _derive(seed, (_PLAYERS,), n_players)
+
+
+def round_seeds(seed, round_index):
+    """(deck_seed, cut_seed) for round ``round_index`` of a game."""
+    deck_seed, cut_seed = _derive(seed, (_ROUNDS, round_index), 2)
+    return deck_seed, cut_seed
@@ -10,9 +10,9 @@ from typing import List, Dict, Optional
 from cribbage import scoring
 
 class RoundState:
-    def __init__(self, game, dealer, seed: int | None = None):
+    def __init__(self, game, dealer, seed: int | None = None, deck: Deck | None = None):
         self._rng = random.Random(seed)
-        self.deck = Deck(seed=seed)
+        self.deck = deck if deck is not None else Deck(seed=seed)
         self.game_winner = None
         self.game = game
         self.hands = {player: [] for player in self.game.players}
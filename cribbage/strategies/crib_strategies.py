@@ -2,13 +2,15 @@
 from collections import defaultdict
 import itertools
 import math
-from cribbage.database import normalize_hand_to_str, normalize_hand_to_tuple
+from cribbage.database import normalize_hand_to_str
+from cribbage.fast_scoring import (CODE_RANK, CODE_SUIT, JACK_RANK_I, N_RANKS, N_SUITS, RANK_BITS, RANK_SCORE_TABLE,
+                                   crib_deal_codes, rank_histogram_key, score_hand_codes, score_hands_batch)
 from cribbage.players.rule_based_player import get_full_deck
 from cribbage.scoring import score_hand
+from cribbage.score_table import lookup_hand_score
 from itertools import combinations
 from typing import List, Tuple
 from cribbage.playingcards import Card
-import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,7 @@ def basic_crib_strategy(hand: List[Card], dealer_is_self: bool) -> Tuple[Card, C
     """
     best_discards: List[Tuple[Card, Card]] = []
     best_score = float("-inf")
-    df = pd.DataFrame(columns=["kept", "discarded", "kept_score", "crib_score", "total_score"])    
+    rows = []
 
     for kept in combinations(hand, 4):  # all 6-choose-4 possible hands
         kept = list(kept)
@@ -33,159 +35,104 @@ def basic_crib_strategy(hand: List[Card], dealer_is_self: bool) -> Tuple[Card, C
 
         # if you want to actually use dealer_is_self:
         score = kept_score + crib_score if dealer_is_self else kept_score - crib_score
-        df_new = pd.DataFrame({"kept": [kept],
-                "discarded": [discards],
-                "kept_score": [kept_score],
-                "crib_score": [crib_score],
-                "total_score": [score]
-                })
-        df = pd.concat([df, df_new], ignore_index=True)
+        rows.append((kept, discards, kept_score, crib_score, score))
         if score > best_score:
             best_score = score
             best_discards = [tuple(discards)]
         elif score == best_score:
             best_discards.append(tuple(discards))
 
-    df = df.sort_values(by="total_score", ascending=False)
-    logger.debug("Beginner player discard logic\n" + df.to_string())
+    if logger.isEnabledFor(logging.DEBUG):
+        rows.sort(key=lambda row: row[4], reverse=True)
+        logger.debug("Beginner player discard logic\n" + "\n".join(
+            "kept=%s discarded=%s kept_score=%d crib_score=%d total_score=%d" % row for row in rows))
     return best_discards[0]  # type: ignore
 
 
-def calc_crib_ranges_exact_and_slow(rank_list, starter_pool, suits_list, discarded_cards, crib_score_cache):
-    """
-    Calculate expected crib score by considering all possible opponent discards and starters.
-    We need to average over all possible suit combinations for each rank partition.
+def calc_crib_ranges_exact(discarded_cards, starter_pool):
     """
-    # Build mapping of which suits are available for each rank
-    rank_to_cards = {r: [] for r in rank_list}
-    for c in starter_pool:
-        rank_to_cards[c.rank].append(c)
+    Exact (min, mean) crib score for a 2 card discard in closed form.
 
+    Fifteens, pairs and runs only depend on ranks, so the opponent's 2 discards and the starter
+    are enumerated as rank multisets (at most 91 * 13) weighted by how many cards of each rank
+    are left in the pool. Flush and nobs are counted analytically from the suit counts of the
+    pool. Matches calc_crib_ranges_exact_and_slow without scoring the 45k individual cribs.
+    """
+    discard_codes = [c.to_index() for c in discarded_cards]
+    pool_codes = [c.to_index() for c in starter_pool]
+    n_pool = len(pool_codes)
     # Total ways = C(46, 2) * 44 for choosing 2 opponent discards and 1 starter
-    total_ways = math.comb(len(starter_pool), 2) * (len(starter_pool) - 2)
-    total_score_sum = 0.0
+    total_ways = math.comb(n_pool, 2) * (n_pool - 2)
+    if total_ways <= 0:
+        return float('inf'), 0.0
+    pool_by_rank = [[] for _ in range(N_RANKS)]
+    suit_counts = [0] * N_SUITS
+    for c in pool_codes:
+        pool_by_rank[CODE_RANK[c]].append(c)
+        suit_counts[CODE_SUIT[c]] += 1
+    avail = [len(cards) for cards in pool_by_rank]
+
+    # fifteens, pairs and runs, weighted by the number of cards matching each rank multiset
+    discard_key = rank_histogram_key(discard_codes)
+    total_score_sum = 0
+    rank_combos = []
+    for r1 in range(N_RANKS):
+        if not avail[r1]:
+            continue
+        for r2 in range(r1, N_RANKS):
+            opp_ways = math.comb(avail[r1], 2) if r1 == r2 else avail[r1] * avail[r2]
+            if not opp_ways:
+                continue
+            opp_key = discard_key + RANK_BITS[r1] + RANK_BITS[r2]
+            for rs in range(N_RANKS):
+                starter_ways = avail[rs] - (rs == r1) - (rs == r2)
+                if starter_ways <= 0:
+                    continue
+                score = RANK_SCORE_TABLE[opp_key + RANK_BITS[rs]]
+                total_score_sum += opp_ways * starter_ways * score
+                rank_combos.append((score, r1, r2, rs))
+
+    # crib flush: both discards, both opponent discards and the starter share a suit
+    if CODE_SUIT[discard_codes[0]] == CODE_SUIT[discard_codes[1]]:
+        m = suit_counts[CODE_SUIT[discard_codes[0]]]
+        total_score_sum += 5 * math.comb(m, 2) * max(m - 2, 0)
+    # nobs: a jack in the crib with the starter's suit
+    for c in discard_codes:
+        if CODE_RANK[c] == JACK_RANK_I:
+            # any starter of the suit, opponent discards from the other n_pool - 1 cards
+            total_score_sum += suit_counts[CODE_SUIT[c]] * math.comb(n_pool - 1, 2)
+    for c in pool_codes:
+        if CODE_RANK[c] == JACK_RANK_I:
+            # opponent discards the jack and any other card, starter is another card of the suit
+            total_score_sum += (n_pool - 2) * (suit_counts[CODE_SUIT[c]] - 1)
+
+    # the minimum only needs suits checked for rank multisets that could still beat it
     min_crib = float('inf')
+    for score, r1, r2, rs in sorted(rank_combos):
+        if score >= min_crib:
+            break
+        if r1 == r2:
+            opp_pairs = itertools.combinations(pool_by_rank[r1], 2)
+        else:
+            opp_pairs = itertools.product(pool_by_rank[r1], pool_by_rank[r2])
+        for o1, o2 in opp_pairs:
+            for starter in pool_by_rank[rs]:
+                if starter != o1 and starter != o2:
+                    min_crib = min(min_crib, score_hand_codes(discard_codes + [o1, o2], starter, is_crib=True))
+    return min_crib, total_score_sum / total_ways
 
-    for ri1 in range(13):
-        for ri2 in range(ri1, 13):
-            for ri3 in range(ri2, 13):
-                r1, r2, r3 = rank_list[ri1], rank_list[ri2], rank_list[ri3]
-                cards_r1 = rank_to_cards[r1]
-                cards_r2 = rank_to_cards[r2]
-                cards_r3 = rank_to_cards[r3]
-                
-                n1 = len(cards_r1)
-                n2 = len(cards_r2)
-                n3 = len(cards_r3)
-
-                # Need to partition (r1, r2, r3) into "2 for opponent + 1 for starter"
-                # Each partition has different number of ways and potentially different score
-                
-                partitions = []  # List of (opp_rank_indices, starter_rank_index)
-                
-                if r1 == r2 == r3:
-                    # All same rank: opp gets (r1, r1), starter is r1
-                    if n1 >= 3:
-                        # Enumerate all specific card combinations
-                        for i in range(n1):
-                            for j in range(i+1, n1):
-                                for k in range(n1):
-                                    if k != i and k != j:
-                                        partitions.append((
-                                            [cards_r1[i], cards_r1[j]], 
-                                            cards_r1[k]
-                                        ))
-                        
-                elif r1 == r2 != r3:
-                    # Two r1, one r3
-                    # Partition A: opp gets (r1, r1), starter is r3
-                    if n1 >= 2 and n3 >= 1:
-                        for i in range(n1):
-                            for j in range(i+1, n1):
-                                for k in range(n3):
-                                    partitions.append((
-                                        [cards_r1[i], cards_r1[j]], 
-                                        cards_r3[k]
-                                    ))
-                    # Partition B: opp gets (r1, r3), starter is r1
-                    if n1 >= 2 and n3 >= 1:
-                        for i in range(n1):
-                            for j in range(n3):
-                                for k in range(n1):
-                                    if k != i:
-                                        partitions.append((
-                                            [cards_r1[i], cards_r3[j]], 
-                                            cards_r1[k]
-                                        ))
-                        
-                elif r2 == r3 != r1:
-                    # One r1, two r2
-                    # Partition A: opp gets (r2, r2), starter is r1
-                    if n2 >= 2 and n1 >= 1:
-                        for i in range(n2):
-                            for j in range(i+1, n2):
-                                for k in range(n1):
-                                    partitions.append((
-                                        [cards_r2[i], cards_r2[j]], 
-                                        cards_r1[k]
-                                    ))
-                    # Partition B: opp gets (r1, r2), starter is r2
-                    if n1 >= 1 and n2 >= 2:
-                        for i in range(n1):
-                            for j in range(n2):
-                                for k in range(n2):
-                                    if k != j:
-                                        partitions.append((
-                                            [cards_r1[i], cards_r2[j]], 
-                                            cards_r2[k]
-                                        ))
-                        
-                else:
-                    # All different ranks
-                    if n1 >= 1 and n2 >= 1 and n3 >= 1:
-                        # Partition A: opp gets (r1, r2), starter is r3
-                        for i in range(n1):
-                            for j in range(n2):
-                                for k in range(n3):
-                                    partitions.append((
-                                        [cards_r1[i], cards_r2[j]], 
-                                        cards_r3[k]
-                                    ))
-                        # Partition B: opp gets (r1, r3), starter is r2
-                        for i in range(n1):
-                            for j in range(n3):
-                                for k in range(n2):
-                                    partitions.append((
-                                        [cards_r1[i], cards_r3[j]], 
-                                        cards_r2[k]
-                                    ))
-                        # Partition C: opp gets (r2, r3), starter is r1
-                        for i in range(n2):
-                            for j in range(n3):
-                                for k in range(n1):
-                                    partitions.append((
-                                        [cards_r2[i], cards_r3[j]], 
-                                        cards_r1[k]
-                                    ))
-
-                # Process each partition (now with specific cards/suits)
-                for opp_cards, starter_card in partitions:
-                    crib_hand = list(discarded_cards) + opp_cards
-                    
-                    # Score the crib with the starter
-                    dummy_tuple = normalize_hand_to_tuple(crib_hand + [starter_card])
-                    score = crib_score_cache.get(dummy_tuple, None)
-                    if score is None:
-                        score = score_hand(crib_hand, is_crib=True, starter_card=starter_card)
-                        # update_table(hand_key, crib_key, None, score, conn)
-                    
-                    total_score_sum += score
-                    min_crib = min(min_crib, score)
 
-    crib_avg = 0.0
-    if total_ways > 0:
-        crib_avg = total_score_sum / total_ways
-    return min_crib, crib_avg
+def calc_crib_ranges_exact_and_slow(rank_list, starter_pool, suits_list, discarded_cards, crib_score_cache):
+    """
+    Calculate expected crib score by considering all possible opponent discards and starters.
+    Every (opponent discard, starter) crib from the starter pool is scored in one batch.
+    """
+    # Total ways = C(46, 2) * 44 for choosing 2 opponent discards and 1 starter
+    cribs = crib_deal_codes([c.to_index() for c in discarded_cards], [c.to_index() for c in starter_pool])
+    if len(cribs) == 0:
+        return float('inf'), 0.0
+    scores = score_hands_batch(cribs, is_crib=True)
+    return int(scores.min()), float(scores.mean())
 
 def calc_crib_ranges_almost_exact(rank_list, starter_pool, suits_list, discarded_cards, crib_score_cache):
     """
@@ -320,11 +267,7 @@ def calc_crib_ranges_almost_exact(rank_list, starter_pool, suits_list, discarded
                     crib_hand = list(discarded_cards) + opp_cards
                     
                     # Score the crib with the starter
-                    dummy_tuple = normalize_hand_to_tuple(crib_hand + [starter_card])
-                    score = crib_score_cache.get(dummy_tuple, None)
-                    if score is None:
-                        score = score_hand(crib_hand, is_crib=True, starter_card=starter_card)
-                        crib_score_cache[dummy_tuple] = score
+                    score = lookup_hand_score(crib_hand, is_crib=True, starter_card=starter_card)
                     
                     total_score_sum += score * weight
                     min_crib = min(min_crib, score)
@@ -370,9 +313,7 @@ def calc_crib_ranges_fast(starter_pool, discarded_cards, crib_score_cache):
                 opp_cards = [Card(r1 + "c"), Card(r2 + "d"), Card(r3 + "h")]
                 # dummy_tuple = normalize_hand_to_tuple(crib_hand + [starter_card])
                 # score = crib_score_cache.get(dummy_tuple, None)
-                score = None
-                if score is None:
-                    score = score_hand(discarded_cards + opp_cards, is_crib=True)                                    
+                score = lookup_hand_score(discarded_cards + opp_cards, is_crib=True)
                 scores.append(score)
     crib_avg = 0.0    
     crib_avg = sum(scores) / len(scores) if scores else 0.0
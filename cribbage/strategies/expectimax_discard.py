@@ -0,0 +1,120 @@
+"""Discards valued on the whole round: hand and crib points plus the pegging they lead to.
+
+``discard_options`` gives the exact average hand and crib of each of the 15 discards; the pegging
+differential is estimated on top by dealing the opponent kept hands, from an
+``OpponentHandModel`` or uniformly from the unseen cards, and solving the pegging of every
+option against each of them with the perfect-information ``PeggingSolver``. Every option is
+solved against the same opponent hands, so their differences are not blurred by sampling luck.
+"""
+import logging
+import random
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cribbage.discard_table import discard_options
+from cribbage.opponent_model import OpponentHandModel
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import Card
+from cribbage.strategies.pegging_solver import get_pegging_solver
+from cribbage.utils import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+HAND_SIZE = 4
+
+
+class OptionValue(NamedTuple):
+    discards: Tuple[Card, Card]
+    kept: Tuple[Card, ...]
+    hand_and_crib: float  # exact E[hand] +/- E[crib]
+    pegging: float  # mean pegging points made minus conceded over the solved opponent hands
+
+    @property
+    def total(self) -> float:
+        return self.hand_and_crib + self.pegging
+
+
+def pegging_totals(kept_hands: Sequence[Sequence[Card]], opponent_hands: Sequence[Sequence[Card]],
+                   dealer_is_self: bool, time_budget: Optional[float] = None) -> Tuple[np.ndarray, int]:
+    """Solve the pegging of every kept hand against opponent hands until they or the time run out.
+
+    :return: (total pegging differential of each kept hand over the solved opponent hands, hands solved)
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    solver = get_pegging_solver()
+    totals = np.zeros(len(kept_hands))
+    n_solved = 0
+    for opponent in opponent_hands:
+        # the pone leads
+        totals += [solver.solve(kept, opponent, my_turn=not dealer_is_self) for kept in kept_hands]
+        n_solved += 1
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+    return totals, n_solved
+
+
+class ExpectimaxDiscard:
+    """Discard strategy maximising hand plus crib plus expected pegging differential.
+
+    ``max_samples`` opponent hands are solved per decision, fewer if ``time_budget`` (seconds,
+    from the start of the decision) runs out first; at least one is always solved. With
+    ``infer_opponent`` the opponent keeps hands weighted like ``OpponentHandModel``'s prior,
+    otherwise any 4 unseen cards. ``max_workers`` greater than 1 splits the opponent hands over
+    a process pool, ``pool`` to share a player's, shared by every copy of the strategy until
+    ``close``. Called like any discard strategy.
+    """
+
+    def __init__(self, max_samples: int = 64, time_budget: Optional[float] = None, max_workers: int = 1,
+                 infer_opponent: bool = True, seed: Optional[int] = None, pool: Optional[WorkerPool] = None):
+        self.max_samples = max_samples
+        self.time_budget = time_budget
+        self.max_workers = max_workers
+        self.infer_opponent = infer_opponent
+        self.pool = pool if pool is not None else WorkerPool(max_workers)
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        self.pool.close()
+
+    def __call__(self, hand, dealer_is_self, your_score=None, opponent_score=None):
+        values = self.evaluate(hand, dealer_is_self)
+        return max(values, key=lambda value: value.total).discards
+
+    def sample_opponent_hands(self, hand: Sequence[Card], n_samples: int) -> List[List[Card]]:
+        if self.infer_opponent:
+            return OpponentHandModel(hand).sample_hands(n_samples, self._rng)
+        dealt = set(hand)
+        unseen = [c for c in get_full_deck() if c not in dealt]
+        return [self._rng.sample(unseen, HAND_SIZE) for _ in range(n_samples)]
+
+    def evaluate(self, hand: Sequence[Card], dealer_is_self: bool) -> List[OptionValue]:
+        """Value of each of the 15 discards, in ``discard_options`` order."""
+        start = time.perf_counter()
+        options = discard_options(hand)
+        opponent_hands = self.sample_opponent_hands(hand, self.max_samples)
+        kept_hands = [option.kept for option in options]
+        budget = None if self.time_budget is None else max(self.time_budget - (time.perf_counter() - start), 0)
+        totals, n_solved = self._solve(kept_hands, opponent_hands, dealer_is_self, budget)
+        logger.debug("Solved pegging against %d opponent hands in %.3f seconds", n_solved, time.perf_counter() - start)
+        return [OptionValue(option.discards, option.kept, option.expected_total(dealer_is_self), total / n_solved)
+                for option, total in zip(options, totals)]
+
+    def _solve(self, kept_hands, opponent_hands, dealer_is_self, time_budget) -> Tuple[np.ndarray, int]:
+        if self.max_workers == 1 or len(opponent_hands) == 1:
+            return pegging_totals(kept_hands, opponent_hands, dealer_is_self, time_budget)
+        batches = [opponent_hands[i::self.max_workers] for i in range(self.max_workers)]
+        futures = [self.pool.executor.submit(pegging_totals, kept_hands, batch, dealer_is_self, time_budget)
+                   for batch in batches if batch]
+        totals = np.zeros(len(kept_hands))
+        n_solved = 0
+        for future in futures:
+            batch_totals, batch_solved = future.result()
+            totals += batch_totals
+            n_solved += batch_solved
+        return totals, n_solved
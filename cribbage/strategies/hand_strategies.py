@@ -1,13 +1,24 @@
 import itertools
+import logging
+from functools import lru_cache
 
 import numpy as np
-import pandas as pd
 
 from cribbage.strategies.crib_strategies import calc_crib_min_only_given_6_cards, calc_crib_ranges_fast_given_6_cards
-from cribbage.database import normalize_hand_to_str, normalize_hand_to_tuple
+from cribbage.database import (canonicalize_codes, card_to_code, invert_suit_map, normalize_hand_to_str,
+                               relabel_codes)
+from cribbage.discard_table import discard_options
+from cribbage.fast_scoring import score_hands_batch
 from cribbage.players.rule_based_player import get_full_deck
-from cribbage.playingcards import Card, build_hand
+from cribbage.playingcards import Card
 from cribbage.scoring import score_hand
+from cribbage.score_table import lookup_hand_score
+from cribbage.win_table import MAX_HAND, get_win_table, shift_distribution
+
+logger = logging.getLogger(__name__)
+
+# once either player reaches this score, discards play for the win rather than for points
+ENDGAME_SCORE = 90
 
 
 def calc_hand_ranges_exact(rank_to_suits, kept_hand, flush_suit, flush_base, nobs_suits, hand_score_cache):
@@ -21,11 +32,7 @@ def calc_hand_ranges_exact(rank_to_suits, kept_hand, flush_suit, flush_base, nob
         # calculate runs, 15s, pairs since these don't care about suit
         dummy_suit = list(avail_suits)[0]
         dummy_starter = Card(rank + dummy_suit)
-        dummy_hand = kept_hand + [dummy_starter]
-        dummy_tuple = normalize_hand_to_tuple(dummy_hand)
-        runs_15s_pairs_score = hand_score_cache.get(dummy_tuple, None)  # Fallback if missing
-        if runs_15s_pairs_score is None:
-            runs_15s_pairs_score = score_hand(dummy_hand, is_crib=False)
+        runs_15s_pairs_score = lookup_hand_score(kept_hand, is_crib=False, starter_card=dummy_starter)
 
         # Extras dummy triggered
         dummy_flush_bonus = 1 if flush_suit == dummy_suit else 0
@@ -88,55 +95,119 @@ def process_dealt_hand_only_exact(args):
         ))
     return results
 
+def merge_discard_stats(hand, hand_results, crib_results, dealer_is_self):
+    """Join the per-discard hand and crib stats into rows ranked in discard order.
+
+    Both result lists come out in ``combinations(range(6), 2)`` order keyed by ``hand_key``.
+    Each row is ``(discards, min_hand, max_hand, avg_hand, min_crib, avg_crib, avg_total,
+    min_total)`` where ``discards`` are the Card objects from ``hand`` in ``crib_key`` order.
+    """
+    hand_stats = {hand_key: stats for hand_key, *stats in hand_results}
+    cards_by_code = {card_to_code(c): c for c in hand}
+    sign = 1 if dealer_is_self else -1
+    rows = []
+    for hand_key, crib_key, min_crib, avg_crib in crib_results:
+        min_hand, max_hand, avg_hand = hand_stats[hand_key]
+        discards = tuple(cards_by_code[code] for code in crib_key.split("|"))
+        rows.append((discards, min_hand, max_hand, avg_hand, min_crib, avg_crib,
+                     avg_hand + sign * avg_crib, min_hand + sign * min_crib))
+    return rows
+
+
+def format_discard_table(rows):
+    """Render ``merge_discard_stats`` rows, best average total first, for debug logging."""
+    lines = ["discards   min_hand max_hand avg_hand min_crib avg_crib avg_total"]
+    for discards, min_hand, max_hand, avg_hand, min_crib, avg_crib, avg_total, _ in sorted(
+            rows, key=lambda row: row[6], reverse=True):
+        lines.append("%-10s %8.0f %8.0f %8.2f %8.0f %8.2f %9.2f" % (
+            "|".join(map(str, discards)), min_hand, max_hand, avg_hand, min_crib, avg_crib, avg_total))
+    return "\n".join(lines)
+
+
+def _best_average_discards(rows):
+    # first row (in discard order) with the best average total
+    best = max(rows, key=lambda row: row[6])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("discard stats\n" + format_discard_table(rows))
+    return best[0]
+
+
 def exact_hand_and_fast_crib(hand, dealer_is_self):
     # won 46/100 times against beginner player
-    # df3 = get_6_card_stats_df_from_db(hand, dealer_is_self)
     full_deck = get_full_deck()
     hand_score_cache = {}
-    crib_score_cache = {}        
     hand_results = process_dealt_hand_only_exact([hand, full_deck, hand_score_cache])
-    df_hand = pd.DataFrame(hand_results, columns=["hand_key","min_hand_score","max_hand_score","avg_hand_score"])
     crib_results = calc_crib_ranges_fast_given_6_cards(hand)
-    df_crib = pd.DataFrame(crib_results, columns=["hand_key","crib_key","min_crib_score","avg_crib_score"])
-    df3 = pd.merge(df_hand, df_crib, on=["hand_key"])        
-    df3["avg_total_score"] = df3["avg_hand_score"] + (df3["avg_crib_score"] if dealer_is_self else -df3["avg_crib_score"])
-#     logger.debug(f"\n {df3[['hand_key', 'max_hand_score',
-#    'avg_hand_score', 'min_crib_score', 'avg_crib_score',
-#    'avg_total_score']].sort_values(by='avg_total_score', ascending=False)}")
-    best_discards_str = df3.loc[df3["avg_total_score"] == df3["avg_total_score"].max()]["crib_key"].values[0]
-    best_discards = best_discards_str.lower().replace("t", "10").split("|")
-    best_discards_cards = build_hand(best_discards)
-    return tuple(best_discards_cards)
+    return _best_average_discards(merge_discard_stats(hand, hand_results, crib_results, dealer_is_self))
 
 def exact_hand_and_min_crib(hand, dealer_is_self, your_score=None, opponent_score=None):
     # don't analyze crib, just calculate min value of the crib and use that
     full_deck = get_full_deck()
     hand_score_cache = {}
-    crib_score_cache = {}        
     hand_results = process_dealt_hand_only_exact([hand, full_deck, hand_score_cache])
-    df_hand = pd.DataFrame(hand_results, columns=["hand_key","min_hand_score","max_hand_score","avg_hand_score"])
     crib_results = calc_crib_min_only_given_6_cards(hand)
-    df_crib = pd.DataFrame(crib_results, columns=["hand_key","crib_key","min_crib_score","avg_crib_score"])
-    df3 = pd.merge(df_hand, df_crib, on=["hand_key"])        
-    df3["avg_total_score"] = df3["avg_hand_score"] + (df3["avg_crib_score"] if dealer_is_self else -df3["avg_crib_score"])
-    df3["min_total_score"] = df3["min_hand_score"] + (df3["min_crib_score"] if dealer_is_self else -df3["min_crib_score"])
-    import logging
-    logger = logging.getLogger(__name__)
-#     logger.info(f"\n {df3[['hand_key', 'max_hand_score',
-#    'avg_hand_score', 'min_crib_score', 'avg_crib_score',
-#    'avg_total_score']].sort_values(by='avg_total_score', ascending=False)}")
-    # think there's a small bug here, your_score and opponent_score are initialized to None instead of 0
-    # if your_score is not None and opponent_score is not None:
-        # if we are behind, try to maximize avg score
-        # if your_score > 90 or opponent_score > 90:
-        #     df3 = df3.sort_values(by=["min_total_score", "avg_total_score"], ascending=False)
-        #     df4 = df3.loc[df3["min_total_score"] == df3["min_total_score"].max()]
-        #     # if len(df4) > 1:
-        #     #     logger.info(f"\n {df3[['hand_key', 'crib_key','min_total_score', 'avg_total_score']]}")                
-        #     best_discards_str = df4.iloc[0]["crib_key"]            
-        # else:
-    best_discards_str = df3.loc[df3["avg_total_score"] == df3["avg_total_score"].max()]["crib_key"].values[0]
-    # best_discards_str = df3.loc[df3["avg_total_score"] == df3["avg_total_score"].max()]["crib_key"].values[0]
-    best_discards = best_discards_str.lower().replace("t", "10").split("|")
-    best_discards_cards = build_hand(best_discards)
-    return tuple(best_discards_cards)
\ No newline at end of file
+    # scores are ignored here, win_probability_discard plays the endgame
+    return _best_average_discards(merge_discard_stats(hand, hand_results, crib_results, dealer_is_self))
+
+@lru_cache(maxsize=65536)
+def _canonical_discard_codes(strategy, canonical_codes, dealer_is_self):
+    discards = strategy([Card.from_index(c) for c in canonical_codes], dealer_is_self)
+    return tuple(c.to_index() for c in discards)
+
+
+def canonical_discard(strategy, hand, dealer_is_self):
+    """Run a discard strategy once per suit-isomorphism class of the 6 card deal.
+
+    The answer is cached for the canonical deal and relabelled back to the cards in hand,
+    so every deal that only differs by suits reuses the same computation.
+    """
+    canonical, suit_map = canonicalize_codes([c.to_index() for c in hand])
+    discard_codes = _canonical_discard_codes(strategy, canonical, dealer_is_self)
+    hand_by_code = {c.to_index(): c for c in hand}
+    return tuple(hand_by_code[c] for c in relabel_codes(discard_codes, invert_suit_map(suit_map)))
+
+
+def exact_table_discard(hand, dealer_is_self, your_score=None, opponent_score=None):
+    """Discard maximising exact E[hand] +/- exact E[crib], from the precomputed discard table."""
+    options = discard_options(hand)
+    best = max(options, key=lambda option: option.expected_total(dealer_is_self))
+    return best.discards
+
+
+def _kept_hand_distributions(hand, options) -> np.ndarray:
+    # (15, MAX_HAND) distribution of each option's kept hand over the 46 starters
+    dealt = {c.to_index() for c in hand}
+    starters = np.array([c for c in range(52) if c not in dealt])
+    kept = np.array([[c.to_index() for c in option.kept] for option in options])
+    rows = np.concatenate([np.repeat(kept, len(starters), axis=0), np.tile(starters, len(options))[:, None]], axis=1)
+    scores = score_hands_batch(rows).reshape(len(options), len(starters))
+    return np.stack([np.bincount(row, minlength=MAX_HAND) / len(starters) for row in scores])
+
+
+def win_probability_discard(hand, dealer_is_self, your_score=None, opponent_score=None, win_table=None):
+    """Discard maximising the chance to win the game once either player reaches ``ENDGAME_SCORE``.
+
+    Each option's exact kept hand distribution and the crib distribution of the win table,
+    moved to the option's exact average crib, replace the round's averages in
+    ``WinTable.round_win_probability``. Ties, earlier scores and games without a win table
+    fall back to ``exact_table_discard``.
+    """
+    options = discard_options(hand)
+    table = win_table if win_table is not None else get_win_table()
+    if table is None or your_score is None or opponent_score is None or max(your_score, opponent_score) < ENDGAME_SCORE:
+        return max(options, key=lambda option: option.expected_total(dealer_is_self)).discards
+    distributions = table.distributions
+    hands = _kept_hand_distributions(hand, options)
+    chances = []
+    for option, kept in zip(options, hands):
+        crib = shift_distribution(distributions.crib, option.avg_crib)
+        if dealer_is_self:
+            chance = table.round_win_probability(your_score, opponent_score, dealer_total=np.convolve(kept, crib))
+        else:
+            dealer_total = np.convolve(distributions.dealer_hand, crib)
+            chance = 1 - table.round_win_probability(opponent_score, your_score, pone_hand=kept, dealer_total=dealer_total)
+        chances.append(round(chance, 9))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("win chances %s", [(str(o.discards[0]), str(o.discards[1]), c) for o, c in zip(options, chances)])
+    best = max(range(len(options)), key=lambda i: (chances[i], options[i].expected_total(dealer_is_self)))
+    return options[best].discards
@@ -0,0 +1,191 @@
+"""Exact pegging when both hands are known: a negamax search with alpha-beta pruning.
+
+Pegging never looks at suits, so positions are keyed by rank multisets and the transposition
+table is shared by every suit relabelling of a hand. Values are the pegging points the player
+to move makes minus the opponent's from here to the last card, under the rules
+``CribbageRound`` plays: 15s, pairs and runs as ``PeggingSequence`` scores them, 1 more for 31,
+1 for the go to whoever played last when neither player can go on, after which the other
+player leads a new count, and 1 for the last card.
+"""
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from cribbage.playingcards import Card
+
+logger = logging.getLogger(__name__)
+
+_VALUES = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)  # by rank order, ace = 1
+_PAIR_POINTS = (0, 0, 2, 6, 12)
+_EXACT, _LOWER, _UPPER = range(3)
+_INFINITY = 1000
+# positions kept between calls, about 140 MB; the table is cleared before a search once it holds more
+MAX_TRANSPOSITIONS = 500_000
+
+
+def _run_length(tail: Tuple[int, ...], rank: int) -> int:
+    # PeggingSequence._run_length over the trailing window without repeated ranks
+    mask = 1 << rank
+    run = 0
+    for length, tail_rank in enumerate(reversed(tail), 2):
+        if tail_rank == rank:
+            break
+        mask |= 1 << tail_rank
+        if length >= 3:
+            lowest = mask >> ((mask & -mask).bit_length() - 1)
+            if lowest & (lowest + 1) == 0:
+                run = length
+    return run
+
+
+def play_rank(count: int, tail: Tuple[int, ...], same: int, rank: int) -> Tuple[int, int, Tuple[int, ...], int]:
+    """Play a card of ``rank`` onto a sequence, by ranks only.
+
+    ``tail`` is the trailing window of the sequence without repeated ranks, oldest first, and
+    ``same`` how many cards of its last rank end the sequence.
+    :return: (points including the 1 for 31, new count, new tail, new same)
+    """
+    count += _VALUES[rank]
+    points = 2 if count == 15 else 0
+    if count == 31:
+        points += 1
+    if tail and tail[-1] == rank:
+        same += 1
+        points += _PAIR_POINTS[min(same, 4)]
+    else:
+        same = 1
+    points += _run_length(tail, rank)
+    if rank in tail:
+        tail = tail[tail.index(rank) + 1:]
+    return points, count, tail + (rank,), same
+
+
+def _sequence_state(table: Sequence[Card]) -> Tuple[int, Tuple[int, ...], int]:
+    count, tail, same = 0, (), 0
+    for card in table:
+        _, count, tail, same = play_rank(count, tail, same, card.rank_order)
+    if count > 31:
+        raise ValueError(f"Count of the table {list(table)} is over 31.")
+    return count, tail, same
+
+
+def _ranks(cards: Sequence[Card]) -> Tuple[int, ...]:
+    return tuple(sorted(card.rank_order for card in cards))
+
+
+class PeggingSolver:
+    """Perfect-information pegging search with a transposition table kept between calls.
+
+    ``table`` arguments are the cards of the current count, since the last go or 31, as
+    ``select_card_to_play`` gets them. ``other_said_go`` means the player not on turn has said
+    go in this count, so the player on turn keeps playing. The table is cleared before a search
+    once it holds more than ``max_transpositions`` positions, so long runs stay bounded.
+    """
+
+    def __init__(self, max_transpositions: int = MAX_TRANSPOSITIONS):
+        self.max_transpositions = max_transpositions
+        self.transpositions: Dict[tuple, Tuple[int, int]] = {}
+
+    def clear(self):
+        self.transpositions.clear()
+
+    def _bound(self):
+        if len(self.transpositions) > self.max_transpositions:
+            logger.debug("Clearing %d pegging positions", len(self.transpositions))
+            self.transpositions.clear()
+
+    def solve(self, my_hand: Sequence[Card], opponent_hand: Sequence[Card], table: Sequence[Card] = (),
+              my_turn: bool = True, other_said_go: bool = False) -> int:
+        """Exact pegging points I make minus my opponent's, from here to the last card."""
+        self._bound()
+        count, tail, same = _sequence_state(table)
+        mine, theirs = _ranks(my_hand), _ranks(opponent_hand)
+        if not my_turn:
+            mine, theirs = theirs, mine
+        if not mine and not theirs:
+            return 0
+        value = self._negamax(mine, theirs, count, tail, same, other_said_go, -_INFINITY, _INFINITY)
+        return value if my_turn else -value
+
+    def play_values(self, my_hand: Sequence[Card], opponent_hand: Sequence[Card], table: Sequence[Card] = (),
+                    other_said_go: bool = False) -> Dict[Card, int]:
+        """Exact value of each card I can play now, on my turn; empty if I have to say go."""
+        self._bound()
+        count, tail, same = _sequence_state(table)
+        theirs = _ranks(opponent_hand)
+        values = {}
+        for card in my_hand:
+            if count + card.get_value() > 31:
+                continue
+            rest = list(my_hand)
+            rest.remove(card)
+            values[card] = self._play(_ranks(rest), theirs, count, tail, same, other_said_go, card.rank_order,
+                                      -_INFINITY, _INFINITY)
+        return values
+
+    def best_play(self, my_hand: Sequence[Card], opponent_hand: Sequence[Card], table: Sequence[Card] = (),
+                  other_said_go: bool = False) -> Optional[Card]:
+        """The first card of my hand with the best exact value, None for a go."""
+        values = self.play_values(my_hand, opponent_hand, table, other_said_go)
+        return max(values, key=values.get) if values else None
+
+    def _play(self, rest, theirs, count, tail, same, other_go, rank, alpha, beta) -> int:
+        # value of playing ``rank`` and keeping ``rest``, for the player on turn
+        points, count, tail, same = play_rank(count, tail, same, rank)
+        if not rest and not theirs:
+            return points + 1  # last card
+        if other_go:
+            return points + self._negamax(rest, theirs, count, tail, same, True, alpha - points, beta - points)
+        return points - self._negamax(theirs, rest, count, tail, same, False, points - beta, points - alpha)
+
+    def _negamax(self, mine, theirs, count, tail, same, other_go, alpha, beta) -> int:
+        key = (mine, theirs, count, tail, same, other_go)
+        entry = self.transpositions.get(key)
+        if entry is not None:
+            value, flag = entry
+            if flag == _EXACT:
+                return value
+            if flag == _LOWER and value >= beta:
+                return value
+            if flag == _UPPER and value <= alpha:
+                return value
+        alpha_start = alpha
+        best = -_INFINITY
+        previous = None
+        for i, rank in enumerate(mine):
+            # ranks are sorted, so equal ranks are the same move
+            if rank == previous or count + _VALUES[rank] > 31:
+                continue
+            previous = rank
+            value = self._play(mine[:i] + mine[i + 1:], theirs, count, tail, same, other_go, rank, alpha, beta)
+            if value > best:
+                best = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        if best == -_INFINITY:
+            if other_go:
+                # both said go: 1 to me for playing last, my opponent leads the next count
+                best = 1 - self._negamax(theirs, mine, 0, (), 0, False, 1 - beta, 1 - alpha)
+            else:
+                best = -self._negamax(theirs, mine, count, tail, same, True, -beta, -alpha)
+        flag = _UPPER if best <= alpha_start else _LOWER if best >= beta else _EXACT
+        self.transpositions[key] = (best, flag)
+        return best
+
+
+_SOLVER: Optional[PeggingSolver] = None
+
+
+def get_pegging_solver() -> PeggingSolver:
+    """Lazily create the shared solver, so every caller warms the same transposition table."""
+    global _SOLVER
+    if _SOLVER is None:
+        _SOLVER = PeggingSolver()
+    return _SOLVER
+
+
+def solve_pegging(my_hand: Sequence[Card], opponent_hand: Sequence[Card], table: Sequence[Card] = (),
+                  my_turn: bool = True, other_said_go: bool = False) -> int:
+    """``PeggingSolver.solve`` on the shared solver."""
+    return get_pegging_solver().solve(my_hand, opponent_hand, table, my_turn, other_said_go)
@@ -1,7 +1,7 @@
 
 from typing import List, Optional
 from cribbage.playingcards import Card, rank_order_map
-from cribbage.scoring import score_play
+from cribbage.scoring import PeggingSequence
 
 
 import logging
@@ -19,9 +19,9 @@ def basic_pegging_strategy(playable: List[Card], count: int, history_since_reset
     # always take points if available; else play highest card
     best_card_choices = []
     best_pts = 1
+    pegging_sequence = PeggingSequence(history_since_reset)
     for c in playable:
-        sequence = history_since_reset + [c]
-        pts, _ = score_play(sequence)  # Unpack tuple (score, description)
+        pts, _ = pegging_sequence.preview(c)  # Unpack tuple (score, description)
         if (pts >= best_pts) and (c + count <= 31):
             best_pts = pts
             best_card_choices.append(c)
@@ -55,11 +55,11 @@ def medium_pegging_strategy(playable: List[Card], count: int, history_since_rese
     # First priority: find cards that score points
     best_card_choices = []
     best_pts = 1
+    pegging_sequence = PeggingSequence(history_since_reset)
     for c in playable:
         if c.get_value() + count > 31:
             continue  # Skip cards that would bust
-        sequence = history_since_reset + [c]
-        pts, _ = score_play(sequence)  # Unpack tuple (score, description)
+        pts, _ = pegging_sequence.preview(c)  # Unpack tuple (score, description)
         if pts >= best_pts:
             if pts > best_pts:
                 best_pts = pts
@@ -0,0 +1,91 @@
+"""Shared file handling of the precomputed tables (score, discard and win tables).
+
+A table file is a 32 byte header followed by the table's data. The header is an 8 byte magic,
+a format version and a few uint32 fields describing the table's shape, the last one the crc32
+of the data. Files are written to a temporary file first and moved into place, so a reader
+never sees half a table.
+"""
+import logging
+import os
+import struct
+import zlib
+from typing import Callable, Generic, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 32
+
+T = TypeVar("T")
+
+
+class TableFileError(Exception):
+    """Raised when a table file is missing, corrupt or from another version."""
+    pass
+
+
+class TableFile(NamedTuple):
+    """The header layout of one kind of table file."""
+    name: str  # for error messages, e.g. "score table"
+    magic: bytes
+    version: int
+    n_fields: int  # uint32 fields after the version, the crc32 of the data last
+    error: Type[TableFileError]
+
+    @property
+    def header_format(self) -> str:
+        return "<8sI" + "I" * self.n_fields
+
+    def read_header(self, path: str) -> Tuple[int, ...]:
+        """Check the magic and version of ``path`` and return its other header fields."""
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise self.error(f"{path} is too small to be a {self.name}")
+        magic, version, *fields = struct.unpack_from(self.header_format, header)
+        if magic != self.magic:
+            raise self.error(f"{path} is not a {self.name}")
+        if version != self.version:
+            raise self.error(f"{path} is version {version}, expected {self.version}")
+        return tuple(fields)
+
+    def check_size(self, path: str, data_size: int):
+        """Raise unless ``path`` holds exactly ``data_size`` bytes after its header."""
+        if os.path.getsize(path) != HEADER_SIZE + data_size:
+            raise self.error(f"{path} has the wrong size")
+
+    def write(self, path: str, fields: Sequence[int], chunks: Sequence):
+        """Write the header, with the crc32 of ``chunks`` after ``fields``, then the chunks."""
+        crc = 0
+        for chunk in chunks:
+            crc = zlib.crc32(chunk, crc)
+        header = struct.pack(self.header_format, self.magic, self.version, *fields, crc)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+
+
+class LazyTable(Generic[T]):
+    """A shared table opened on first use; remembers when it is not available until ``reset``."""
+
+    def __init__(self, open_table: Callable[[], T], unavailable: str):
+        self.open_table = open_table
+        self.unavailable = unavailable
+        self.reset()
+
+    def reset(self, table: Optional[T] = None):
+        """Use ``table``, or open the file again on next use."""
+        self.table = table
+        self.missing = False
+
+    def get(self) -> Optional[T]:
+        if self.table is None and not self.missing:
+            try:
+                self.table = self.open_table()
+            except (FileNotFoundError, TableFileError) as e:
+                logger.info(f"{self.unavailable}: {e}")
+                self.missing = True
+        return self.table
@@ -1,4 +1,6 @@
-from itertools import combinations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, repeat
 from typing import List, Tuple, Optional
 from logging import getLogger
 from cribbage.playingcards import Card
@@ -6,6 +8,7 @@ from itertools import combinations
 
 import numpy as np
 from cribbage import cribbagegame
+from cribbage.seeding import game_seed
 
 logger = getLogger(__name__)
 
@@ -42,8 +45,8 @@ logger = getLogger(__name__)
 #         all_combos.append((list(kept), crib))
 #     return all_combos
 
-def play_game(p0, p1, seed=None) -> tuple[int, int]:
-    game = cribbagegame.CribbageGame(players=[p0, p1], seed=seed)
+def play_game(p0, p1, seed=None, record_history: bool = False) -> tuple[int, int]:
+    game = cribbagegame.CribbageGame(players=[p0, p1], seed=seed, record_history=record_history)
     final_pegging_scores = game.start()
     return (final_pegging_scores[0], final_pegging_scores[1])
     # return get_scores(game)
@@ -82,26 +85,210 @@ def play_multiple_games_old(num_games, p0, p1, seed=None) -> dict:
     lo, hi = wilson_ci(wins, num_games)    
     return {"wins":wins, "diffs": diffs, "winrate": winrate, "ci_lo": lo, "ci_hi": hi}
 
-def play_multiple_games(num_games, p0, p1, seed=None) -> dict:
-    wins = 0
-    ties = 0
+def play_match_game(p0, p1, game_index, seed=None) -> int:
+    """Play game ``game_index`` of a match and return p0's score minus p1's."""
+    # Alternate seats because cribbage has dealer advantage
+    if game_index % 2 == 0:
+        s0, s1 = play_game(p0, p1, seed=game_seed(seed, game_index))
+        return s0 - s1
+    s0, s1 = play_game(p1, p0, seed=game_seed(seed, game_index))
+    return s1 - s0
+
+
+def summarize_match(diffs) -> dict:
+    """Wins, ties and the Wilson interval of p0's winrate over the decided games."""
+    wins = sum(1 for diff in diffs if diff > 0)
+    ties = sum(1 for diff in diffs if diff == 0)
+    decided = len(diffs) - ties
+    winrate = wins / decided if decided else 0.0
+    lo, hi = wilson_ci(wins, decided)
+    return {"wins":wins, "diffs": list(diffs), "winrate": winrate, "ci_lo": lo, "ci_hi": hi, "ties": ties}
+
+
+def play_multiple_games(num_games, p0, p1, seed=None, first_game=0) -> dict:
+    """Play games ``first_game`` to ``first_game + num_games - 1`` of a match.
+
+    Each game is seeded from its index, so shards of a seeded match can be played
+    separately and their diffs concatenated with ``summarize_match``.
+    """
     diffs = []
-    for i in range(num_games):
-        # if (i % 100) == 0:
-        logger.info(f"Playing game {i}/{num_games}")
-        # Alternate seats because cribbage has dealer advantage
-        if i % 2 == 0:
-            s0, s1 = play_game(p0, p1, seed=seed)
-            diff = s0 - s1
-        else:
-            s0, s1 = play_game(p1, p0, seed=seed)
-            diff = s1 - s0
-        if diff > 0:
-            wins += 1
-        elif diff == 0:             
-             ties += 1
-        diffs.append(diff)
-    winrate = wins / (num_games - ties)
-    lo, hi = wilson_ci(wins, (num_games - ties))    
-    return {"wins":wins, "diffs": diffs, "winrate": winrate, "ci_lo": lo, "ci_hi": hi, "ties": ties}
+    for i in range(first_game, first_game + num_games):
+        if (i % 100) == 0:
+            logger.info(f"Playing game {i}/{num_games}")
+        diffs.append(play_match_game(p0, p1, i, seed=seed))
+    return summarize_match(diffs)
+
+
+def _play_match_games(p0, p1, start, stop, seed):
+    return [play_match_game(p0, p1, i, seed=seed) for i in range(start, stop)]
+
+
+def _map_chunks(worker, num_items, p0, p1, seed, max_workers, chunk_size, first_item=0):
+    """Run ``worker(p0, p1, start, stop, seed)`` over contiguous chunks, results in order."""
+    workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-num_items // (4 * workers)))
+    stop = first_item + num_items
+    starts = range(first_item, stop, chunk_size)
+    stops = [min(start + chunk_size, stop) for start in starts]
+    results = []
+    if workers == 1:
+        for start, chunk_stop in zip(starts, stops):
+            results.extend(worker(p0, p1, start, chunk_stop, seed))
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(worker, repeat(p0), repeat(p1), starts, stops, repeat(seed)):
+            results.extend(chunk)
+            logger.info(f"Played {len(results)}/{num_items}")
+    return results
+
+
+class WorkerPool:
+    """A process pool started on first use and shared by every shallow copy of its owner.
+
+    Players are forked for each game by ``copy.copy``, so a player holding one of these keeps
+    a single pool (and its workers' warm caches) across games until ``close``. Pickled copies,
+    such as players sent to another process, start their own pool there.
+    """
 
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def play_multiple_games_parallel(num_games, p0, p1, seed=None, max_workers=None, chunk_size=None, first_game=0) -> dict:
+    """``play_multiple_games`` spread over a process pool.
+
+    Games are split into contiguous chunks of game indices; each game keeps its seat and
+    seed from ``play_match_game`` and the diffs are merged back in game order, so a seeded
+    run returns exactly what the serial runner does. Players must be picklable.
+    """
+    diffs = _map_chunks(_play_match_games, num_games, p0, p1, seed, max_workers, chunk_size, first_game)
+    return summarize_match(diffs)
+
+
+def play_duplicate_pair(p0, p1, pair_index, seed) -> tuple[int, int]:
+    """Play deal sequence ``pair_index`` twice with the seats swapped.
+
+    Both games share a game seed, so the same deck, cuts and dealer schedule come up and
+    each player gets the other's cards and seat in the mirrored game.
+    :return: p0's score minus p1's in each of the two games.
+    """
+    pair_seed = game_seed(seed, pair_index)
+    s0, s1 = play_game(p0, p1, seed=pair_seed)
+    m1, m0 = play_game(p1, p0, seed=pair_seed)
+    return s0 - s1, m0 - m1
+
+
+def _play_duplicate_pairs(p0, p1, start, stop, seed):
+    return [play_duplicate_pair(p0, p1, i, seed) for i in range(start, stop)]
+
+
+def mean_ci(values, z: float = 1.96) -> tuple[float, float, float]:
+    """Mean of ``values`` and its normal-approximation confidence interval."""
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return 0.0, 0.0, 0.0
+    mean = float(values.mean())
+    if len(values) == 1:
+        return mean, mean, mean
+    half = float(z * values.std(ddof=1) / np.sqrt(len(values)))
+    return mean, mean - half, mean + half
+
+
+def summarize_duplicate_match(pairs, seed=None) -> dict:
+    """Per-game results plus paired estimates over mirrored pairs.
+
+    ``pair_diffs`` holds the mean of p0's two score differences for each deal sequence,
+    and ``pair_win_shares`` p0's share of the pair's wins (ties count a half). Deal luck
+    cancels within a pair, so their intervals are much narrower than ``wilson_ci`` over
+    the same number of independent games.
+    """
+    diffs = [diff for pair in pairs for diff in pair]
+    pair_diffs = [(d0 + d1) / 2 for d0, d1 in pairs]
+    pair_win_shares = [((d0 > 0) + (d1 > 0) + 0.5 * ((d0 == 0) + (d1 == 0))) / 2 for d0, d1 in pairs]
+    mean_diff, diff_lo, diff_hi = mean_ci(pair_diffs)
+    win_share, share_lo, share_hi = mean_ci(pair_win_shares)
+    results = summarize_match(diffs)
+    results.update({"seed": seed, "pairs": len(pair_diffs), "pair_diffs": pair_diffs,
+                    "mean_diff": mean_diff, "diff_ci_lo": diff_lo, "diff_ci_hi": diff_hi,
+                    "pair_win_share": win_share, "win_share_ci_lo": share_lo, "win_share_ci_hi": share_hi})
+    return results
+
+
+def play_duplicate_match(num_pairs, p0, p1, seed=None, max_workers=1, chunk_size=None, first_pair=0) -> dict:
+    """Duplicate cribbage: every seeded deal sequence is played once from each seat.
+
+    Unseeded matches draw a fresh batch seed, reported under ``seed``, because the two
+    games of a pair need the same deals. ``max_workers`` other than 1 spreads the pairs
+    over a process pool with the same results.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    pairs = _map_chunks(_play_duplicate_pairs, num_pairs, p0, p1, seed, max_workers, chunk_size, first_pair)
+    return summarize_duplicate_match(pairs, seed=seed)
+
+
+def sprt_llr(wins: int, losses: int, p_null: float, p_alt: float) -> float:
+    """Log-likelihood ratio of winrate ``p_alt`` against ``p_null`` after ``wins``/``losses``."""
+    return wins * np.log(p_alt / p_null) + losses * np.log((1 - p_alt) / (1 - p_null))
+
+
+def play_sprt_match(p0, p1, seed=None, epsilon: float = 0.05, alpha: float = 0.05, beta: float = 0.05,
+                    batch_size: int = 50, max_games: int = 5000, max_workers=1) -> dict:
+    """Play a match in batches until a sequential probability ratio test decides it.
+
+    Two Wald SPRTs on p0's winrate over decided games run side by side (Sobel-Wald):
+    0.5 against 0.5 + ``epsilon`` and 0.5 against 0.5 - ``epsilon``. Each stops once its
+    log-likelihood ratio leaves (log(beta / (1 - alpha)), log((1 - beta) / alpha)).
+    The match ends with ``decision`` "p0_better" or "p1_better" as soon as either test
+    accepts its alternative, "equal" once both accept 0.5, and "undecided" after
+    ``max_games``. The bounds are only checked between batches, which only makes the
+    test more conservative. Game ``i`` is the same game ``play_multiple_games`` would
+    play, so the batches can be spread over ``max_workers`` processes.
+    """
+    lower, upper = np.log(beta / (1 - alpha)), np.log((1 - beta) / alpha)
+    alternatives = {"p0_better": 0.5 + epsilon, "p1_better": 0.5 - epsilon}
+    accepted = {}
+    llrs = {}
+    diffs = []
+    decision = "undecided"
+    while len(diffs) < max_games:
+        batch = min(batch_size, max_games - len(diffs))
+        diffs += _map_chunks(_play_match_games, batch, p0, p1, seed, max_workers, None, len(diffs))
+        wins = sum(1 for diff in diffs if diff > 0)
+        losses = sum(1 for diff in diffs if diff < 0)
+        for name, p_alt in alternatives.items():
+            llrs[name] = float(sprt_llr(wins, losses, 0.5, p_alt))
+            if name not in accepted:
+                if llrs[name] >= upper:
+                    accepted[name] = True
+                elif llrs[name] <= lower:
+                    accepted[name] = False
+        logger.info(f"SPRT after {len(diffs)} games: {llrs}")
+        if any(accepted.values()):
+            decision = next(name for name, accept in accepted.items() if accept)
+            break
+        if len(accepted) == len(alternatives):
+            decision = "equal"
+            break
+    results = summarize_match(diffs)
+    results.update({"decision": decision, "games": len(diffs), "llr_p0_better": llrs["p0_better"],
+                    "llr_p1_better": llrs["p1_better"], "llr_bounds": (float(lower), float(upper))})
+    return results
@@ -0,0 +1,279 @@
+"""Precomputed probability of winning the game from any score, for decisions near 121.
+
+A round is modelled as its point distributions, measured by simulating rounds between two
+players: the pegging points of dealer and pone (jointly, with the dealer's 2 for his heels),
+the pone's hand, the dealer's hand and the crib. Scores then move in the order the round
+counts them: pegging, the pone's hand, the dealer's hand and crib, and whoever passes 120
+first wins. Pegging is treated as one step, so if both players would pass 120 in it they win
+half the time each.
+
+``compute_win_probabilities`` solves ``P(dealer wins | dealer score, pone score)`` at the
+start of a round by dynamic programming from 120/120 down, one diagonal of equal total score
+at a time: every round pegs at least the last card, so a state only depends on states with
+a higher total. The pone's chances follow from swapping seats, since dealers alternate.
+
+The file is a small header, the start of round and after pegging probabilities as
+uint16 fractions of 65535 and the point distributions the table was solved from. Build it with
+``python scripts/build_win_table.py``.
+"""
+import logging
+import zlib
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from cribbage.constants import WIN_TABLE_PATH
+from cribbage.cribbagegame import CribbageGame
+from cribbage.seeding import game_seed
+from cribbage.table_file import HEADER_SIZE, LazyTable, TableFile, TableFileError
+from cribbage.utils import _map_chunks
+
+logger = logging.getLogger(__name__)
+
+WIN_TABLE_VERSION = 1
+WIN_TABLE_MAGIC = b"CRIBWIN\0"
+WINNING_SCORE = 121
+N_SCORES = WINNING_SCORE  # scores 0..120 before the game is won
+MAX_PEGGING = 64  # pegging points per player in a round, larger ones are clipped
+MAX_HAND = 30  # a hand or crib scores at most 29
+PROBABILITY_SCALE = 65535
+
+
+class WinTableError(TableFileError):
+    pass
+
+
+# header fields: winning score, pegging points per player, hand points, crc32 of the data
+WIN_TABLE_FILE = TableFile("win table", WIN_TABLE_MAGIC, WIN_TABLE_VERSION, 4, WinTableError)
+
+
+class RoundDistributions(NamedTuple):
+    """Point distributions of one round, each summing to 1."""
+    pegging: np.ndarray  # (MAX_PEGGING, MAX_PEGGING) [dealer points, pone points], his heels included
+    pone_hand: np.ndarray  # (MAX_HAND,)
+    dealer_hand: np.ndarray  # (MAX_HAND,)
+    crib: np.ndarray  # (MAX_HAND,)
+
+    @property
+    def dealer_total(self) -> np.ndarray:
+        """Dealer's hand plus crib, taken as independent."""
+        return np.convolve(self.dealer_hand, self.crib)
+
+
+# ===== Round point distributions =====
+
+def simulate_round_points(p0, p1, start, stop, seed) -> list:
+    """Points of rounds ``start``..``stop`` of fresh games, one round each.
+
+    :return: (dealer pegging, pone pegging, pone hand, dealer hand, crib) per round.
+    """
+    rounds = []
+    for i in range(start, stop):
+        game = CribbageGame([p0, p1], seed=game_seed(seed, i), copy_players=False)
+        game.play_round()
+        history = game.history[0].history
+        names = [p.name for p in game.players]
+        dealer = names.index(history.dealer)
+        pone = 1 - dealer
+        rounds.append((history.score_after_pegging[dealer], history.score_after_pegging[pone],
+                       history.hand_scores[names[pone]], history.hand_scores[names[dealer]], history.crib_score))
+    return rounds
+
+
+def round_distributions(points: Sequence[Sequence[int]]) -> RoundDistributions:
+    """Empirical distributions from ``simulate_round_points`` rows."""
+    points = np.asarray(points, dtype=np.int64)
+    if len(points) == 0:
+        raise ValueError("No rounds to build distributions from.")
+    pegging = np.zeros((MAX_PEGGING, MAX_PEGGING))
+    clipped = np.minimum(points[:, :2], MAX_PEGGING - 1)
+    np.add.at(pegging, (clipped[:, 0], clipped[:, 1]), 1)
+    hands = [np.bincount(points[:, col], minlength=MAX_HAND)[:MAX_HAND].astype(float) for col in (2, 3, 4)]
+    return RoundDistributions(pegging / len(points), *(h / len(points) for h in hands))
+
+
+def simulate_round_distributions(num_rounds: int, p0, p1, seed: int = 0, max_workers=1,
+                                 chunk_size=None) -> RoundDistributions:
+    """Round point distributions of ``p0`` against ``p1`` over ``num_rounds`` seeded rounds."""
+    points = _map_chunks(simulate_round_points, num_rounds, p0, p1, seed, max_workers, chunk_size)
+    return round_distributions(points)
+
+
+def shift_distribution(distribution: np.ndarray, mean: float) -> np.ndarray:
+    """Move a distribution over 0, 1, 2, ... to ``mean`` by splitting it between two whole shifts."""
+    delta = mean - float(np.arange(len(distribution)) @ distribution)
+    low = int(np.floor(delta))
+    weight = delta - low
+    shifted = np.zeros(len(distribution) + max(low, 0) + 1)
+    for shift, w in ((low, 1 - weight), (low + 1, weight)):
+        if shift >= 0:
+            shifted[shift:shift + len(distribution)] += w * distribution
+        else:
+            # below zero piles up on zero
+            shifted[:len(distribution) + shift] += w * distribution[-shift:]
+            shifted[0] += w * distribution[:-shift].sum()
+    return shifted
+
+
+# ===== Dynamic programming =====
+
+def _support(distribution: np.ndarray):
+    points = np.flatnonzero(distribution)
+    return points, distribution[points]
+
+
+def compute_win_probabilities(distributions: RoundDistributions):
+    """Solve the win probabilities of the round model.
+
+    :return: (start, after_pegging), both (121, 121) float arrays indexed [dealer score, pone
+        score]: the dealer's chance to win at the start of a round, and once pegging is over.
+    """
+    pegging_points = np.argwhere(distributions.pegging > 0)
+    pegging_weights = distributions.pegging[pegging_points[:, 0], pegging_points[:, 1]]
+    if len(pegging_points) and pegging_points.sum(axis=1).min() == 0:
+        raise ValueError("Every round pegs at least the last card.")
+    pone_points, pone_weights = _support(distributions.pone_hand)
+    dealer_points, dealer_weights = _support(distributions.dealer_total)
+    pad = max(MAX_PEGGING, len(distributions.dealer_total))
+    size = N_SCORES + pad
+    over = np.arange(size) >= WINNING_SCORE
+    # dealer's chance, padded with the won and lost states past 120
+    start = np.zeros((N_SCORES, N_SCORES))
+    after_pegging = np.where(over[:, None], np.where(over[None, :], 0.5, 1.0), 0.0)  # [dealer, pone]
+    after_pone = np.zeros((N_SCORES, N_SCORES))  # [dealer, pone]
+    next_round = np.where(over[:, None], 1.0, np.zeros((size, N_SCORES)))  # dealer's chance as next round's pone
+
+    for total in range(2 * (N_SCORES - 1), -1, -1):
+        dealer = np.arange(max(0, total - N_SCORES + 1), min(N_SCORES - 1, total) + 1)
+        pone = total - dealer
+        start[dealer, pone] = after_pegging[dealer[:, None] + pegging_points[:, 0],
+                                            pone[:, None] + pegging_points[:, 1]] @ pegging_weights
+        # this diagonal as the next round's pone: 1 - the other player's chance as dealer
+        next_round[dealer, pone] = 1 - start[pone, dealer]
+        after_pone[dealer, pone] = next_round[dealer[:, None] + dealer_points, pone[:, None]] @ dealer_weights
+        pone_after = pone[:, None] + pone_points
+        after_pegging[dealer, pone] = np.where(pone_after >= WINNING_SCORE, 0.0,
+                                               after_pone[dealer[:, None], np.minimum(pone_after, N_SCORES - 1)]) @ pone_weights
+    return start, after_pegging[:N_SCORES, :N_SCORES].copy()
+
+
+# ===== Table file =====
+
+class WinTable:
+    """Win probabilities by score with the round distributions they were solved from."""
+
+    def __init__(self, start: np.ndarray, after_pegging: np.ndarray, distributions: RoundDistributions):
+        self.start = start
+        self.after_pegging = after_pegging
+        self.distributions = distributions
+
+    @classmethod
+    def from_distributions(cls, distributions: RoundDistributions) -> "WinTable":
+        start, after_pegging = compute_win_probabilities(distributions)
+        # round through the stored precision so a built table and its file agree
+        return cls(_dequantize(_quantize(start)), _dequantize(_quantize(after_pegging)), distributions)
+
+    @classmethod
+    def load(cls, path: str) -> "WinTable":
+        winning_score, max_pegging, max_hand, crc = WIN_TABLE_FILE.read_header(path)
+        if (winning_score, max_pegging, max_hand) != (WINNING_SCORE, MAX_PEGGING, MAX_HAND):
+            raise WinTableError(f"{path} has an unexpected shape")
+        n_probabilities = N_SCORES * N_SCORES
+        n_distribution = MAX_PEGGING * MAX_PEGGING + 3 * MAX_HAND
+        WIN_TABLE_FILE.check_size(path, 2 * n_probabilities * 2 + n_distribution * 8)
+        with open(path, "rb") as f:
+            f.seek(HEADER_SIZE)
+            data = f.read()
+        if zlib.crc32(data) != crc:
+            raise WinTableError(f"{path} failed its checksum")
+        probabilities = np.frombuffer(data, dtype="<u2", count=2 * n_probabilities).reshape(2, N_SCORES, N_SCORES)
+        values = np.frombuffer(data, dtype="<f8", offset=2 * n_probabilities * 2)
+        pegging = values[:MAX_PEGGING * MAX_PEGGING].reshape(MAX_PEGGING, MAX_PEGGING)
+        hands = values[MAX_PEGGING * MAX_PEGGING:].reshape(3, MAX_HAND)
+        return cls(_dequantize(probabilities[0]), _dequantize(probabilities[1]), RoundDistributions(pegging, *hands))
+
+    def save(self, path: str):
+        WIN_TABLE_FILE.write(path, (WINNING_SCORE, MAX_PEGGING, MAX_HAND), [
+            _quantize(self.start).astype("<u2").tobytes(),
+            _quantize(self.after_pegging).astype("<u2").tobytes(),
+            np.asarray(self.distributions.pegging, dtype="<f8").tobytes(),
+            np.asarray(self.distributions[1:], dtype="<f8").tobytes(),
+        ])
+
+    def win_probability(self, your_score: int, opponent_score: int, dealer_is_self: bool) -> float:
+        """Chance to win from the start of a round."""
+        return self._lookup(self.start, your_score, opponent_score, dealer_is_self)
+
+    def win_probability_after_pegging(self, your_score: int, opponent_score: int, dealer_is_self: bool) -> float:
+        """Chance to win once pegging is over and the hands are still to count."""
+        return self._lookup(self.after_pegging, your_score, opponent_score, dealer_is_self)
+
+    @staticmethod
+    def _lookup(table, your_score, opponent_score, dealer_is_self) -> float:
+        if your_score >= WINNING_SCORE or opponent_score >= WINNING_SCORE:
+            return 1.0 if your_score >= WINNING_SCORE else 0.0
+        if dealer_is_self:
+            return float(table[your_score, opponent_score])
+        return 1.0 - float(table[opponent_score, your_score])
+
+    def round_win_probability(self, dealer_score: int, pone_score: int, pone_hand: Optional[np.ndarray] = None,
+                              dealer_total: Optional[np.ndarray] = None) -> float:
+        """The dealer's chance to win from the start of a round, with some of its distributions replaced.
+
+        ``pone_hand`` and ``dealer_total`` (hand plus crib) default to the table's, so a player
+        who knows their own hand can weigh it against the rest of the round.
+        """
+        distributions = self.distributions
+        pone_hand = distributions.pone_hand if pone_hand is None else np.asarray(pone_hand)
+        dealer_total = distributions.dealer_total if dealer_total is None else np.asarray(dealer_total)
+        pegging_points = np.argwhere(distributions.pegging > 0)
+        pegging_weights = distributions.pegging[pegging_points[:, 0], pegging_points[:, 1]]
+        pone_points, pone_weights = _support(pone_hand)
+        dealer_points, dealer_weights = _support(dealer_total)
+
+        dealer = dealer_score + pegging_points[:, 0]  # (P,)
+        pone = pone_score + pegging_points[:, 1]
+        dealer_won = dealer >= WINNING_SCORE
+        pone_won = pone >= WINNING_SCORE
+        pegging_value = np.where(dealer_won, np.where(pone_won, 0.5, 1.0), 0.0)
+        playing_on = ~dealer_won & ~pone_won
+        dealer, pone = dealer[playing_on], pone[playing_on]
+        pone_after = pone[:, None] + pone_points  # (P, H)
+        dealer_after = dealer[:, None, None] + dealer_points  # (P, 1, D)
+        # next round the pone deals: the dealer wins with 1 - the pone's chance as dealer
+        next_round = 1 - self.start[np.minimum(pone_after, N_SCORES - 1)[:, :, None],
+                                    np.minimum(dealer_after, N_SCORES - 1)]
+        after_pone = np.where(dealer_after >= WINNING_SCORE, 1.0, next_round) @ dealer_weights  # (P, H)
+        after_pegging = np.where(pone_after >= WINNING_SCORE, 0.0, after_pone) @ pone_weights  # (P,)
+        pegging_value[playing_on] = after_pegging
+        return float(pegging_value @ pegging_weights)
+
+
+def _quantize(probabilities: np.ndarray) -> np.ndarray:
+    return np.rint(np.clip(probabilities, 0, 1) * PROBABILITY_SCALE).astype(np.uint16)
+
+
+def _dequantize(values: np.ndarray) -> np.ndarray:
+    return values.astype(float) / PROBABILITY_SCALE
+
+
+def build_win_table(path: str = WIN_TABLE_PATH, num_rounds: int = 50000, p0=None, p1=None, seed: int = 0,
+                    max_workers=1) -> WinTable:
+    """Simulate rounds between two players (``MediumPlayer`` by default), solve and write the table."""
+    if p0 is None or p1 is None:
+        from cribbage.players.medium_player import MediumPlayer
+        p0, p1 = MediumPlayer(name="medium_0"), MediumPlayer(name="medium_1")
+    distributions = simulate_round_distributions(num_rounds, p0, p1, seed=seed, max_workers=max_workers)
+    table = WinTable.from_distributions(distributions)
+    table.save(path)
+    _WIN_TABLE.reset()
+    return WinTable.load(path)
+
+
+_WIN_TABLE = LazyTable(lambda: WinTable.load(WIN_TABLE_PATH),
+                       "Win table not available, decisions maximise expected points")
+
+
+def get_win_table() -> Optional[WinTable]:
+    """Lazily load the shared win table, None if it has not been built."""
+    return _WIN_TABLE.get()
@@ -0,0 +1,18 @@
+"""Build the table of exact discard statistics for every 6 card deal used by cribbage.discard_table.
+
+Successor to generate_all_possible_crib_hand_scores.py: one row per suit-isomorphism class of the
+deal instead of a pandas/SQLite table keyed by the literal cards.
+"""
+import sys
+from time import perf_counter
+
+sys.path.insert(0, ".")
+from cribbage.constants import DISCARD_TABLE_PATH
+from cribbage.discard_table import build_discard_table
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DISCARD_TABLE_PATH
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    start = perf_counter()
+    table = build_discard_table(path, processes=processes)
+    print(f"Built and verified {len(table)} deal classes in {perf_counter() - start:.2f} seconds -> {path}")
@@ -0,0 +1,13 @@
+"""Build the memory-mapped table of every 4 card hand + starter score used by cribbage.score_table."""
+import sys
+from time import perf_counter
+
+sys.path.insert(0, ".")
+from cribbage.constants import SCORE_TABLE_PATH
+from cribbage.score_table import build_score_table
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else SCORE_TABLE_PATH
+    start = perf_counter()
+    table = build_score_table(path)
+    print(f"Built and verified {table.scores.shape[0]} combinations in {perf_counter() - start:.2f} seconds -> {path}")
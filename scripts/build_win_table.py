@@ -0,0 +1,20 @@
+"""Build the table of win probabilities by score used by cribbage.win_table.
+
+Simulates rounds between two MediumPlayers for the round point distributions, then solves the
+win probabilities from every score by dynamic programming.
+"""
+import sys
+from time import perf_counter
+
+sys.path.insert(0, ".")
+from cribbage.constants import WIN_TABLE_PATH
+from cribbage.win_table import build_win_table
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else WIN_TABLE_PATH
+    num_rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    start = perf_counter()
+    table = build_win_table(path, num_rounds=num_rounds, max_workers=max_workers)
+    print(f"Built the win table from {num_rounds} rounds in {perf_counter() - start:.2f} seconds -> {path}")
+    print(f"Dealer wins {table.win_probability(0, 0, True):.3f} of games from 0-0")
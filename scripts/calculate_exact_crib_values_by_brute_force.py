@@ -3,7 +3,7 @@ import sys
 
 sys.path.append(".")
 from cribbage.playingcards import build_hand
-from cribbage.scoring import score_hand
+from cribbage.fast_scoring import crib_deal_codes, score_hands_batch
 import itertools
 from cribbage.players.rule_based_player import get_full_deck
 import pandas as pd
@@ -29,20 +29,11 @@ for discard_idx in itertools.combinations(range(6), 2):
     
     starter_pool = [c for c in full_deck if c not in dealt_hand]
     
-    # Calculate exact average crib score
-    total = 0
-    count = 0
+    # Calculate exact average crib score over every opponent discard and starter
+    crib_hands = crib_deal_codes([c.to_index() for c in discarded_cards], [c.to_index() for c in starter_pool])
+    scores = score_hands_batch(crib_hands, is_crib=True)
     
-    for opp_discard in itertools.combinations(starter_pool, 2):
-        remaining_for_starter = [c for c in starter_pool if c not in opp_discard]
-        
-        for starter in remaining_for_starter:
-            crib_hand = list(discarded_cards) + list(opp_discard)
-            score = score_hand(crib_hand, is_crib=True, starter_card=starter)
-            total += score
-            count += 1
-    
-    avg_crib = total / count
+    avg_crib = float(scores.mean())
     results.append({
         'hand_key': hand_key,
         'crib_key': crib_key,
@@ -1,6 +1,6 @@
 from cribbage.players.beginner_player import BeginnerPlayer
 from cribbage.players.medium_player import MediumPlayer
-from cribbage.utils import play_multiple_games
+from cribbage.utils import play_multiple_games_parallel
 import logging
 import numpy as np
 
@@ -13,7 +13,7 @@ print("Running 20 trials of 100 games each to check variance...")
 winrates = []
 avg_diffs = []
 for trial in range(20):
-    results = play_multiple_games(100, p0=medium_player, p1=beginner_player)
+    results = play_multiple_games_parallel(100, p0=medium_player, p1=beginner_player)
     winrate = results["winrate"]
     wins = results["wins"]
     avg_diff = sum(results["diffs"])/len(results["diffs"])
@@ -0,0 +1,31 @@
+"""Exact regret of the built-in discard strategies against the best discard of each deal.
+
+Usage: python scripts/discard_regret.py [num_deals|all] [max_workers]
+"all" sweeps every one of the 962,988 deal classes; a number draws a sample stratified by suit pattern.
+"""
+import logging
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, ".")
+from cribbage.benchmarks import discard_regret
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.strategies.crib_strategies import basic_crib_strategy
+from cribbage.strategies.hand_strategies import exact_table_discard
+
+logging.basicConfig(level=logging.WARNING)
+
+if __name__ == "__main__":
+    num_deals = None if len(sys.argv) > 1 and sys.argv[1] == "all" else int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    strategies = {"basic_crib_strategy": basic_crib_strategy,
+                  "MediumPlayer": MediumPlayer(name="MediumPlayer").select_crib_cards,
+                  "exact_table_discard": exact_table_discard}
+    start = perf_counter()
+    results = discard_regret(strategies, num_deals=num_deals, max_workers=max_workers)
+    print(f"Evaluated {results['deals']} deals in {perf_counter() - start:.2f} seconds")
+    print("strategy                 regret     +/-  dealer    pone  optimal")
+    for name, r in results["strategies"].items():
+        print("%-22s %8.3f %7.3f %7.3f %7.3f %7.1f%%" % (
+            name, r["regret"], 1.96 * r["regret_se"], r["dealer_regret"], r["pone_regret"], 100 * r["optimal"]))
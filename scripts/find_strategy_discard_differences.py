@@ -1,81 +1,34 @@
-import os
 import sys
 
-import pandas as pd
-
 sys.path.insert(0, ".")
-# sys.path.insert(0, "..")
-# sys.path.insert(0, "...")
-from cribbage.scoring import score_hand
-from cribbage.cribbagegame import CribbageGame
-from cribbage.cribbageround import CribbageRound
+from cribbage.benchmarks import compare_discards
 from cribbage.players.beginner_player import BeginnerPlayer
 from cribbage.players.medium_player import MediumPlayer
-from cribbage.utils import play_multiple_games
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-# def test_max_score_vs_statistic_discard_strategy():
-    # to test the strategy strength, I want to deal both players the same cards, then check which cards they discard
-    # then deal a random starter card, and score both hands + cribs to see which strategy is better
-    # when they are both dealt the same hand, we want to see how the strategies change
-    # I can manually look at them, but what about the crib? If they have the same hand, the crib doesn't make any sense
-    # I will put 2 random cards in the crib I guess? But that's assuming they have the same discards
-def generate_discard_differences_log():
-    filename = "discards_differ.log"
-    num_hands = 500    
+# to test the strategy strength, deal both players the same cards and check which cards they discard,
+# then score both choices exactly over every starter and every crib the opponent could add
+def find_discard_differences(num_hands=500, seed=0, max_workers=None):
     beginner_player = BeginnerPlayer(name="BeginnerPlayer")
     medium_player = MediumPlayer(name="MediumPlayer")
-    header = "dealt,starter,beginner_discard,medium_discard,beginner_crib,medium_crib,beginner_hand,beginner_score,medium_hand,medium_score,dealer_is_self\n"
-    if not os.path.exists(filename):
-        with open(filename, "w") as f:
-            f.write(header)
-    else:
-        with open(filename, "r") as f:
-            content = f.read()
-        if not content:
-            with open(filename, "w") as f:
-                f.write(header)
-    with open(filename, "a") as f:    
-        for hand_num in range(num_hands): 
-            print("Processing hand number:", hand_num)
-            if hand_num % 2 == 0:
-                dealer_is_self = True
-            else:
-                dealer_is_self = False
-            game = CribbageGame(players=[medium_player, beginner_player], seed=None)
-            crib_round = CribbageRound(game, dealer=medium_player, seed=None)
-            cards = crib_round.deck.cards[:6]
-            beginner_discards = beginner_player.select_crib_cards(cards, dealer_is_self=dealer_is_self)
-            medium_discards = medium_player.select_crib_cards(cards, dealer_is_self=dealer_is_self)
-        
-            starter = crib_round.deck.cards[6]
-            beginner_hand = [c for c in cards if c not in beginner_discards]
-            medium_hand = [c for c in cards if c not in medium_discards]
-            random_crib_cards = [crib_round.deck.cards[7], crib_round.deck.cards[8]]
-            beginner_crib = list(beginner_discards) + random_crib_cards
-            medium_crib = list(medium_discards) + random_crib_cards
-            beginner_hand_score = score_hand(beginner_hand, is_crib=False, starter_card=starter)
-            beginner_crib_score = score_hand(beginner_crib, is_crib=True, starter_card=starter)
-            medium_hand_score = score_hand(medium_hand, is_crib=False, starter_card=starter)
-            medium_crib_score = score_hand(medium_crib, is_crib=True, starter_card=starter)
-            if dealer_is_self:
-                beginner_score = beginner_hand_score + beginner_crib_score
-                medium_score = medium_hand_score + medium_crib_score
-            else:
-                beginner_score = beginner_hand_score - beginner_crib_score
-                medium_score = medium_hand_score - medium_crib_score
-            # if set(beginner_discards) != set(medium_discards):            
-            f.write(f'"{",".join(str(c) for c in cards)}","{starter}","{",".join(str(c) for c in beginner_discards)}","{",".join(str(c) for c in medium_discards)}","{",".join(str(c) for c in beginner_crib)}","{",".join(str(c) for c in medium_crib)}","{",".join(str(c) for c in beginner_hand)}",{beginner_score},"{",".join(str(c) for c in medium_hand)}",{medium_score},{dealer_is_self}\n')
-    df = pd.read_csv(filename, header=0)
-    logger.info(f"Score difference after {len(df)} hands were evaluated (medium - beginner)")
-    df2 = df.drop_duplicates(subset=["dealt", "starter"])
-    df2["score_dif"] = df2["medium_score"] - df2["beginner_score"]
-    total_score_dif = df2["score_dif"].sum()
-    logger.info(f"Total score difference over {len(df2)} hands: {total_score_dif}")
+    results = compare_discards(num_hands, p0=medium_player, p1=beginner_player, seed=seed, max_workers=max_workers)
+    for hand in results["hands"]:
+        if hand.differs:
+            print(f"dealt={','.join(map(str, hand.dealt))} dealer_is_self={hand.dealer_is_self} "
+                  f"medium={','.join(map(str, hand.discards[0]))} ({hand.expected[0]:.2f}) "
+                  f"beginner={','.join(map(str, hand.discards[1]))} ({hand.expected[1]:.2f})")
+    print(f"Discards differ in {results['differing']}/{num_hands} hands, "
+          f"mean difference there {results['differing_mean_diff']:.2f} "
+          f"CI: {results['differing_ci_lo']:.2f}-{results['differing_ci_hi']:.2f}")
+    print(f"Mean expected difference over all hands (medium - beginner): {results['mean_diff']:.2f} "
+          f"CI: {results['diff_ci_lo']:.2f}-{results['diff_ci_hi']:.2f}")
+    return results
+
 
 if __name__ == "__main__":
-    generate_discard_differences_log()
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO)
+    find_discard_differences()
@@ -15,7 +15,7 @@ from cribbage.playingcards import Card
 
 sys.path.insert(0, ".")
 sys.path.insert(0, '..')
-from cribbage.database import normalize_hand_to_str, normalize_hand_to_tuple
+from cribbage.database import iter_canonical_classes, normalize_hand_to_str, normalize_hand_to_tuple
 from cribbage.players.rule_based_player import get_full_deck
 from cribbage.cribbagegame import score_hand
 import multiprocessing as mp
@@ -204,8 +204,9 @@ def build_hand_stats_parallel(full_deck, hand_score_cache, n_workers=8, batch_si
     # proper 6 card analysis, 20358520 combinations
     setup_hand_stats_table(sqlite3.connect(DB_PATH))  # ensure table exists
 
-    all_dealt_hands = itertools.combinations(full_deck, 6)
-    total_iterations = math.comb(len(full_deck), 6) 
+    # only one deal per suit-isomorphism class, the keys are canonical (normalize_hand_to_canonical_str)
+    all_dealt_hands = (tuple(Card.from_index(c) for c in codes) for codes, _ in iter_canonical_classes(6))
+    total_iterations = 962988  # suit-isomorphism classes of 6 card deals
     args_iter = ((hand, full_deck, hand_score_cache) for hand in all_dealt_hands)
 
     pool = mp.Pool(n_workers)
@@ -266,8 +267,8 @@ def process_kept_hand(args):
 def build_kept_stats_parallel(full_deck, hand_score_cache, n_workers=8, batch_size=2000):
     setup_hand_stats_table(sqlite3.connect(DB_PATH))
 
-    all_kept_hands = itertools.combinations(full_deck, 4)
-    total_iterations = math.comb(len(full_deck), 4)  
+    all_kept_hands = (tuple(Card.from_index(c) for c in codes) for codes, _ in iter_canonical_classes(4))
+    total_iterations = 16432  # suit-isomorphism classes of 4 card hands
     args_iter = ((hand, full_deck, hand_score_cache) for hand in all_kept_hands)
 
     pool = mp.Pool(n_workers)
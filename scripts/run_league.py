@@ -0,0 +1,30 @@
+"""Play a round-robin league between the built-in players and print the Bradley-Terry leaderboard.
+
+Usage: python scripts/run_league.py [games_per_pairing] [cache_path] [max_workers]
+Finished games are cached in cache_path, so rerunning after adding a player only plays its pairings.
+"""
+import logging
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, ".")
+from cribbage.league import League
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.players.play_first_card_player import PlayFirstCardPlayer
+from cribbage.players.random_player import RandomPlayer
+
+logging.basicConfig(level=logging.WARNING)
+
+if __name__ == "__main__":
+    games_per_pairing = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cache_path = sys.argv[2] if len(sys.argv) > 2 else "league_cache.json"
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    players = [RandomPlayer(name="RandomPlayer"), PlayFirstCardPlayer(name="PlayFirstCardPlayer"),
+               BeginnerPlayer(name="BeginnerPlayer"), MediumPlayer(name="MediumPlayer")]
+    league = League(players, games_per_pairing=games_per_pairing, cache_path=cache_path, max_workers=max_workers)
+    start = perf_counter()
+    n_played = league.run()
+    print(f"Played {n_played} new games in {perf_counter() - start:.2f} seconds")
+    print(league.leaderboard())
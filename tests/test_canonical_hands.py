@@ -0,0 +1,53 @@
+import itertools
+import random
+from math import comb
+
+from cribbage.database import (canonicalize_codes, invert_suit_map, iter_canonical_classes,
+                               normalize_hand_to_canonical_str, relabel_codes)
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.playingcards import Card, build_hand
+from cribbage.scoring import score_hand
+
+
+def test_same_hand_in_different_suits_has_same_key():
+    assert normalize_hand_to_canonical_str(build_hand("AH|2H|3H|4H")) == normalize_hand_to_canonical_str(build_hand("AS|2S|3S|4S"))
+    assert normalize_hand_to_canonical_str(build_hand("5H|5D|JC|KS")) == normalize_hand_to_canonical_str(build_hand("5S|5C|JH|KD"))
+    assert normalize_hand_to_canonical_str(build_hand("AH|2H|3H|4H")) != normalize_hand_to_canonical_str(build_hand("AH|2H|3H|4S"))
+
+
+def test_relabelled_deals_share_a_class_and_score():
+    rng = random.Random(3)
+    for _ in range(300):
+        codes = rng.sample(range(52), 6)
+        perm = rng.sample(range(4), 4)
+        canonical, suit_map = canonicalize_codes(codes)
+        assert canonicalize_codes(relabel_codes(codes, perm))[0] == canonical
+        # subsets map to canonical space and back
+        kept = codes[:4]
+        assert relabel_codes(relabel_codes(kept, suit_map), invert_suit_map(suit_map)) == kept
+        hand = [Card.from_index(c) for c in relabel_codes(codes[:5], suit_map)]
+        real = [Card.from_index(c) for c in codes[:5]]
+        assert score_hand(hand) == score_hand(real)
+        assert score_hand(hand, is_crib=True) == score_hand(real, is_crib=True)
+
+
+def test_classes_cover_every_hand_exactly_once():
+    for n_cards in (2, 3):
+        classes = dict(iter_canonical_classes(n_cards))
+        assert sum(classes.values()) == comb(52, n_cards)
+        seen = {}
+        for combo in itertools.combinations(range(52), n_cards):
+            canonical = canonicalize_codes(combo)[0]
+            seen[canonical] = seen.get(canonical, 0) + 1
+        assert seen == classes
+    four_card_classes = list(iter_canonical_classes(4))
+    assert len(four_card_classes) == 16432
+    assert sum(size for _, size in four_card_classes) == comb(52, 4)
+
+
+def test_medium_player_discards_the_same_cards_for_relabelled_deals():
+    player = MediumPlayer()
+    hand = build_hand(['3d', '4c', '6d', '6s', '10c', 'kd'])
+    relabelled = build_hand(['3h', '4s', '6h', '6c', '10s', 'kh'])
+    assert player.select_crib_cards(hand, dealer_is_self=False) == tuple(build_hand(["10c", "kd"]))
+    assert player.select_crib_cards(relabelled, dealer_is_self=False) == tuple(build_hand(["10s", "kh"]))
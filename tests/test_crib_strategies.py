@@ -0,0 +1,64 @@
+import itertools
+import random
+
+import pytest
+
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import build_hand
+from cribbage.strategies.crib_strategies import (calc_crib_ranges_almost_exact, calc_crib_ranges_exact,
+                                                 calc_crib_ranges_exact_and_slow, calc_crib_ranges_fast)
+
+RANK_LIST = ['a', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'j', 'q', 'k']
+SUITS_LIST = ['c', 'd', 'h', 's']
+
+
+def _discards(dealt_hands):
+    full_deck = get_full_deck()
+    for dealt_hand in dealt_hands:
+        starter_pool = [c for c in full_deck if c not in dealt_hand]
+        for discarded_cards in itertools.combinations(dealt_hand, 2):
+            yield list(discarded_cards), starter_pool
+
+
+def _dealt_hands(n_random, seed=0):
+    rng = random.Random(seed)
+    # same suit jacks and suited discards exercise the nobs and flush counts
+    hands = [build_hand("jh|5h|6h|7h|jd|2c"), build_hand("5h|6c|7d|9h|2h|10d"), build_hand("jc|qc|kc|ac|jh|js")]
+    return hands + [rng.sample(get_full_deck(), 6) for _ in range(n_random)]
+
+
+def test_exact_engine_matches_enumerating_every_crib():
+    for discarded_cards, starter_pool in _discards(_dealt_hands(1)):
+        min_crib, crib_avg = calc_crib_ranges_exact(discarded_cards, starter_pool)
+        expected_min, expected_avg = calc_crib_ranges_exact_and_slow(RANK_LIST, starter_pool, SUITS_LIST, discarded_cards, {})
+        assert min_crib == expected_min, discarded_cards
+        assert crib_avg == pytest.approx(expected_avg, abs=1e-9), discarded_cards
+
+
+def test_exact_engine_reference_values():
+    # from calculate_exact_crib_values_by_brute_force.py, keyed by the kept hand
+    dealt_hand = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+    starter_pool = [c for c in get_full_deck() if c not in dealt_hand]
+    _, crib_avg = calc_crib_ranges_exact(build_hand(["5h", "6c"]), starter_pool)
+    assert round(crib_avg, 2) == 7.1
+    _, crib_avg = calc_crib_ranges_exact(build_hand(["2h", "10d"]), starter_pool)
+    assert round(crib_avg, 2) == 4.1
+
+
+def test_fast_estimate_is_close_to_exact():
+    for discarded_cards, starter_pool in _discards(_dealt_hands(3, seed=1)):
+        min_crib, crib_avg = calc_crib_ranges_exact(discarded_cards, starter_pool)
+        fast_min, fast_avg = calc_crib_ranges_fast(starter_pool, discarded_cards, {})
+        # fast ignores suits and weights every rank triple the same
+        assert abs(fast_avg - crib_avg) < 1.0, discarded_cards
+        # the discards alone never score more than the whole crib
+        assert fast_min <= min_crib
+
+
+@pytest.mark.slow
+def test_almost_exact_estimate_is_close_to_exact():
+    for discarded_cards, starter_pool in itertools.islice(_discards(_dealt_hands(1, seed=2)), 0, None, 6):
+        min_crib, crib_avg = calc_crib_ranges_exact(discarded_cards, starter_pool)
+        almost_min, almost_avg = calc_crib_ranges_almost_exact(RANK_LIST, starter_pool, SUITS_LIST, discarded_cards, {})
+        assert abs(almost_avg - crib_avg) <= 0.03, discarded_cards
+        assert almost_min == min_crib
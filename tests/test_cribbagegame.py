@@ -1,3 +1,4 @@
+import random
 import unittest
 
 import pytest
@@ -17,4 +18,55 @@ def test_cribbage_game_is_exactly_repeatable():
     peg_dif1 = game1.start()
     game2 = cribbagegame.CribbageGame(players=[p0, p1], seed=123)
     peg_dif2 = game2.start()
-    assert peg_dif1 == peg_dif2
\ No newline at end of file
+    assert peg_dif1 == peg_dif2
+
+def test_lean_game_without_history_scores_the_same():
+    for seed in range(20):
+        players = [RandomPlayer(name="Player1", seed=seed), PlayFirstCardPlayer(name="Player2")]
+        full = cribbagegame.CribbageGame(players=players, seed=seed)
+        lean = cribbagegame.CribbageGame(players=players, seed=seed, record_history=False)
+        assert full.start() == lean.start()
+        assert full.round_scores == lean.round_scores
+        assert full.history and full.history[0].play_record
+        assert lean.history == []
+
+
+def test_game_forks_players_and_shares_their_caches():
+    random_player = RandomPlayer(name="Player1", seed=7)
+    random_player.score_cache = {"shared": [1, 2, 3]}
+    expected = random.Random(7).random()
+    random_player._rng.random()  # advance the original's rng
+    # unseeded, so the fork falls back to the player's own seed
+    game = cribbagegame.CribbageGame(players=[random_player, PlayFirstCardPlayer(name="Player2")])
+    forked = game.players[0]
+    assert forked is not random_player
+    assert forked.score_cache is random_player.score_cache
+    # per-game state is reset on the fork only
+    assert forked._rng is not random_player._rng
+    assert forked._rng.random() == expected
+
+
+class _ObservingPlayer(PlayFirstCardPlayer):
+    def reset_for_game(self, seed=None):
+        self.events = []
+
+    def observe_deal(self, hand, discards):
+        self.events.append(("deal", len(hand), len(discards)))
+
+    def observe_starter(self, starter):
+        self.events.append(("starter", starter))
+
+    def observe_play(self, player_name, card, count):
+        self.events.append((player_name, card, count))
+
+
+def test_players_observe_the_deal_starter_and_every_play():
+    p0, p1 = _ObservingPlayer(name="Player1"), _ObservingPlayer(name="Player2")
+    game = cribbagegame.CribbageGame(players=[p0, p1], seed=5, copy_players=False)
+    game.play_round()
+    history = game.history[0]
+    assert p0.events[0] == ("deal", 6, 2)
+    assert p0.events[1][0] == "starter" and str(p0.events[1][1]) == str(history.starter)
+    plays = [e for e in p0.events[2:] if e[1] is not None]
+    assert [str(card) for _, card, _ in plays] == [str(pr.card) for pr in history.play_record if pr.card]
+    assert p1.events[2:] == p0.events[2:]
@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import pytest
+
+from cribbage import discard_table
+from cribbage.database import canonicalize_codes
+from cribbage.discard_table import (DiscardTable, DiscardTableError, _unrank_combination, build_discard_table,
+                                    compute_discard_rows, discard_options)
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import build_hand
+from cribbage.score_table import combination_rank
+from cribbage.scoring import score_hand
+from cribbage.strategies.crib_strategies import calc_crib_ranges_exact
+from cribbage.strategies.hand_strategies import exact_table_discard
+
+DEALT_HAND = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    rng = random.Random(0)
+    deals = {canonicalize_codes([c.to_index() for c in DEALT_HAND])[0]}
+    while len(deals) < 40:
+        deals.add(canonicalize_codes(rng.sample(range(52), 6))[0])
+    path = str(tmp_path_factory.mktemp("tables") / "discard_stats.bin")
+    return build_discard_table(path, deals=np.array(sorted(deals)), processes=1)
+
+
+def test_unrank_combination_inverts_combination_rank():
+    rng = random.Random(1)
+    for _ in range(100):
+        codes = sorted(rng.sample(range(52), 6))
+        assert _unrank_combination(combination_rank(codes), 6) == codes
+
+
+def test_discard_options_are_exact():
+    full_deck = get_full_deck()
+    starter_pool = [c for c in full_deck if c not in DEALT_HAND]
+    for option in discard_options(DEALT_HAND):
+        hand_scores = [score_hand(list(option.kept), starter_card=s) for s in starter_pool]
+        assert option.avg_hand == pytest.approx(sum(hand_scores) / len(hand_scores))
+        assert (option.min_hand, option.max_hand) == (min(hand_scores), max(hand_scores))
+        assert option.avg_crib == pytest.approx(calc_crib_ranges_exact(list(option.discards), starter_pool)[1])
+    # reference value from calculate_exact_crib_values_by_brute_force.py
+    by_kept = {frozenset(map(str, o.kept)): o for o in discard_options(DEALT_HAND)}
+    assert round(by_kept[frozenset(["2h", "7d", "9h", "10d"])].avg_crib, 2) == 7.1
+
+
+def test_table_lookup_matches_direct_computation(table, monkeypatch):
+    direct = discard_options(DEALT_HAND)
+    monkeypatch.setattr(discard_table._DISCARD_TABLE, "table", table)
+    assert discard_options(DEALT_HAND) == direct
+    canonical = canonicalize_codes([c.to_index() for c in DEALT_HAND])[0]
+    assert table.row(canonical) is not None
+    # deals outside a partial table are computed directly
+    assert table.row(canonicalize_codes([0, 13, 26, 39, 1, 14])[0]) is None
+
+
+def test_table_discard_follows_suit_relabelling(table, monkeypatch):
+    monkeypatch.setattr(discard_table._DISCARD_TABLE, "table", table)
+    relabelled = build_hand(["5s", "6d", "7c", "9s", "2s", "10c"])
+    for dealer_is_self in (True, False):
+        discards = exact_table_discard(DEALT_HAND, dealer_is_self)
+        swap = str.maketrans("hcd", "sdc")
+        assert tuple(str(c).translate(swap) for c in discards) == tuple(map(str, exact_table_discard(relabelled, dealer_is_self)))
+
+
+def test_corrupt_table_is_rejected(table, tmp_path):
+    path = tmp_path / "bad.bin"
+    data = bytearray(open(table.path, "rb").read())
+    data[-3] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(DiscardTableError):
+        DiscardTable(str(path), verify=True)
+    path.write_bytes(b"not a table" * 10)
+    with pytest.raises(DiscardTableError):
+        DiscardTable(str(path))
+
+
+
+def test_truncated_table_is_rejected(table, tmp_path, monkeypatch):
+    path = tmp_path / "short.bin"
+    path.write_bytes(open(table.path, "rb").read()[:-100])
+    with pytest.raises(DiscardTableError):
+        DiscardTable(str(path))
+    monkeypatch.setattr(discard_table, "DISCARD_TABLE_PATH", str(path))
+    monkeypatch.setattr(discard_table._DISCARD_TABLE, "table", None)
+    monkeypatch.setattr(discard_table._DISCARD_TABLE, "missing", False)
+    assert discard_table.get_discard_table() is None
+    assert len(discard_options(DEALT_HAND)) == 15
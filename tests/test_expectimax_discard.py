@@ -0,0 +1,83 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from cribbage.discard_table import discard_options
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.expectimax_player import ExpectimaxPlayer
+from cribbage.playingcards import build_hand
+from cribbage.strategies.expectimax_discard import ExpectimaxDiscard, pegging_totals
+from cribbage.strategies.pegging_solver import PeggingSolver
+from cribbage.utils import play_game
+
+HAND = build_hand(["5h", "5c", "jd", "qs", "2h", "9c"])
+
+
+def test_values_are_hand_and_crib_plus_solved_pegging():
+    evaluator = ExpectimaxDiscard(max_samples=8, seed=3)
+    values = evaluator.evaluate(HAND, dealer_is_self=False)
+    evaluator.reset(3)
+    opponents = evaluator.sample_opponent_hands(HAND, 8)
+    solver = PeggingSolver()
+    for value, option in zip(values, discard_options(HAND)):
+        assert value.discards == option.discards
+        assert value.hand_and_crib == pytest.approx(option.expected_total(False))
+        expected = np.mean([solver.solve(option.kept, opponent, my_turn=True) for opponent in opponents])
+        assert value.pegging == pytest.approx(expected)
+        assert value.total == pytest.approx(value.hand_and_crib + value.pegging)
+
+
+def test_discards_the_best_total():
+    evaluator = ExpectimaxDiscard(max_samples=16, seed=1)
+    for dealer_is_self in (True, False):
+        evaluator.reset(1)
+        best = max(evaluator.evaluate(HAND, dealer_is_self), key=lambda value: value.total)
+        evaluator.reset(1)
+        assert evaluator(HAND, dealer_is_self) == best.discards
+
+
+def test_uniform_opponent_hands_are_unseen_cards():
+    evaluator = ExpectimaxDiscard(infer_opponent=False, seed=2)
+    for sample in evaluator.sample_opponent_hands(HAND, 50):
+        assert len(set(sample)) == 4
+        assert not set(sample) & set(HAND)
+
+
+def test_time_budget_stops_after_one_opponent_hand():
+    kept = [option.kept for option in discard_options(HAND)]
+    opponents = ExpectimaxDiscard(seed=4).sample_opponent_hands(HAND, 20)
+    totals, n_solved = pegging_totals(kept, opponents, dealer_is_self=True, time_budget=0)
+    assert n_solved == 1
+    assert totals.shape == (15,)
+
+
+def test_parallel_matches_serial():
+    serial = ExpectimaxDiscard(max_samples=12, seed=5).evaluate(HAND, True)
+    evaluator = ExpectimaxDiscard(max_samples=12, seed=5, max_workers=2)
+    try:
+        parallel = evaluator.evaluate(HAND, True)
+        assert pickle.loads(pickle.dumps(evaluator)).pool._executor is None
+    finally:
+        evaluator.close()
+    assert [v.total for v in parallel] == pytest.approx([v.total for v in serial])
+
+
+def test_expectimax_player_plays_a_game():
+    player = ExpectimaxPlayer(seed=1, max_samples=4, discard_samples=4)
+    fork = player.fork(seed=2)
+    assert fork.discard_strategy is not player.discard_strategy
+    scores = play_game(player, BeginnerPlayer("beginner"), seed=3)
+    assert max(scores) >= 121
+    assert ExpectimaxPlayer().discard_strategy.infer_opponent
+    assert not ExpectimaxPlayer(discard_infer_opponent=False).discard_strategy.infer_opponent
+
+
+def test_expectimax_player_games_share_one_pool(started_pools):
+    player = ExpectimaxPlayer(seed=1, max_samples=4, discard_samples=4, max_workers=2)
+    for seed in range(2):
+        play_game(player, BeginnerPlayer("beginner"), seed=seed)
+    # pegging and discards of every game ran on the player's one pool
+    assert len(started_pools) == 1
+    player.close()
+    assert player.pool._executor is None
@@ -0,0 +1,100 @@
+import itertools
+import logging
+import random
+
+import numpy as np
+import pytest
+
+from cribbage.fast_scoring import count_fifteens, crib_deal_codes, score_hand_codes, score_hands_batch
+from cribbage.players.rule_based_player import expected_crib_score, get_full_deck
+from cribbage.playingcards import Card, build_hand
+import cribbage.scoring as scoring
+from cribbage.scoring import _score_hand_conditions, score_hand
+
+
+def assert_same_score(cards, starter):
+    codes = [c.to_index() for c in cards]
+    starter_code = starter.to_index() if starter is not None else None
+    for is_crib in (False, True):
+        expected = _score_hand_conditions(list(cards), is_crib=is_crib, starter_card=starter)
+        assert score_hand_codes(codes, starter_code, is_crib=is_crib) == expected, (cards, starter, is_crib)
+
+
+def test_count_fifteens():
+    assert count_fifteens([5, 5, 5, 10]) == 4
+    assert count_fifteens([5, 5, 5, 5, 10]) == 8
+    assert count_fifteens([1, 2, 3]) == 0
+
+
+def test_fast_scorer_known_hands():
+    assert score_hand_codes([c.to_index() for c in build_hand("5h|5c|5s|jd")], Card("5d").to_index()) == 29
+    assert score_hand_codes([c.to_index() for c in build_hand("3h|4h|5h|6h")]) == 10
+    assert score_hand_codes([c.to_index() for c in build_hand("ah|2h|9h|10h")], Card("ks").to_index(), is_crib=True) == 0
+    assert score_hand_codes([c.to_index() for c in build_hand("ah|2h|9h|10h")], Card("kh").to_index(), is_crib=True) == 5
+
+
+def test_fast_scorer_matches_score_conditions_on_sample():
+    full_deck = get_full_deck()
+    rng = random.Random(42)
+    for _ in range(1000):
+        cards = rng.sample(full_deck, 5)
+        assert_same_score(cards[:4], cards[4])
+        assert_same_score(cards[:4], None)
+        assert_same_score(cards[:2], None)
+        assert_same_score(cards[:2], cards[4])
+
+
+def test_score_hand_uses_same_rules_for_partial_hands():
+    assert score_hand(build_hand("3h|4h|5h|6h"), is_crib=False) == 10
+    assert score_hand(build_hand("5h|10d"), is_crib=True) == 2
+    assert score_hand(build_hand("jh|ac|8s|9d|kh"), is_crib=True) == 1
+
+
+def test_batch_scorer_matches_score_hand_codes():
+    rng = random.Random(5)
+    rows = np.array([rng.sample(range(52), 5) for _ in range(20000)])
+    starter_idx = np.array([rng.randrange(5) for _ in range(len(rows))])
+    is_crib = np.array([rng.random() < 0.5 for _ in range(len(rows))])
+    scores = score_hands_batch(rows, is_crib=is_crib, starter_idx=starter_idx)
+    for row, starter_i, crib, score in zip(rows.tolist(), starter_idx, is_crib, scores):
+        hand = row[:starter_i] + row[starter_i + 1:]
+        assert score_hand_codes(hand, row[starter_i], is_crib=bool(crib)) == score
+    perfect = [c.to_index() for c in build_hand("5h|5c|5s|jd|5d")]
+    assert score_hands_batch(np.array([perfect]))[0] == 29
+    assert score_hands_batch(np.array([perfect]), starter_idx=3)[0] == 28
+
+
+def test_crib_deals_cover_every_opponent_discard_and_starter():
+    full_deck = get_full_deck()
+    dealt = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+    pool = [c for c in full_deck if c not in dealt]
+    cribs = crib_deal_codes([dealt[0].to_index(), dealt[1].to_index()], [c.to_index() for c in pool])
+    assert cribs.shape == (1035 * 44, 5)
+    assert len({tuple(sorted(r[2:4])) + (r[4],) for r in cribs.tolist()}) == len(cribs)
+    assert all(len(set(r)) == 5 for r in cribs[::97].tolist())
+    # keeping 2h 7d 9h 10d, reference value from the brute force script
+    assert round(-expected_crib_score(dealt[:2], full_deck, dealt, dealer_is_self=False), 2) == 7.1
+
+
+@pytest.mark.super_slow
+def test_fast_scorer_matches_score_conditions_for_all_5_card_hands():
+    full_deck = get_full_deck()
+    for i, combo in enumerate(itertools.combinations(full_deck, 5)):
+        starter = combo[i % 5]
+        assert_same_score([c for c in combo if c is not starter], starter)
+
+
+def test_score_hand_takes_fast_path_with_debug_logging(monkeypatch, caplog):
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return score_hand_codes(*args, **kwargs)
+
+    monkeypatch.setattr(scoring, "score_hand_codes", counting)
+    with caplog.at_level(logging.DEBUG, logger="cribbage.scoring"):
+        assert score_hand(build_hand("5h|5c|5s|jd"), starter_card=Card("5d")) == 29
+        assert len(calls) == 1
+        assert score_hand(build_hand("5h|5c|5s|jd"), starter_card=Card("5d"), describe=True) == 29
+    assert len(calls) == 1
+    assert any("[EOR SCORING]" in record.message for record in caplog.records)
@@ -155,3 +155,31 @@ def test_go_scenario_with_continuation():
     #     f"This may indicate play order changed with RNG updates."
     
     # logger.info("✓ GO scenario test passed - table sequence is correct!")
+
+
+def test_running_counts_match_the_table():
+    p0 = RandomPlayer(name="Player1", seed=1)
+    p1 = PlayFirstCardPlayer(name="Player2")
+    for seed in range(30):
+        game1 = CribbageGame(players=[p0, p1], seed=seed)
+        round1 = CribbageRound(game=game1, dealer=game1.players[seed % 2], seed=seed)
+        round1.play()
+        for play_record in round1.play_record:
+            assert play_record.table_count == sum(c.get_value() for c in play_record.active_table)
+        assert round1.get_table_value(0) == sum(c.get_value() for c in round1.table)
+        assert round1.get_table_value(round1.sequence_start_idx) == sum(c.get_value() for c in round1.table[round1.sequence_start_idx:])
+
+
+def test_can_play_uses_the_cheapest_card_in_hand():
+    p0 = PlayFirstCardPlayer(name="Player1")
+    p1 = PlayFirstCardPlayer(name="Player2")
+    game1 = CribbageGame(players=[p0, p1], seed=123)
+    round1 = CribbageRound(game=game1, dealer=p0, seed=123)
+    round1.hands = {p0.name: build_hand(['kh', '5d']), p1.name: []}
+    round1._start_pegging()
+    for card in build_hand(['10s', 'qs']):
+        round1.table.append(card)
+        round1.pegging_sequence.push(card)
+    assert round1.can_play(p0) and not round1.can_play(p1)
+    round1.pegging_sequence.push(Card('7c'))
+    assert not round1.can_play(p0)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from cribbage.league import League, MatchCache, fit_bradley_terry, player_key
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.play_first_card_player import PlayFirstCardPlayer
+from cribbage.players.random_player import RandomPlayer
+from cribbage.utils import play_multiple_games
+
+
+def _players():
+    return [RandomPlayer(name="RandomPlayer", seed=1), BeginnerPlayer(name="BeginnerPlayer"),
+            PlayFirstCardPlayer(name="PlayFirstCardPlayer")]
+
+
+def test_fit_bradley_terry_recovers_strengths():
+    theta = np.array([1.0, 0.0, -1.0])
+    p = 1 / (1 + np.exp(theta[None, :] - theta[:, None]))
+    games = np.full((3, 3), 4000.0)
+    np.fill_diagonal(games, 0)
+    fitted, se = fit_bradley_terry(games * p, games, prior_games=0)
+    assert fitted == pytest.approx(theta, abs=1e-6)
+    assert np.all(se > 0) and np.all(se < 0.05)
+    # a player that never lost stays finite
+    wins = np.array([[0, 10], [0, 0]], dtype=float)
+    fitted, _ = fit_bradley_terry(wins, np.array([[0, 10], [10, 0]], dtype=float))
+    assert np.all(np.isfinite(fitted)) and fitted[0] > fitted[1]
+
+
+def test_league_ratings_and_results(tmp_path):
+    league = League(_players(), games_per_pairing=20, seed=4, cache_path=str(tmp_path / "league.json"))
+    assert league.run() == 60
+    ratings = league.ratings()
+    assert ratings[0].name == "BeginnerPlayer"
+    assert sum(r.games for r in ratings) == 120
+    assert all(r.wins + r.losses + r.ties == r.games for r in ratings)
+    results = league.results()
+    # a pairing replays the games play_multiple_games would play in cache order
+    random_player, beginner_player = league.players[:2]
+    if player_key(beginner_player) < player_key(random_player):
+        expected = [-d for d in play_multiple_games(20, beginner_player, random_player, seed=4)["diffs"]]
+    else:
+        expected = play_multiple_games(20, random_player, beginner_player, seed=4)["diffs"]
+    assert results[("RandomPlayer", "BeginnerPlayer")]["diffs"] == expected
+    assert "BeginnerPlayer" in league.leaderboard().splitlines()[1]
+
+
+def test_league_only_plays_missing_games(tmp_path):
+    path = str(tmp_path / "league.json")
+    players = _players()
+    assert League(players[:2], games_per_pairing=10, seed=4, cache_path=path).run() == 10
+    # a new bot only costs its own pairings, and more games only the extra ones
+    league = League(players, games_per_pairing=10, seed=4, cache_path=path)
+    assert league.run() == 20
+    assert league.run() == 0
+    league.games_per_pairing = 15
+    assert league.run() == 15
+    with pytest.raises(ValueError):
+        league.add_player(RandomPlayer(name="RandomPlayer"))
+
+
+def test_match_cache_reads_pairings_either_way(tmp_path):
+    cache = MatchCache(str(tmp_path / "cache.json"))
+    cache.put("a", "b", 1, [3, -2, 0])
+    cache.save()
+    reloaded = MatchCache(str(tmp_path / "cache.json"))
+    assert reloaded.get("a", "b", 1) == [3, -2, 0]
+    assert reloaded.get("b", "a", 1) == [-3, 2, 0]
+    assert reloaded.get("a", "b", 2) == []
+
+
+def test_league_pool_matches_serial_run():
+    serial = League(_players(), games_per_pairing=6, seed=2, chunk_size=4)
+    serial.run()
+    parallel = League(_players(), games_per_pairing=6, seed=2, chunk_size=4, max_workers=2)
+    parallel.run()
+    assert parallel.results() == serial.results()
+    assert parallel.ratings() == serial.ratings()
+
+
+def test_players_of_one_class_keep_their_own_games(tmp_path):
+    path = str(tmp_path / "league.json")
+    players = [RandomPlayer(name="r1"), RandomPlayer(name="r2"), BeginnerPlayer(name="b")]
+    assert len({player_key(p) for p in players}) == 3
+    league = League(players, games_per_pairing=4, cache_path=path)
+    assert league.run() == 12
+    assert League(players, games_per_pairing=4, cache_path=path).run() == 0
+    # the same class under another name is a new entry
+    assert League([RandomPlayer(name="r3"), players[2]], games_per_pairing=4, cache_path=path).run() == 4
+
+
+def test_league_rejects_players_with_one_cache_key():
+    class Unnamed(RandomPlayer):
+        def cache_key(self):
+            return "unnamed"
+
+    with pytest.raises(ValueError):
+        League([Unnamed(name="u1"), Unnamed(name="u2")])
@@ -1,11 +1,14 @@
 from collections import defaultdict
+import subprocess
+import sys
 import time
 import itertools
 import numpy as np
 import pytest
-from cribbage.strategies.crib_strategies import calc_crib_ranges_almost_exact, calc_crib_ranges_exact_and_slow, calc_crib_ranges_fast
+from cribbage.strategies.crib_strategies import calc_crib_min_only_given_6_cards, calc_crib_ranges_almost_exact, calc_crib_ranges_exact_and_slow, calc_crib_ranges_fast
 from cribbage.database import normalize_hand_to_str
-from cribbage.strategies.hand_strategies import process_dealt_hand_only_exact
+from cribbage.strategies.hand_strategies import (exact_hand_and_min_crib, format_discard_table, merge_discard_stats,
+                                                 process_dealt_hand_only_exact)
 from cribbage.players.medium_player import MediumPlayer
 from cribbage.players.rule_based_player import get_full_deck
 from cribbage.playingcards import build_hand
@@ -414,4 +417,21 @@ def test_calc_crib_ranges_fast_close_enough():
     # Performance assertion - should be much faster than original 13+ seconds
     # Current implementation achieves ~8s (63% improvement over original)
     max_elapsed_time = 0.5
-    assert elapsed_time < max_elapsed_time, f"Test took {elapsed_time:.2f}s, expected < {max_elapsed_time}s"
\ No newline at end of file
+    assert elapsed_time < max_elapsed_time, f"Test took {elapsed_time:.2f}s, expected < {max_elapsed_time}s"
+
+def test_discard_stats_rows_keep_discard_order_and_hand_cards():
+    hand = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+    hand_results = process_dealt_hand_only_exact([hand, get_full_deck(), {}])
+    crib_results = calc_crib_min_only_given_6_cards(hand)
+    rows = merge_discard_stats(hand, hand_results, crib_results, dealer_is_self=False)
+    assert [normalize_hand_to_str(row[0]) for row in rows] == [crib_key for _, crib_key, _, _ in crib_results]
+    for row in rows:
+        assert all(any(card is c for c in hand) for card in row[0])
+        assert row[6] == row[3] - row[5]
+    assert "avg_total" in format_discard_table(rows)
+    assert exact_hand_and_min_crib(hand, dealer_is_self=False) == max(rows, key=lambda row: row[6])[0]
+
+
+def test_players_do_not_import_pandas():
+    code = "import sys, cribbage.players.medium_player, cribbage.players.beginner_player; print('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == "False"
@@ -0,0 +1,87 @@
+import pickle
+
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.monte_carlo_player import MonteCarloPeggingPlayer
+from cribbage.playingcards import Card, build_hand
+from cribbage.strategies.pegging_solver import PeggingSolver
+from cribbage.utils import play_game
+
+
+def _player_after_deal(**kwargs):
+    player = MonteCarloPeggingPlayer(name="mc", seed=1, **kwargs)
+    dealt = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+    player.observe_deal(dealt, tuple(dealt[4:]))
+    player.observe_starter(Card("kc"))
+    return player
+
+
+def test_samples_fit_everything_seen():
+    player = _player_after_deal()
+    player.observe_play("opponent", Card("4s"), 0)
+    player.observe_play("mc", Card("5h"), 4)
+    player.observe_play("opponent", None, 24)
+    assert player.opponent_said_go()
+    seen = {Card("4s"), Card("kc")} | set(build_hand(["5h", "6c", "7d", "9h", "2h", "10d"]))
+    for sample in player.sample_opponent_hands(50):
+        assert len(sample) == 3
+        assert not seen & set(sample)
+        # they could not play at 24, so every card they hold is worth more than 7
+        assert all(c.get_value() > 7 for c in sample)
+    player.observe_play("mc", None, 24)
+    assert not player.opponent_said_go()
+
+
+def test_plays_the_solver_move_when_the_opponent_hand_is_known():
+    player = _player_after_deal()
+    opponent_cards = build_hand(["4s", "5s", "jc", "qs"])
+    for count, card in zip((0, 4, 9, 19), opponent_cards):
+        player.observe_play("opponent", card, count)
+    hand = build_hand(["5h", "6c", "7d", "9h"])
+    assert player.sample_opponent_hands(3) == [[]]
+    assert player.select_card_to_play(hand, table=[], count=0) == PeggingSolver().best_play(hand, [])
+
+
+def test_games_are_reproducible_and_pool_matches_inline():
+    inline = play_game(MonteCarloPeggingPlayer(name="mc", seed=1, max_samples=8), BeginnerPlayer(name="beginner"), seed=4)
+    assert play_game(MonteCarloPeggingPlayer(name="mc", seed=1, max_samples=8), BeginnerPlayer(name="beginner"), seed=4) == inline
+    pooled = MonteCarloPeggingPlayer(name="mc", seed=1, max_samples=8, max_workers=2)
+    assert play_game(pooled, BeginnerPlayer(name="beginner"), seed=4) == inline
+    # the game's fork started the pool the player holds, which is not pickled
+    assert pooled.pool._executor is not None
+    assert pickle.loads(pickle.dumps(pooled)).pool._executor is None
+    pooled.close()
+    assert pooled.pool._executor is None
+
+
+def test_games_share_one_pool(started_pools):
+    player = MonteCarloPeggingPlayer(name="mc", seed=1, max_samples=4, max_workers=2)
+    for seed in range(3):
+        play_game(player, BeginnerPlayer(name="beginner"), seed=seed)
+    assert len(started_pools) == 1
+    player.close()
+    assert player.pool._executor is None
+
+
+def test_time_budget_limits_the_samples():
+    player = _player_after_deal(max_samples=10_000, time_budget=0.01)
+    hand = build_hand(["5h", "6c", "7d", "9h"])
+    totals, n_solved = player._evaluate(hand, player.sample_opponent_hands(player.max_samples), [], False)
+    assert 1 <= n_solved < 10_000
+    assert set(totals) == set(hand)
+
+
+def test_samples_from_the_opponent_model():
+    player = _player_after_deal(infer_opponent=True)
+    # observe_deal built the model from my 6 cards, observe_starter narrowed it
+    assert player._opponent_model is not None
+    player.observe_play("opponent", Card("10s"), 0)
+    player.observe_play("mc", Card("5h"), 10)
+    player.observe_play("opponent", Card("qs"), 15)
+    player.observe_play("mc", None, 25)
+    player.observe_play("opponent", None, 25)
+    for sample in player.sample_opponent_hands(20):
+        assert len(sample) == 2 and all(c.get_value() > 6 for c in sample)
+    inline = play_game(MonteCarloPeggingPlayer(name="mc", seed=1, max_samples=8, infer_opponent=True),
+                       BeginnerPlayer(name="beginner"), seed=4)
+    assert play_game(MonteCarloPeggingPlayer(name="mc", seed=1, max_samples=8, infer_opponent=True),
+                     BeginnerPlayer(name="beginner"), seed=4) == inline
@@ -0,0 +1,93 @@
+import random
+from math import comb
+
+import numpy as np
+import pytest
+
+from cribbage import cribbagegame
+from cribbage.opponent_model import OpponentHandModel, expected_keep_values
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.playingcards import Card, build_hand
+from cribbage.scoring import score_hand
+
+MY_DEAL = build_hand(["5h", "6c", "7d", "9h", "2h", "10d"])
+
+
+def _flat_model(**kwargs):
+    return OpponentHandModel(MY_DEAL, discard_model=lambda hands, unseen: np.zeros(len(hands)), **kwargs)
+
+
+def test_keep_values_are_exact_averages_over_the_starter():
+    rng = random.Random(0)
+    unseen = [c for c in range(52) if c not in {card.to_index() for card in MY_DEAL}]
+    hands = [sorted(rng.sample(unseen, 4)) for _ in range(20)]
+    hands += [[Card(c).to_index() for c in ("jh", "qh", "kh", "ah")], [Card(c).to_index() for c in ("5s", "5c", "js", "4s")]]
+    values = expected_keep_values(np.array(hands), unseen)
+    for hand, value in zip(hands, values):
+        cards = [Card.from_index(c) for c in hand]
+        starters = [Card.from_index(c) for c in unseen if c not in hand]
+        assert value == pytest.approx(sum(score_hand(cards, starter_card=s) for s in starters) / len(starters))
+
+
+def test_prior_covers_every_hand_i_have_not_seen():
+    model = OpponentHandModel(MY_DEAL)
+    assert len(model) == comb(46, 4)
+    probabilities = model.card_probabilities()
+    assert probabilities.sum() == pytest.approx(4)
+    assert all(probabilities[c.to_index()] == 0 for c in MY_DEAL)
+    # opponents keep 5s more often than lone kings
+    assert model.card_probability(Card("5s")) > model.card_probability(Card("ks"))
+    model.observe_starter(Card("kc"))
+    assert len(model) == comb(45, 4)
+    assert model.card_probability(Card("kc")) == 0
+
+
+def test_a_play_keeps_only_hands_holding_the_card():
+    model = _flat_model(starter=Card("kc"), play_beta=0)
+    model.observe_play(Card("10s"))
+    assert len(model) == comb(44, 3)
+    assert model.card_probability(Card("10s")) == 0
+    # flat prior and any card as likely at 0: the other 3 cards are uniform over the rest
+    assert model.card_probability(Card("4c")) == pytest.approx(3 / 44)
+    assert model.card_probabilities().sum() == pytest.approx(3)
+
+
+def test_plays_that_miss_points_are_evidence():
+    model = _flat_model(starter=Card("kc"))
+    # they answered the 10 with a queen instead of pairing or making 15
+    model.observe_play(Card("qs"), table=build_hand(["10c"]))
+    flat = _flat_model(starter=Card("kc"), play_beta=0)
+    flat.observe_play(Card("qs"), table=build_hand(["10c"]))
+    assert model.card_probability(Card("5s")) < flat.card_probability(Card("5s"))
+    assert model.rank_probabilities()[4] < flat.rank_probabilities()[4]
+
+
+def test_a_go_rules_out_cards_that_fit():
+    model = OpponentHandModel(MY_DEAL, starter=Card("kc"))
+    model.observe_play(Card("10s"))
+    model.observe_go(25)
+    probabilities = model.card_probabilities()
+    assert all(probabilities[c] == 0 for c in range(52) if Card.from_index(c).get_value() <= 6)
+    assert model.probability(lambda hands: (hands >= 0).sum(axis=1) == 3) == pytest.approx(1)
+    for hand in model.sample_hands(20, random.Random(0)):
+        assert len(hand) == 3 and all(c.get_value() > 6 for c in hand)
+    # evidence that contradicts every hand is ignored
+    size = len(model)
+    model.observe_play(MY_DEAL[0])
+    assert len(model) == size
+
+
+def test_records_of_a_round_narrow_down_to_the_opponents_hand():
+    p0, p1 = MediumPlayer(name="medium"), BeginnerPlayer(name="beginner")
+    game = cribbagegame.CribbageGame(players=[p0, p1], seed=8, copy_players=False)
+    game.play_round()
+    cribbage_round = game.history[0]
+    model = OpponentHandModel(build_hand(cribbage_round.history.cards_dealt["medium"]), starter=cribbage_round.starter)
+    records = cribbage_round.play_record
+    model.observe_records(records[:len(records) // 2], opponent_name="beginner")
+    assert 1 <= len(model) < comb(45, 4)
+    model.observe_records(records, opponent_name="beginner")
+    # every one of their cards was played
+    assert len(model) == 1
+    assert model.card_probabilities().sum() == 0
@@ -0,0 +1,53 @@
+import random
+
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import Card, build_hand
+from cribbage.scoring import PeggingSequence, score_play
+
+
+def _random_sequences(n_sequences, seed=0):
+    """Random legal "up to 31" sequences of cards."""
+    rng = random.Random(seed)
+    full_deck = get_full_deck()
+    for _ in range(n_sequences):
+        deck = full_deck[:]
+        rng.shuffle(deck)
+        sequence, count = [], 0
+        for card in deck:
+            if count + card.get_value() > 31:
+                break
+            sequence.append(card)
+            count += card.get_value()
+        yield sequence
+
+
+def test_push_matches_score_play():
+    for sequence in _random_sequences(2000):
+        pegging_sequence = PeggingSequence()
+        for i, card in enumerate(sequence):
+            assert pegging_sequence.preview(card) == score_play(sequence[:i + 1])
+            assert pegging_sequence.push(card) == score_play(sequence[:i + 1])
+        assert pegging_sequence.count == sum(c.get_value() for c in sequence)
+
+
+def test_runs_pairs_and_fifteens():
+    pegging_sequence = PeggingSequence(build_hand(['4h', '6d', '5c']))
+    assert pegging_sequence.count == 15
+    assert pegging_sequence.preview(Card('3s')) == (4, "4-card straight")
+    assert pegging_sequence.preview(Card('7s')) == (4, "4-card straight")
+    assert pegging_sequence.preview(Card('5s')) == (2, "Pair (5)")
+    pegging_sequence.push(Card('5s'))
+    # the repeated 5 breaks the run
+    assert pegging_sequence.preview(Card('7s')) == (0, "")
+    assert pegging_sequence.preview(Card('5d')) == (6, "Pair Royal (5)")
+    assert PeggingSequence(build_hand(['10h', '4d'])).preview(Card('ac')) == (2, "15 count")
+    assert PeggingSequence(build_hand(['7h', '7d'])).preview(Card('ac')) == (2, "15 count")
+
+
+def test_preview_does_not_mutate_and_reset_clears():
+    pegging_sequence = PeggingSequence(build_hand(['kh', 'qd']))
+    pegging_sequence.preview(Card('jc'))
+    assert len(pegging_sequence) == 2 and pegging_sequence.count == 20
+    pegging_sequence.reset()
+    assert len(pegging_sequence) == 0 and pegging_sequence.count == 0
+    assert pegging_sequence.preview(Card('jc')) == (0, "")
@@ -0,0 +1,124 @@
+import random
+import time
+
+import pytest
+
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import Card, build_hand
+from cribbage.scoring import PeggingSequence
+from cribbage.strategies.pegging_solver import PeggingSolver, play_rank, solve_pegging
+
+
+def _reference_value(mine, theirs, table, other_go):
+    """Plain minimax over real cards, scoring with PeggingSequence."""
+    sequence = PeggingSequence(table)
+    playable = [c for c in mine if sequence.count + c.get_value() <= 31]
+    if not playable:
+        if other_go:
+            return 1 - _reference_value(theirs, mine, [], False)
+        return -_reference_value(theirs, mine, table, True)
+    best = None
+    for card in playable:
+        points, _ = PeggingSequence(table).preview(card)
+        count = sequence.count + card.get_value()
+        points += count == 31
+        rest = [c for c in mine if c is not card]
+        if not rest and not theirs:
+            value = points + 1
+        elif other_go:
+            value = points + _reference_value(rest, theirs, table + [card], True)
+        else:
+            value = points - _reference_value(theirs, rest, table + [card], False)
+        best = value if best is None else max(best, value)
+    return best
+
+
+def _random_hands(rng, n_cards=4):
+    cards = rng.sample(get_full_deck(), 2 * n_cards)
+    return cards[:n_cards], cards[n_cards:]
+
+
+def test_play_rank_scores_like_pegging_sequence():
+    rng = random.Random(0)
+    for _ in range(300):
+        sequence = PeggingSequence()
+        count, tail, same = 0, (), 0
+        for card in rng.sample(get_full_deck(), 8):
+            if sequence.count + card.get_value() > 31:
+                break
+            expected, _ = sequence.push(card)
+            points, count, tail, same = play_rank(count, tail, same, card.rank_order)
+            assert points == expected + (count == 31)
+            assert count == sequence.count
+
+
+def test_simple_positions():
+    # my 5 then their 10 for 15 and last card
+    assert solve_pegging(build_hand(["5h"]), build_hand(["kd"])) == -3
+    # pairing my 7 lets me make pairs royal, so they play the ace: my 7 for 15, their pair and last card
+    assert solve_pegging(build_hand(["7h", "7c"]), build_hand(["7d", "ad"])) == 2 - 2 - 1
+    # at 25 I say go; their 6 makes 31 for 1 and the go for 1, then I lead the 8 for the last card
+    assert solve_pegging(build_hand(["8h"]), build_hand(["6d"]), table=build_hand(["10h", "10c", "5d"])) == 1 - 2
+    assert solve_pegging([], []) == 0
+
+
+def test_solver_matches_plain_minimax():
+    rng = random.Random(1)
+    solver = PeggingSolver()
+    for _ in range(40):
+        mine, theirs = _random_hands(rng, n_cards=3)
+        assert solver.solve(mine, theirs) == _reference_value(mine, theirs, [], False)
+        assert solver.solve(mine, theirs, my_turn=False) == -_reference_value(theirs, mine, [], False)
+    for _ in range(20):
+        mine, theirs = _random_hands(rng)
+        table = [theirs.pop()]
+        if mine:
+            values = solver.play_values(mine, theirs, table)
+            assert max(values.values()) == solver.solve(mine, theirs, table) == _reference_value(mine, theirs, table, False)
+        assert solver.solve(mine, theirs, table, other_said_go=True) == _reference_value(mine, theirs, table, True)
+
+
+def test_suits_do_not_matter_and_warm_solves_are_cached():
+    solver = PeggingSolver()
+    mine, theirs = build_hand(["5h", "6c", "7d", "jh"]), build_hand(["5s", "9c", "10d", "4h"])
+    value = solver.solve(mine, theirs)
+    size = len(solver.transpositions)
+    relabel = str.maketrans("hcds", "sdhc")
+    assert solver.solve([Card(str(c).translate(relabel)) for c in mine],
+                        [Card(str(c).translate(relabel)) for c in theirs]) == value
+    assert len(solver.transpositions) == size
+    assert solver.best_play(mine, theirs) in mine
+
+    rng = random.Random(2)
+    deals = [_random_hands(rng) for _ in range(50)]
+    values = [solver.solve(mine, theirs) for mine, theirs in deals]
+    size = len(solver.transpositions)
+    assert [solver.solve(mine, theirs) for mine, theirs in deals] == values
+    assert len(solver.transpositions) == size
+
+
+@pytest.mark.slow
+def test_warm_solves_are_fast():
+    solver = PeggingSolver()
+    rng = random.Random(2)
+    deals = [_random_hands(rng) for _ in range(50)]
+    for mine, theirs in deals:
+        solver.solve(mine, theirs)
+    start = time.perf_counter()
+    for mine, theirs in deals:
+        solver.solve(mine, theirs)
+    # about 6 microseconds a solve on a quiet machine
+    assert (time.perf_counter() - start) / len(deals) < 0.05
+
+
+def test_transposition_table_is_bounded():
+    solver = PeggingSolver(max_transpositions=1000)
+    reference = PeggingSolver()
+    rng = random.Random(3)
+    for _ in range(30):
+        mine, theirs = _random_hands(rng)
+        before = len(solver.transpositions)
+        assert solver.solve(mine, theirs) == reference.solve(mine, theirs)
+        # cleared before a search once full, so it never grows past one search over the bound
+        assert before <= 1000 or len(solver.transpositions) < before
+    assert len(solver.transpositions) < 1000 + max(len(reference.transpositions), 1)
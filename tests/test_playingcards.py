@@ -1,3 +1,6 @@
+import copy
+import pickle
+import random
 import unittest
 
 from pytest import raises
@@ -56,5 +59,47 @@ def test_card_creation_invalid():
     assert str(context.value) == "Card is created with rank then suit, passed in suit first"
 
 
+def test_cards_are_interned_and_immutable():
+    card = Card('10h')
+    assert Card('10h') is card
+    assert Card.from_index(card.to_index()) is card
+    assert copy.deepcopy([card])[0] is card
+    assert pickle.loads(pickle.dumps(card)) is card
+    assert all(c is Card.from_index(c.to_index()) for c in Deck(seed=1).cards)
+    assert Card('10h') != Card('10d') and Card('10h') == 10
+    with raises(AttributeError):
+        card.rank = 'k'
+    assert not hasattr(card, '__dict__')
+    with raises(ValueError):
+        Card('5x')
+
+
+def test_deck_matches_shuffling_a_list_of_cards():
+    new_deck_order = [Card(f"{r}{s}") for r in Deck.RANKS for s in Deck.SUITS]
+    for seed in range(20):
+        deck = Deck(seed=seed)
+        rng = random.Random(seed)
+        cards = new_deck_order[:]
+        rng.shuffle(cards)
+        assert deck.cards == cards
+        for cut_point in (17, 0, 5):
+            deck.cut(cut_point=cut_point)
+            cards = cards[cut_point:] + cards[:cut_point]
+            assert [deck.draw() for _ in range(6)] == [cards.pop() for _ in range(6)]
+            assert deck.cards == cards and len(deck) == len(cards)
+        deck.shuffle()
+        rng.shuffle(cards)
+        assert deck.cards == cards
+
+
+def test_deck_reset_is_the_same_as_a_new_deck():
+    deck = Deck(seed=1)
+    deck.cut(cut_point=20)
+    deck.draw()
+    for seed in (5, 6, 5):
+        deck.reset(seed)
+        assert deck.cards == Deck(seed=seed).cards
+    assert deck.draw() is Deck(seed=5).draw()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,84 @@
+import pytest
+
+from cribbage import win_table
+from cribbage.benchmarks import play_pegging_hands
+from cribbage.cribbagegame import CribbageGame
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.medium_player import MediumPlayer
+from cribbage.players.score_aware_player import ScoreAwarePlayer
+from cribbage.playingcards import Card, build_hand
+from cribbage.win_table import WinTable, simulate_round_distributions
+
+
+@pytest.fixture(scope="module")
+def table():
+    return WinTable.from_distributions(simulate_round_distributions(200, BeginnerPlayer("p0"), BeginnerPlayer("p1"), seed=5))
+
+
+@pytest.fixture
+def with_table(table, monkeypatch):
+    monkeypatch.setattr(win_table._WIN_TABLE, "table", table)
+
+
+@pytest.fixture
+def without_table(monkeypatch):
+    monkeypatch.setattr(win_table._WIN_TABLE, "table", None)
+    monkeypatch.setattr(win_table._WIN_TABLE, "missing", True)
+
+
+def _player_in_round(your_score, opponent_score, dealt, starter="kc"):
+    player = ScoreAwarePlayer(name="aware")
+    hand = build_hand(dealt)
+    discards = player.select_crib_cards(hand, dealer_is_self=False, your_score=your_score, opponent_score=opponent_score)
+    player.observe_deal(hand, discards)
+    player.observe_starter(Card(starter))
+    return player, [c for c in hand if c not in discards]
+
+
+def test_tracks_the_pegging_score():
+    for seed in range(20):
+        player = ScoreAwarePlayer(name="aware")
+        game = CribbageGame([player, BeginnerPlayer("beginner")], seed=seed, copy_players=False)
+        game.play_round()
+        history = game.history[0].history
+        assert [player.your_score, player.opponent_score] == history.score_after_pegging
+
+
+def test_tracks_the_score_in_the_pegging_harness():
+    # the harness discards for the player, so it learns the dealer from who leads
+    result = play_pegging_hands(30, ScoreAwarePlayer(name="sa"), MediumPlayer(name="m"), seed=0)
+    assert result["pairs"] == 30
+    for dealer_is_self in (True, False):
+        player = ScoreAwarePlayer(name="sa")
+        player.observe_deal(build_hand(["5h", "6c", "7d", "9h", "2h", "10d"]), ())
+        player.observe_starter(Card("jc"))
+        if dealer_is_self:
+            player.observe_play("other", Card("4s"), 0)
+        else:
+            player.select_card_to_play(build_hand(["5h", "6c", "7d", "9h"]), [], 0)
+        assert (player.your_score, player.opponent_score) == ((2, 0) if dealer_is_self else (0, 2))
+
+
+def test_pegs_out_when_it_can(with_table):
+    player, _ = _player_in_round(119, 100, ["10h", "2c", "3d", "9s", "qs", "kd"])
+    # 10 on a 5 makes 15 for the last 2 points
+    assert player.select_card_to_play(build_hand(["2c", "10h", "3d"]), build_hand(["5s"]), 5) == Card("10h")
+
+
+def test_avoids_replies_that_peg_out(with_table):
+    player, _ = _player_in_round(60, 119, ["5h", "9c", "ad", "as", "qs", "kd"])
+    # leading a 5 lets any of 16 ten-cards make 15, a 9 only the sixes and the other nines
+    assert player.opponent_pegs_out_chance([], Card("5h")) > player.opponent_pegs_out_chance([], Card("9c")) > 0
+    assert player.select_card_to_play(build_hand(["5h", "9c"]), [], 0) == Card("9c")
+    # with the opponent far from 121 nothing is risky
+    player, _ = _player_in_round(95, 60, ["5h", "9c", "ad", "as", "qs", "kd"])
+    assert player.opponent_pegs_out_chance([], Card("5h")) == 0
+
+
+def test_plays_like_medium_without_a_table(without_table):
+    aware, medium = ScoreAwarePlayer(name="aware"), MediumPlayer(name="aware")
+    hand = build_hand(["4s", "8h", "jh", "6s", "kd", "9d"])
+    assert aware.select_crib_cards(hand, False, 116, 119) == medium.select_crib_cards(hand, False, 116, 119)
+    for seed in range(5):
+        scores = [CribbageGame([p, BeginnerPlayer("beginner")], seed=seed).start() for p in (aware, medium)]
+        assert scores[0] == scores[1]
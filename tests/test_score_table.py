@@ -0,0 +1,67 @@
+import itertools
+import random
+
+import pytest
+
+from cribbage import score_table
+from cribbage.players.rule_based_player import get_full_deck
+from cribbage.playingcards import Card, build_hand
+from cribbage.score_table import N_COMBINATIONS, ScoreTable, ScoreTableError, build_score_table, combination_rank
+from cribbage.scoring import score_hand
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    return build_score_table(str(tmp_path_factory.mktemp("tables") / "five_card_scores.bin"))
+
+
+def test_combination_rank_is_a_bijection_for_small_sets():
+    ranks = [combination_rank(c) for c in itertools.combinations(range(10), 3)]
+    assert sorted(ranks) == list(range(len(ranks)))
+    assert combination_rank([47, 48, 49, 50, 51]) == N_COMBINATIONS - 1
+
+
+@pytest.mark.slow
+def test_table_matches_score_hand(table):
+    full_deck = get_full_deck()
+    rng = random.Random(7)
+    for _ in range(500):
+        cards = rng.sample(full_deck, 5)
+        codes = [c.to_index() for c in cards]
+        for is_crib in (False, True):
+            assert table.score(codes[:4], codes[4], is_crib=is_crib) == score_hand(cards[:4], is_crib=is_crib, starter_card=cards[4])
+    assert table.score([c.to_index() for c in build_hand("5h|5c|5s|jd")], Card("5d").to_index()) == 29
+
+
+@pytest.mark.slow
+def test_lookup_hand_score_uses_table(table, monkeypatch):
+    monkeypatch.setattr(score_table._SCORE_TABLE, "table", table)
+    assert score_table.lookup_hand_score(build_hand("ah|2h|9h|10h|kh"), is_crib=True) == 5
+    assert score_table.lookup_hand_score(build_hand("ah|2h|9h|10h"), is_crib=True, starter_card=Card("ks")) == 0
+    # hands the table does not cover are scored directly
+    assert score_table.lookup_hand_score(build_hand("5h|10d"), is_crib=True) == 2
+
+
+@pytest.mark.slow
+def test_corrupt_table_is_rejected(table, tmp_path):
+    path = tmp_path / "bad.bin"
+    data = bytearray(open(table.path, "rb").read())
+    data[1000] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ScoreTableError):
+        ScoreTable(str(path), verify=True)
+    path.write_bytes(b"not a table" * 10)
+    with pytest.raises(ScoreTableError):
+        ScoreTable(str(path))
+
+
+def test_truncated_table_falls_back_to_score_hand(tmp_path, monkeypatch):
+    path = tmp_path / "short.bin"
+    score_table.SCORE_TABLE_FILE.write(str(path), (N_COMBINATIONS, 5), [bytes(100)])
+    with pytest.raises(ScoreTableError):
+        ScoreTable(str(path))
+    monkeypatch.setattr(score_table, "SCORE_TABLE_PATH", str(path))
+    monkeypatch.setattr(score_table._SCORE_TABLE, "table", None)
+    monkeypatch.setattr(score_table._SCORE_TABLE, "missing", False)
+    assert score_table.lookup_hand_score(build_hand("5h|5c|5s|jd"), starter_card=Card("5d")) == 29
+    assert score_table.get_score_table() is None
@@ -0,0 +1,41 @@
+import random
+
+from cribbage import cribbagegame
+from cribbage.players.play_first_card_player import PlayFirstCardPlayer
+from cribbage.players.random_player import RandomPlayer
+from cribbage.seeding import game_seed, player_seeds, round_seeds, schedule_seed
+from cribbage.utils import play_multiple_games, summarize_match
+
+
+def test_streams_are_reproducible_and_distinct():
+    assert game_seed(None, 3) is None
+    assert game_seed(7, 3) == game_seed(7, 3)
+    seeds = [game_seed(7, i) for i in range(100)] + [game_seed(8, i) for i in range(100)]
+    assert len(set(seeds)) == len(seeds)
+    seed = game_seed(7, 0)
+    streams = [schedule_seed(seed), *player_seeds(seed, 2), *round_seeds(seed, 0), *round_seeds(seed, 1)]
+    assert len(set(streams)) == len(streams)
+
+
+def test_single_game_replays_from_its_game_seed():
+    p0 = RandomPlayer(name="RandomPlayer", seed=1)
+    p1 = PlayFirstCardPlayer(name="PlayFirstCardPlayer")
+    results = play_multiple_games(5, p0=p0, p1=p1, seed=11)
+    # game 3 has the seats swapped
+    game = cribbagegame.CribbageGame(players=[p1, p0], seed=game_seed(11, 3))
+    s1, s0 = game.start()
+    assert results["diffs"][3] == s0 - s1
+
+
+def test_shards_merge_into_the_serial_run():
+    p0 = RandomPlayer(name="RandomPlayer", seed=1)
+    p1 = RandomPlayer(name="OtherRandomPlayer", seed=2)
+    serial = play_multiple_games(6, p0=p0, p1=p1, seed=5)
+    shards = [play_multiple_games(3, p0=p0, p1=p1, seed=5, first_game=first) for first in (0, 3)]
+    assert summarize_match(shards[0]["diffs"] + shards[1]["diffs"]) == serial
+
+
+def test_player_rng_comes_from_the_game_seed():
+    player = RandomPlayer(name="Player1", seed=3)
+    game = cribbagegame.CribbageGame(players=[player, PlayFirstCardPlayer(name="Player2")], seed=9)
+    assert game.players[0]._rng.random() == random.Random(player_seeds(9, 2)[0]).random()
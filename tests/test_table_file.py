@@ -0,0 +1,56 @@
+import pytest
+
+from cribbage import win_table
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.table_file import HEADER_SIZE, LazyTable, TableFile, TableFileError
+from cribbage.win_table import build_win_table, get_win_table
+
+
+class ExampleTableError(TableFileError):
+    pass
+
+
+EXAMPLE_FILE = TableFile("example table", b"EXAMPLE\0", 2, 2, ExampleTableError)
+
+
+def test_write_and_read_header(tmp_path):
+    path = str(tmp_path / "example.bin")
+    EXAMPLE_FILE.write(path, (7,), [b"abc", b"def"])
+    seven, crc = EXAMPLE_FILE.read_header(path)
+    assert seven == 7
+    EXAMPLE_FILE.check_size(path, 6)
+    with pytest.raises(ExampleTableError):
+        EXAMPLE_FILE.check_size(path, 7)
+    with pytest.raises(ExampleTableError):
+        EXAMPLE_FILE._replace(version=3).read_header(path)
+    with pytest.raises(ExampleTableError):
+        EXAMPLE_FILE._replace(magic=b"OTHER\0\0\0").read_header(path)
+    (tmp_path / "short.bin").write_bytes(bytes(HEADER_SIZE - 1))
+    with pytest.raises(ExampleTableError):
+        EXAMPLE_FILE.read_header(str(tmp_path / "short.bin"))
+
+
+def test_lazy_table_remembers_a_missing_file(tmp_path):
+    opened = []
+
+    def open_table():
+        opened.append(1)
+        return EXAMPLE_FILE.read_header(str(tmp_path / "missing.bin"))
+
+    lazy = LazyTable(open_table, "Example table not available")
+    assert lazy.get() is None
+    assert lazy.get() is None
+    assert len(opened) == 1
+    lazy.reset()
+    assert lazy.get() is None
+    assert len(opened) == 2
+
+
+def test_built_table_replaces_a_missing_one(tmp_path, monkeypatch):
+    path = str(tmp_path / "win.bin")
+    monkeypatch.setattr(win_table, "WIN_TABLE_PATH", path)
+    monkeypatch.setattr(win_table._WIN_TABLE, "table", None)
+    monkeypatch.setattr(win_table._WIN_TABLE, "missing", False)
+    assert get_win_table() is None
+    built = build_win_table(path, num_rounds=20, p0=BeginnerPlayer("p0"), p1=BeginnerPlayer("p1"))
+    assert (get_win_table().start == built.start).all()
@@ -0,0 +1,77 @@
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.players.play_first_card_player import PlayFirstCardPlayer
+from cribbage.players.random_player import RandomPlayer
+from cribbage.utils import (mean_ci, play_duplicate_match, play_multiple_games, play_multiple_games_parallel,
+                            play_sprt_match, sprt_llr, summarize_duplicate_match, summarize_match, wilson_ci)
+
+
+def test_parallel_runner_matches_serial_run():
+    random_player = RandomPlayer(name="RandomPlayer", seed=42)
+    first_card_player = PlayFirstCardPlayer(name="PlayFirstCardPlayer")
+    serial = play_multiple_games(7, p0=random_player, p1=first_card_player, seed=42)
+    parallel = play_multiple_games_parallel(7, p0=random_player, p1=first_card_player, seed=42, max_workers=2,
+                                            chunk_size=2)
+    assert parallel == serial
+    # games get their own seeds rather than replaying one deal
+    assert len(set(serial["diffs"])) > 1
+
+
+def test_summarize_match_counts_ties_out_of_the_winrate():
+    results = summarize_match([5, -3, 0, 12])
+    assert (results["wins"], results["ties"], results["winrate"]) == (2, 1, 2 / 3)
+    assert (results["ci_lo"], results["ci_hi"]) == wilson_ci(2, 3)
+    assert summarize_match([0])["winrate"] == 0.0
+
+
+def test_duplicate_pairs_mirror_the_deals():
+    # identical strategies under different names: the mirrored game is the same game with roles swapped
+    p0 = PlayFirstCardPlayer(name="Player1")
+    p1 = PlayFirstCardPlayer(name="Player2")
+    results = play_duplicate_match(4, p0=p0, p1=p1, seed=3)
+    assert results["pairs"] == 4 and len(results["diffs"]) == 8
+    assert results["pair_diffs"] == [0.0] * 4
+    assert (results["mean_diff"], results["diff_ci_lo"], results["diff_ci_hi"]) == (0.0, 0.0, 0.0)
+    assert results["pair_win_share"] == 0.5
+    assert results["diffs"][0] != 0
+
+
+def test_duplicate_match_is_reproducible_in_parallel():
+    random_player = RandomPlayer(name="RandomPlayer", seed=4)
+    first_card_player = PlayFirstCardPlayer(name="PlayFirstCardPlayer")
+    serial = play_duplicate_match(4, p0=random_player, p1=first_card_player, seed=8)
+    parallel = play_duplicate_match(4, p0=random_player, p1=first_card_player, seed=8, max_workers=2, chunk_size=1)
+    assert parallel == serial
+    assert play_duplicate_match(2, p0=random_player, p1=first_card_player)["seed"] is not None
+
+
+def test_summarize_duplicate_match():
+    results = summarize_duplicate_match([(10, -4), (0, 6), (-3, -5)])
+    assert results["pair_diffs"] == [3.0, 3.0, -4.0]
+    assert results["pair_win_share"] == (0.5 + 0.75 + 0.0) / 3
+    mean, lo, hi = mean_ci([3.0, 3.0, -4.0])
+    assert (results["mean_diff"], results["diff_ci_lo"], results["diff_ci_hi"]) == (mean, lo, hi)
+    assert lo < mean < hi
+    assert results["wins"] == 2 and results["ties"] == 1
+
+
+def test_sprt_llr():
+    assert sprt_llr(10, 10, 0.5, 0.6) < 0 < sprt_llr(14, 6, 0.5, 0.6)
+    assert sprt_llr(0, 0, 0.5, 0.6) == 0
+
+
+def test_sprt_match_stops_early_on_lopsided_matchups():
+    beginner_player = BeginnerPlayer(name="BeginnerPlayer")
+    random_player = RandomPlayer(name="RandomPlayer", seed=1)
+    results = play_sprt_match(beginner_player, random_player, seed=3, batch_size=20)
+    assert (results["decision"], results["games"]) == ("p0_better", 40)
+    # the same games play_multiple_games plays
+    assert results["diffs"] == play_multiple_games(40, p0=beginner_player, p1=random_player, seed=3)["diffs"]
+    assert play_sprt_match(random_player, beginner_player, seed=3, batch_size=20)["decision"] == "p1_better"
+
+
+def test_sprt_match_equal_and_undecided():
+    p0 = PlayFirstCardPlayer(name="Player1")
+    p1 = RandomPlayer(name="RandomPlayer", seed=1)
+    assert play_sprt_match(p0, p1, seed=3, epsilon=0.25, batch_size=10)["decision"] == "equal"
+    results = play_sprt_match(p0, p1, seed=3, epsilon=0.25, batch_size=10, max_games=15)
+    assert (results["decision"], results["games"]) == ("undecided", 15)
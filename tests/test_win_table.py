@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from cribbage import win_table
+from cribbage.discard_table import discard_options
+from cribbage.players.beginner_player import BeginnerPlayer
+from cribbage.playingcards import build_hand
+from cribbage.strategies.hand_strategies import exact_table_discard, win_probability_discard
+from cribbage.win_table import (MAX_HAND, MAX_PEGGING, RoundDistributions, WinTable, WinTableError,
+                                compute_win_probabilities, shift_distribution, simulate_round_distributions)
+
+
+@pytest.fixture(scope="module")
+def table():
+    distributions = simulate_round_distributions(400, BeginnerPlayer("p0"), BeginnerPlayer("p1"), seed=3)
+    return WinTable.from_distributions(distributions)
+
+
+def _fixed_round(dealer_pegging, pone_pegging, pone_hand=0, dealer_hand=0, crib=0):
+    pegging = np.zeros((MAX_PEGGING, MAX_PEGGING))
+    pegging[dealer_pegging, pone_pegging] = 1
+    hands = [np.eye(MAX_HAND)[points] for points in (pone_hand, dealer_hand, crib)]
+    return RoundDistributions(pegging, *hands)
+
+
+def test_fixed_rounds_are_a_race():
+    # the pone pegs 1 every round and nothing else scores, so the seats take turns scoring 1
+    start, after_pegging = compute_win_probabilities(_fixed_round(0, 1))
+    assert start[120, 120] == 0  # the pone pegs out first
+    assert start[120, 119] == 1  # the pone reaches 120, then I peg out as next round's pone
+    assert start[0, 0] == 0  # level scores go to whoever scores first
+    assert start[50, 49] == 1
+    assert after_pegging[50, 50] == 1  # the pone has pegged, I score first from here
+    # the dealer counts 10 in hand and crib, the pone pegs 1: 9 rounds from 110-120 the pone wins
+    start, _ = compute_win_probabilities(_fixed_round(0, 1, dealer_hand=6, crib=4))
+    assert start[111, 119] == 1
+    assert start[111, 120] == 0
+
+
+def test_rounds_that_peg_nothing_are_rejected():
+    with pytest.raises(ValueError):
+        compute_win_probabilities(_fixed_round(0, 0))
+
+
+def test_table_is_consistent(table):
+    assert 0.5 < table.win_probability(0, 0, dealer_is_self=True) < 0.65
+    assert table.win_probability(0, 0, dealer_is_self=True) + table.win_probability(0, 0, dealer_is_self=False) == pytest.approx(1)
+    assert table.win_probability(110, 60, True) > 0.9 > 0.1 > table.win_probability(60, 110, True)
+    assert table.win_probability(121, 119, False) == 1 and table.win_probability(100, 121, True) == 0
+    assert np.all(np.diff(table.start, axis=0) >= -1e-3)  # more of my points never hurts
+    # after pegging the pone counts first
+    assert table.win_probability_after_pegging(118, 118, dealer_is_self=False) > 0.5
+    assert table.win_probability_after_pegging(118, 118, dealer_is_self=True) == pytest.approx(
+        1 - table.win_probability_after_pegging(118, 118, dealer_is_self=False))
+
+
+def test_round_win_probability_matches_table(table):
+    for dealer, pone in [(0, 0), (80, 95), (110, 115), (118, 100)]:
+        assert table.round_win_probability(dealer, pone) == pytest.approx(table.start[dealer, pone], abs=1e-4)
+
+
+def test_save_and_load(table, tmp_path):
+    path = str(tmp_path / "win.bin")
+    table.save(path)
+    loaded = WinTable.load(path)
+    assert np.array_equal(loaded.start, table.start)
+    assert np.array_equal(loaded.after_pegging, table.after_pegging)
+    assert np.array_equal(loaded.distributions.pegging, table.distributions.pegging)
+    assert np.array_equal(loaded.distributions.crib, table.distributions.crib)
+    with open(path, "r+b") as f:
+        f.seek(100)
+        f.write(b"\xff\xff")
+    with pytest.raises(WinTableError):
+        WinTable.load(path)
+
+
+def test_shift_distribution():
+    distribution = np.array([0.25, 0.5, 0.25])
+    for mean in (1, 2.75, 6.5, 0.3):
+        shifted = shift_distribution(distribution, mean)
+        assert shifted.sum() == pytest.approx(1)
+        if mean >= 0.5:
+            assert np.arange(len(shifted)) @ shifted == pytest.approx(mean)
+    # no points below zero, so the mean can only come down to what piles up on zero
+    assert shifted[:3] == pytest.approx([0.6, 0.325, 0.075])
+
+
+def test_discard_plays_for_points_before_the_endgame(table):
+    hand = build_hand(["5h", "5c", "jd", "qs", "2h", "9c"])
+    for dealer_is_self in (True, False):
+        expected = exact_table_discard(hand, dealer_is_self)
+        assert win_probability_discard(hand, dealer_is_self, 40, 60, win_table=table) == expected
+        assert win_probability_discard(hand, dealer_is_self, win_table=table) == expected
+
+
+def test_endgame_discard_maximises_the_chance_to_win(table):
+    # as pone against a dealer 2 points from winning, the crib hardly matters: keep the best hand
+    hand = build_hand(["4s", "8h", "jh", "6s", "kd", "9d"])
+    assert set(exact_table_discard(hand, False)) == set(build_hand(["kd", "8h"]))
+    assert set(win_probability_discard(hand, False, 116, 119, win_table=table)) == set(build_hand(["kd", "jh"]))
+    options = {frozenset(o.discards): o for o in discard_options(hand)}
+    kept = options[frozenset(build_hand(["kd", "jh"]))]
+    assert kept.avg_hand > options[frozenset(build_hand(["kd", "8h"]))].avg_hand